@@ -21,7 +21,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.database import Base
-from app.models import user, social_account, post, automation_rule
+from app.models import user, social_account, post, post_payload, automation_rule, processed_event, comment_sync_cursor, comment, dead_letter_post, scheduled_post, publish_job, deferred_event
 from app.config import get_settings
 
 target_metadata = Base.metadata
@@ -32,6 +32,17 @@ target_metadata = Base.metadata
 # ... etc.
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the full-text search objects created by raw DDL (see app/models/post.py) to their migration."""
+    if type_ == "table" and name.startswith("posts_fts"):
+        return False
+    if type_ == "column" and name == "search_vector":
+        return False
+    if type_ == "index" and name == "ix_posts_search_vector":
+        return False
+    return True
+
+
 def get_url():
     settings = get_settings()
     return settings.database_url
@@ -55,6 +66,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -79,7 +91,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,38 @@
+"""Add processed_events table for event deduplication
+
+Revision ID: 3f1c9d2a7b64
+Revises: a27f455d018a
+Create Date: 2026-10-18 09:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9d2a7b64'
+down_revision: Union[str, Sequence[str], None] = 'a27f455d018a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('processed_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('platform', sa.String(), nullable=False),
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('event_key', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('platform', 'event_type', 'event_key', name='uq_processed_events_key')
+    )
+    op.create_index(op.f('ix_processed_events_id'), 'processed_events', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_processed_events_id'), table_name='processed_events')
+    op.drop_table('processed_events')
@@ -0,0 +1,42 @@
+"""Add comment_sync_cursors table for incremental comment polling
+
+Revision ID: 8b2e4f6a1c93
+Revises: 3f1c9d2a7b64
+Create Date: 2026-10-18 11:40:05.218934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4f6a1c93'
+down_revision: Union[str, Sequence[str], None] = '3f1c9d2a7b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('comment_sync_cursors',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('social_account_id', sa.Integer(), nullable=False),
+    sa.Column('platform_post_id', sa.String(), nullable=False),
+    sa.Column('since', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('after_cursor', sa.String(), nullable=True),
+    sa.Column('last_synced_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['social_account_id'], ['social_accounts.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('social_account_id', 'platform_post_id', name='uq_comment_sync_cursors_post')
+    )
+    op.create_index(op.f('ix_comment_sync_cursors_id'), 'comment_sync_cursors', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_comment_sync_cursors_id'), table_name='comment_sync_cursors')
+    op.drop_table('comment_sync_cursors')
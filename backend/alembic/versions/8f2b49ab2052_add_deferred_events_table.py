@@ -0,0 +1,43 @@
+"""Add deferred_events table
+
+Revision ID: 8f2b49ab2052
+Revises: a9c3e5f7b102
+Create Date: 2026-10-19 00:33:09.451943
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f2b49ab2052'
+down_revision: Union[str, Sequence[str], None] = 'a9c3e5f7b102'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('deferred_events',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('platform', sa.String(), nullable=False),
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('event_key', sa.String(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('due_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('locked_until', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('platform', 'event_type', 'event_key', name='uq_deferred_events_key')
+    )
+    op.create_index(op.f('ix_deferred_events_id'), 'deferred_events', ['id'], unique=False)
+    op.create_index('ix_deferred_events_due_at', 'deferred_events', ['due_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_deferred_events_due_at', table_name='deferred_events')
+    op.drop_index(op.f('ix_deferred_events_id'), table_name='deferred_events')
+    op.drop_table('deferred_events')
@@ -0,0 +1,36 @@
+"""Add (user_id, created_at, id) indexes for keyset pagination
+
+Revision ID: a9d3e5f7b142
+Revises: f2c8d4e6a731
+Create Date: 2026-10-18 18:12:40.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3e5f7b142'
+down_revision: Union[str, Sequence[str], None] = 'f2c8d4e6a731'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_posts_user_created', table_name='posts')
+    op.create_index('ix_posts_user_created', 'posts', ['user_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_scheduled_posts_user_id', table_name='scheduled_posts')
+    op.create_index('ix_scheduled_posts_user_created', 'scheduled_posts', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_automation_rules_user_created', 'automation_rules', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_automation_rules_user_created', table_name='automation_rules')
+    op.drop_index('ix_scheduled_posts_user_created', table_name='scheduled_posts')
+    op.create_index('ix_scheduled_posts_user_id', 'scheduled_posts', ['user_id'], unique=False)
+    op.drop_index('ix_posts_user_created', table_name='posts')
+    op.create_index('ix_posts_user_created', 'posts', ['user_id', 'created_at'], unique=False)
@@ -0,0 +1,61 @@
+"""Make (user_id, platform, platform_user_id) unique on social_accounts
+
+Revision ID: b6e2c8a4d157
+Revises: a9d3e5f7b142
+Create Date: 2026-10-18 19:40:12.504117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2c8a4d157'
+down_revision: Union[str, Sequence[str], None] = 'a9d3e5f7b142'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables whose rows follow a merged account
+CHILD_TABLES = ['posts', 'scheduled_posts', 'automation_rules', 'comments', 'dead_letter_posts']
+
+
+def merge_duplicate_accounts(conn) -> None:
+    """Fold duplicate connections of the same account into the oldest row."""
+    groups = conn.execute(sa.text(
+        "SELECT user_id, platform, platform_user_id, MIN(id) FROM social_accounts "
+        "GROUP BY user_id, platform, platform_user_id HAVING COUNT(*) > 1"
+    )).all()
+
+    for user_id, platform, platform_user_id, keep_id in groups:
+        duplicate_ids = [row[0] for row in conn.execute(sa.text(
+            "SELECT id FROM social_accounts WHERE user_id = :user_id AND platform = :platform "
+            "AND platform_user_id = :platform_user_id AND id != :keep_id"
+        ), {"user_id": user_id, "platform": platform, "platform_user_id": platform_user_id, "keep_id": keep_id})]
+
+        for duplicate_id in duplicate_ids:
+            params = {"keep_id": keep_id, "duplicate_id": duplicate_id}
+            for table in CHILD_TABLES:
+                conn.execute(sa.text(
+                    f"UPDATE {table} SET social_account_id = :keep_id WHERE social_account_id = :duplicate_id"
+                ), params)
+            # Sync checkpoints are unique per account and post; polling rebuilds them
+            conn.execute(sa.text("DELETE FROM comment_sync_cursors WHERE social_account_id = :duplicate_id"), params)
+            conn.execute(sa.text("DELETE FROM social_accounts WHERE id = :duplicate_id"), params)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    merge_duplicate_accounts(op.get_bind())
+    op.drop_index('ix_social_accounts_user_platform', table_name='social_accounts')
+    op.create_index(
+        'uq_social_accounts_user_platform_account', 'social_accounts',
+        ['user_id', 'platform', 'platform_user_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_social_accounts_user_platform_account', table_name='social_accounts')
+    op.create_index('ix_social_accounts_user_platform', 'social_accounts', ['user_id', 'platform', 'platform_user_id'], unique=False)
@@ -0,0 +1,61 @@
+"""Add comments table
+
+Revision ID: c4d7a9e2f815
+Revises: 8b2e4f6a1c93
+Create Date: 2026-10-18 14:02:47.913350
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7a9e2f815'
+down_revision: Union[str, Sequence[str], None] = '8b2e4f6a1c93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('comments',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('social_account_id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=True),
+    sa.Column('platform', sa.String(), nullable=False),
+    sa.Column('platform_comment_id', sa.String(), nullable=False),
+    sa.Column('platform_post_id', sa.String(), nullable=True),
+    sa.Column('parent_comment_id', sa.String(), nullable=True),
+    sa.Column('author_id', sa.String(), nullable=True),
+    sa.Column('author_name', sa.String(), nullable=True),
+    sa.Column('message', sa.Text(), nullable=True),
+    sa.Column('commented_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('reply_status', sa.Enum('PENDING', 'REPLIED', 'SKIPPED', 'FAILED', name='commentreplystatus'), nullable=False),
+    sa.Column('reply_id', sa.String(), nullable=True),
+    sa.Column('reply_content', sa.Text(), nullable=True),
+    sa.Column('replied_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ),
+    sa.ForeignKeyConstraint(['social_account_id'], ['social_accounts.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('platform', 'platform_comment_id', name='uq_comments_platform_comment')
+    )
+    op.create_index(op.f('ix_comments_id'), 'comments', ['id'], unique=False)
+    op.create_index(
+        'ix_comments_account_status_time', 'comments',
+        ['social_account_id', 'reply_status', 'commented_at'],
+        unique=False,
+        postgresql_include=['platform_comment_id', 'platform_post_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_account_status_time', table_name='comments')
+    op.drop_index(op.f('ix_comments_id'), table_name='comments')
+    op.drop_table('comments')
+    sa.Enum(name='commentreplystatus').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,86 @@
+"""Move raw platform responses to a compressed post_payloads table
+
+Revision ID: d8f1a3c5e926
+Revises: b6e2c8a4d157
+Create Date: 2026-10-18 23:52:41.318604
+
+"""
+import json
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8f1a3c5e926'
+down_revision: Union[str, Sequence[str], None] = 'b6e2c8a4d157'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 500
+
+
+def compress(value):
+    """Encode a JSON column value the way ``CompressedJSON`` stores it."""
+    if isinstance(value, str):
+        value = json.loads(value)
+    return zlib.compress(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"), 6)
+
+
+def copy_in_batches(conn, select_sql: str, write) -> None:
+    """Walk rows of ``select_sql`` (id, value) in id order and hand each batch to ``write``."""
+    last_id = 0
+    while True:
+        rows = conn.execute(sa.text(select_sql), {"last_id": last_id, "limit": BATCH_SIZE}).all()
+        if not rows:
+            return
+        write(rows)
+        last_id = rows[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    payloads = op.create_table('post_payloads',
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('platform_response', sa.LargeBinary(), nullable=True),
+    sa.Column('post_metadata', sa.LargeBinary(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('post_id')
+    )
+
+    conn = op.get_bind()
+    copy_in_batches(
+        conn,
+        "SELECT id, platform_response FROM posts WHERE platform_response IS NOT NULL "
+        "AND id > :last_id ORDER BY id LIMIT :limit",
+        lambda rows: conn.execute(
+            payloads.insert(),
+            [{"post_id": post_id, "platform_response": compress(value)} for post_id, value in rows]
+        )
+    )
+
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.drop_column('platform_response')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.add_column(sa.Column('platform_response', sa.JSON(), nullable=True))
+
+    conn = op.get_bind()
+    posts = sa.table('posts', sa.column('id', sa.Integer()), sa.column('platform_response', sa.JSON()))
+    copy_in_batches(
+        conn,
+        "SELECT post_id, platform_response FROM post_payloads WHERE platform_response IS NOT NULL "
+        "AND post_id > :last_id ORDER BY post_id LIMIT :limit",
+        lambda rows: conn.execute(
+            posts.update().where(posts.c.id == sa.bindparam('b_id')).values(platform_response=sa.bindparam('b_response')),
+            [{"b_id": post_id, "b_response": json.loads(zlib.decompress(value))} for post_id, value in rows]
+        )
+    )
+
+    op.drop_table('post_payloads')
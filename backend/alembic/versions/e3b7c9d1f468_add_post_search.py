@@ -0,0 +1,64 @@
+"""Add full-text search over post content
+
+Revision ID: e3b7c9d1f468
+Revises: d8f1a3c5e926
+Create Date: 2026-10-19 00:21:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b7c9d1f468'
+down_revision: Union[str, Sequence[str], None] = 'd8f1a3c5e926'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SQLITE_UPGRADE = [
+    "CREATE VIRTUAL TABLE posts_fts USING fts5(content, user_id, content='posts', content_rowid='id')",
+    "CREATE TRIGGER posts_fts_insert AFTER INSERT ON posts BEGIN "
+    "INSERT INTO posts_fts(rowid, content, user_id) VALUES (new.id, new.content, new.user_id); END",
+    "CREATE TRIGGER posts_fts_delete AFTER DELETE ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, content, user_id) VALUES ('delete', old.id, old.content, old.user_id); END",
+    "CREATE TRIGGER posts_fts_update AFTER UPDATE OF content, user_id ON posts BEGIN "
+    "INSERT INTO posts_fts(posts_fts, rowid, content, user_id) VALUES ('delete', old.id, old.content, old.user_id); "
+    "INSERT INTO posts_fts(rowid, content, user_id) VALUES (new.id, new.content, new.user_id); END",
+    # Index the posts that already exist
+    "INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DOWNGRADE = [
+    "DROP TRIGGER IF EXISTS posts_fts_update",
+    "DROP TRIGGER IF EXISTS posts_fts_delete",
+    "DROP TRIGGER IF EXISTS posts_fts_insert",
+    "DROP TABLE IF EXISTS posts_fts",
+]
+
+POSTGRES_UPGRADE = [
+    # Computed for existing rows as the column is added
+    "ALTER TABLE posts ADD COLUMN search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED",
+    "CREATE INDEX ix_posts_search_vector ON posts USING gin (search_vector)",
+]
+
+POSTGRES_DOWNGRADE = [
+    "DROP INDEX IF EXISTS ix_posts_search_vector",
+    "ALTER TABLE posts DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    statements = POSTGRES_UPGRADE if op.get_bind().dialect.name == "postgresql" else SQLITE_UPGRADE
+    for statement in statements:
+        op.execute(sa.text(statement))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    statements = POSTGRES_DOWNGRADE if op.get_bind().dialect.name == "postgresql" else SQLITE_DOWNGRADE
+    for statement in statements:
+        op.execute(sa.text(statement))
@@ -0,0 +1,59 @@
+"""Add publish retry columns and dead_letter_posts table
+
+Revision ID: e5a1b7c3d209
+Revises: c4d7a9e2f815
+Create Date: 2026-10-18 15:36:12.284417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1b7c3d209'
+down_revision: Union[str, Sequence[str], None] = 'c4d7a9e2f815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('retry_count', sa.Integer(), nullable=True))
+    op.add_column('posts', sa.Column('next_retry_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index('ix_posts_next_retry_at', 'posts', ['next_retry_at'], unique=False)
+
+    op.create_table('dead_letter_posts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('post_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('social_account_id', sa.Integer(), nullable=False),
+    sa.Column('platform', sa.String(), nullable=False),
+    sa.Column('reason', sa.String(), nullable=False),
+    sa.Column('error_code', sa.String(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.Column('replayed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ),
+    sa.ForeignKeyConstraint(['social_account_id'], ['social_accounts.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_dead_letter_posts_id'), 'dead_letter_posts', ['id'], unique=False)
+    op.create_index(op.f('ix_dead_letter_posts_post_id'), 'dead_letter_posts', ['post_id'], unique=False)
+    op.create_index('ix_dead_letter_posts_user_replayed', 'dead_letter_posts', ['user_id', 'replayed_at', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_dead_letter_posts_user_replayed', table_name='dead_letter_posts')
+    op.drop_index(op.f('ix_dead_letter_posts_post_id'), table_name='dead_letter_posts')
+    op.drop_index(op.f('ix_dead_letter_posts_id'), table_name='dead_letter_posts')
+    op.drop_table('dead_letter_posts')
+
+    op.drop_index('ix_posts_next_retry_at', table_name='posts')
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.drop_column('next_retry_at')
+        batch_op.drop_column('retry_count')
@@ -0,0 +1,64 @@
+"""Add composite and partial indexes for common query patterns
+
+Revision ID: f2c8d4e6a731
+Revises: e5a1b7c3d209
+Create Date: 2026-10-18 16:48:05.671920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8d4e6a731'
+down_revision: Union[str, Sequence[str], None] = 'e5a1b7c3d209'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # scheduled_posts was only ever created by create_tables(); add it for
+    # databases that are managed purely through migrations.
+    if not sa.inspect(op.get_bind()).has_table('scheduled_posts'):
+        op.create_table('scheduled_posts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('social_account_id', sa.Integer(), nullable=False),
+        sa.Column('prompt', sa.Text(), nullable=False),
+        sa.Column('post_time', sa.String(length=5), nullable=False),
+        sa.Column('frequency', sa.Enum('DAILY', 'WEEKLY', 'MONTHLY', name='frequencytype'), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('last_executed', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('next_execution', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['social_account_id'], ['social_accounts.id'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_scheduled_posts_id'), 'scheduled_posts', ['id'], unique=False)
+
+    op.create_index('ix_social_accounts_user_platform', 'social_accounts', ['user_id', 'platform', 'platform_user_id'], unique=False)
+    op.create_index('ix_social_accounts_platform_user', 'social_accounts', ['platform', 'platform_user_id'], unique=False)
+    op.create_index('ix_posts_user_status_created', 'posts', ['user_id', 'status', 'created_at'], unique=False)
+    op.create_index('ix_posts_user_created', 'posts', ['user_id', 'created_at'], unique=False)
+    op.create_index(
+        'ix_scheduled_posts_due', 'scheduled_posts', ['next_execution'],
+        unique=False,
+        sqlite_where=sa.text('is_active = 1'),
+        postgresql_where=sa.text('is_active = true')
+    )
+    op.create_index('ix_scheduled_posts_user_id', 'scheduled_posts', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scheduled_posts_user_id', table_name='scheduled_posts')
+    op.drop_index('ix_scheduled_posts_due', table_name='scheduled_posts')
+    op.drop_index('ix_posts_user_created', table_name='posts')
+    op.drop_index('ix_posts_user_status_created', table_name='posts')
+    op.drop_index('ix_social_accounts_platform_user', table_name='social_accounts')
+    op.drop_index('ix_social_accounts_user_platform', table_name='social_accounts')
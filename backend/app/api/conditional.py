@@ -0,0 +1,85 @@
+import hashlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, List, Optional, Sequence
+from fastapi import Request, Response, status
+from sqlalchemy import func
+
+# Listings are revalidated on every use and never stored by shared caches
+CACHE_CONTROL = "private, no-cache"
+
+# SQLite's CURRENT_TIMESTAMP has one-second resolution: a change later in the
+# same second as the newest row would leave the version unchanged, so very
+# fresh listings get no validators at all.
+_RACY_WINDOW = timedelta(seconds=1)
+
+
+def listing_version(model, *timestamps) -> List:
+    """
+    Columns summarising a filtered listing: the newest of each timestamp and the row count.
+
+    Selected with the listing's own filters (``query.with_only_columns(...)``
+    or ``Query.with_entities(...)``), this one aggregate row changes whenever
+    a row of the listing is added, updated or deleted, so it can stand in
+    for the rows themselves. ``timestamps`` default to ``model.updated_at``.
+    """
+    timestamps = timestamps or (model.updated_at,)
+    return [func.max(column) for column in timestamps] + [func.count(model.id)]
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back its UTC timestamps without a timezone
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
+
+
+def _not_modified_since(if_modified_since: Optional[str], last_modified: datetime) -> bool:
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return last_modified.replace(microsecond=0) <= _as_utc(since)
+
+
+def not_modified(request: Request, response: Response, version: Sequence[Any], *scope: Any) -> Optional[Response]:
+    """
+    Set ``ETag`` and ``Last-Modified`` for a listing and answer conditional GETs.
+
+    ``version`` is the row selected with ``listing_version``; ``scope`` is
+    anything else the body depends on (typically the user's id). The ETag
+    also covers the query string, so every filter and page has its own.
+
+    Returns a 304 response when the client's copy is still current, before
+    anything is loaded or serialized; otherwise None, with the validators
+    set on ``response``. ``If-None-Match`` wins over ``If-Modified-Since``,
+    which (with one-second precision and no row count) only catches updates.
+    """
+    *timestamps, _ = version
+    timestamps = [_as_utc(value) for value in timestamps if value is not None]
+    last_modified = max(timestamps, default=None)
+    if last_modified is not None and datetime.now(timezone.utc) - last_modified < _RACY_WINDOW:
+        return None
+
+    digest = hashlib.sha1(repr((request.url.query, scope, tuple(version))).encode("utf-8")).hexdigest()
+    response.headers["ETag"] = f'W/"{digest[:20]}"'
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, response.headers["ETag"])
+    else:
+        fresh = last_modified is not None and _not_modified_since(request.headers.get("if-modified-since"), last_modified)
+
+    if fresh:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=dict(response.headers))
+    return None
+
@@ -0,0 +1,109 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from fastapi import HTTPException, Response, status
+from sqlalchemy import DateTime, bindparam, tuple_
+from sqlalchemy.dialects import sqlite
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Largest page a client may ask for (``limit``)
+MAX_PAGE_SIZE = 200
+
+# SQLite keeps server-default timestamps as "YYYY-MM-DD HH:MM:SS" text, while
+# SQLAlchemy binds datetimes with microseconds; the shorter string sorts first,
+# so a cursor bound the default way would not compare equal to its own row.
+_SECONDS_TIMESTAMP = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite"
+)
+
+
+def _encode(values: List[Any]) -> str:
+    payload = json.dumps(values)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode(cursor: str, parse):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return parse(*json.loads(base64.urlsafe_b64decode(padded.encode("ascii"))))
+    except (binascii.Error, UnicodeError, TypeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Build the opaque cursor pointing just past a row."""
+    return _encode([created_at.isoformat(), row_id])
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Parse a cursor from ``encode_cursor``; raises 400 for anything else."""
+    return _decode(cursor, lambda created_at, row_id: (datetime.fromisoformat(created_at), int(row_id)))
+
+
+def encode_rank_cursor(rank: float, row_id: int) -> str:
+    """Build the opaque cursor pointing just past a row of ranked results."""
+    return _encode([rank, row_id])
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    """Parse a cursor from ``encode_rank_cursor``; raises 400 for anything else."""
+    return _decode(cursor, lambda rank, row_id: (float(rank), int(row_id)))
+
+
+def paginate(query, model, cursor: Optional[str], limit: int):
+    """
+    Apply keyset pagination on ``(created_at, id)``, newest first.
+
+    Works with ``select()`` statements and legacy ``Query`` objects alike.
+    Instead of an OFFSET the page starts with a range condition that the
+    ``(user_id, created_at, id)`` indexes can seek to, so every page costs
+    the same however deep it is. One extra row is fetched so ``set_next_cursor``
+    can tell whether there is another page.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        if created_at.microsecond == 0:
+            # Distinct name: the variant type isn't part of the statement cache key
+            bound = bindparam("cursor_created_at_seconds", created_at, type_=_SECONDS_TIMESTAMP)
+        else:
+            bound = bindparam("cursor_created_at", created_at, type_=model.created_at.type)
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(bound, row_id))
+
+    return query.order_by(model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+def paginate_by_rank(query, rank, model, cursor: Optional[str], limit: int):
+    """
+    Apply keyset pagination on ``(rank, id)``, lowest rank (best match) first.
+
+    ``rank`` is the relevance expression the query selects as ``rank``; it is
+    deterministic for a row and search, so the cursor can resume right after
+    the last row shown. Fetches one extra row like ``paginate``.
+    """
+    if cursor:
+        after_rank, row_id = decode_rank_cursor(cursor)
+        query = query.where(tuple_(rank, model.id) > tuple_(after_rank, row_id))
+    return query.order_by(rank, model.id).limit(limit + 1)
+
+
+def set_next_cursor(
+    response: Response,
+    rows: List[Any],
+    limit: int,
+    make_cursor=lambda row: encode_cursor(row.created_at, row.id)
+) -> List[Any]:
+    """Trim the look-ahead row and advertise the next page's cursor, if any."""
+    if len(rows) <= limit:
+        return rows
+
+    rows = rows[:limit]
+    response.headers[NEXT_CURSOR_HEADER] = make_cursor(rows[-1])
+    return rows
@@ -0,0 +1,44 @@
+from typing import List, Optional, Sequence, Type
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+
+def response_columns(model, schema: Type[BaseModel]) -> List:
+    """
+    The model's columns that the response schema reads, in schema order.
+
+    Listing endpoints select these instead of whole ORM objects, so JSON
+    blobs the response never shows (raw platform responses, automation
+    configs) are not loaded, decoded or kept in the identity map.
+    """
+    table_columns = model.__table__.columns
+    return [getattr(model, name) for name in schema.model_fields if name in table_columns]
+
+
+def parse_fields(
+    fields: Optional[str],
+    model,
+    schema: Type[BaseModel],
+    always: Sequence[str] = ("id", "created_at")
+) -> Optional[List]:
+    """
+    Columns for a ``fields=a,b,c`` projection, or None when not requested.
+
+    Only fields of the response schema may be asked for; ``always`` columns
+    (by default the keyset cursor's) are added so paging keeps working.
+    Raises 400 for unknown field names.
+    """
+    if not fields:
+        return None
+
+    allowed = {column.key for column in response_columns(model, schema)}
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in allowed]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+
+    names = list(always) + [name for name in requested if name not in always]
+    return [getattr(model, name) for name in names]
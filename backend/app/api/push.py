@@ -0,0 +1,102 @@
+import asyncio
+import json
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, WebSocket, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import select
+from app.api.auth import active_user, credentials_exception, get_token_email
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models.user import User
+from app.services.push_hub import push_hub
+from app.services.user_cache import UserSnapshot, user_cache
+
+router = APIRouter(prefix="/push", tags=["push"])
+optional_bearer = HTTPBearer(auto_error=False)
+settings = get_settings()
+
+
+async def user_for_token(token: Optional[str]) -> UserSnapshot:
+    """
+    Resolve an access token to its user without holding a session for the connection.
+
+    Browsers can't set headers on EventSource/WebSocket requests, so these
+    endpoints also take the token as a ``token`` query parameter.
+    """
+    if not token:
+        raise credentials_exception()
+    email = get_token_email(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token))
+
+    user = user_cache.get(email)
+    if user is None:
+        async with AsyncSessionLocal() as db:
+            user = await db.scalar(select(User).where(User.email == email))
+    return active_user(user)
+
+
+def _sse(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+@router.get("/events")
+async def stream_events(
+    token: Optional[str] = None,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer)
+):
+    """
+    Server-sent events for the current user: post status changes
+    (``post.status``), scheduler runs (``scheduled_post.executed``) and
+    accounts losing their connection (``account.disconnected``).
+    """
+    user = await user_for_token(credentials.credentials if credentials else token)
+
+    async def stream():
+        with push_hub.subscription(user.id) as events:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(events.get(), timeout=settings.push_keepalive_interval)
+                except asyncio.TimeoutError:
+                    # Keeps proxies from closing an idle stream
+                    yield ": keepalive\n\n"
+                    continue
+                if event is None:
+                    return
+                yield _sse(event)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws")
+async def websocket_events(websocket: WebSocket, token: Optional[str] = None):
+    """The same events as ``/push/events``, one JSON message each, over a WebSocket."""
+    scheme, _, credentials = websocket.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and credentials:
+        token = credentials
+    try:
+        user = await user_for_token(token)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    with push_hub.subscription(user.id) as events:
+
+        async def forward():
+            while (event := await events.get()) is not None:
+                await websocket.send_text(json.dumps(event))
+            await websocket.close()
+
+        sender = asyncio.create_task(forward())
+        try:
+            # Nothing is expected from the client; this only waits for it to leave
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            sender.cancel()
+            await asyncio.gather(sender, return_exceptions=True)
@@ -0,0 +1,47 @@
+import logging
+from decimal import Decimal
+from typing import Any, Optional
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the stdlib encoder still works
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Encode what orjson doesn't handle natively (it does datetimes, enums and UUIDs)."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    class FastJSONResponse(JSONResponse):
+        """JSON response rendered with orjson: several times faster than ``json.dumps``."""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+else:
+    logger.warning("orjson not installed (pip install orjson); using the standard JSON encoder")
+    FastJSONResponse = JSONResponse
+
+
+def model_response(adapter: TypeAdapter, value: Any, response: Optional[Response] = None) -> Response:
+    """
+    Validate ``value`` (ORM objects or rows) and serialize it straight to JSON bytes.
+
+    The default path turns the validated models into plain dicts and encodes
+    those again; pydantic-core writes the bytes directly instead. Headers set
+    on the endpoint's injected ``response`` are carried over.
+    """
+    body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    return Response(content=body, media_type="application/json", headers=dict(response.headers) if response else None)
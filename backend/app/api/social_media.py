@@ -1,54 +1,115 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.database import get_db
-from app.api.auth import get_current_user
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status, UploadFile, File
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from typing import Any, Dict, List, Optional, Tuple
+from app.database import AsyncSessionLocal, SessionLocal, get_db, get_async_db, upsert
+from app.api.auth import get_current_user, get_current_user_async
+from app.api.conditional import listing_version, not_modified
+from app.api.pagination import MAX_PAGE_SIZE, encode_rank_cursor, paginate, paginate_by_rank, set_next_cursor
+from app.api.projection import parse_fields, response_columns
+from app.api.responses import FastJSONResponse, model_response
 from app.models.user import User
 from app.models.social_account import SocialAccount
 from app.models.post import Post, PostStatus, PostType
 from app.models.automation_rule import AutomationRule, RuleType, TriggerType
 from app.models.scheduled_post import ScheduledPost, FrequencyType
+from app.models.comment import Comment, CommentReplyStatus
+from app.models.dead_letter_post import DeadLetterPost
+from app.models.publish_job import PublishJob
 from app.schemas.social_media import (
     SocialAccountResponse, PostCreate, PostResponse, PostUpdate,
-    AutomationRuleCreate, AutomationRuleResponse, AutomationRuleUpdate,
+    AutomationRuleCreate, AutomationRuleResponse, AutomationRuleUpdate, CommentResponse,
+    DeadLetterPostResponse, DeadLetterReplayRequest, PublishJobResponse,
     FacebookConnectRequest, FacebookPostRequest, AutoReplyToggleRequest,
     InstagramConnectRequest, InstagramPostRequest, InstagramAccountInfo,
     SuccessResponse, ErrorResponse
 )
 from datetime import datetime
+import asyncio
 import logging
 from app.services.instagram_service import instagram_service
+from app.services.action_limiter import action_limiter
+from app.services.payload_store import payload_store
+from app.services.post_search import search_posts_query
+from app.services.publish_job_queue import publish_job_queue
+from app.services.publish_retry_service import publish_retry_service
+from app.services.replica_router import get_read_db, get_async_read_db
 
 router = APIRouter(prefix="/social", tags=["social media"])
 
 logger = logging.getLogger(__name__)
 
+# Post columns read by post listings (PostResponse never shows the JSON blobs)
+POST_LIST_COLUMNS = response_columns(Post, PostResponse)
+POST_LIST_ADAPTER = TypeAdapter(List[PostResponse])
+
 
 # Social Account Management
 @router.get("/accounts", response_model=List[SocialAccountResponse])
 async def get_social_accounts(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Get all connected social media accounts for the current user."""
+    query = select(SocialAccount).where(SocialAccount.user_id == current_user.id)
+    version = (await db.execute(query.with_only_columns(*listing_version(SocialAccount)))).one()
+    cached = not_modified(request, response, version, current_user.id)
+    if cached:
+        return cached
+    
+    accounts = await db.scalars(query)
+    return accounts.all()
+
+
+@router.get("/accounts/action-budgets")
+async def get_action_budgets(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all connected social media accounts for the current user."""
-    accounts = db.query(SocialAccount).filter(
+    """Get the remaining automated-action budget of every connected account."""
+    account_ids = [row.id for row in db.query(SocialAccount.id).filter(
         SocialAccount.user_id == current_user.id
-    ).all()
-    return accounts
+    ).all()]
+    return [action_limiter.get_budget(account_id) for account_id in account_ids]
 
 
-@router.get("/accounts/{account_id}", response_model=SocialAccountResponse)
-async def get_social_account(
+@router.get("/accounts/{account_id}/action-budget")
+async def get_action_budget(
     account_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get a specific social media account."""
-    account = db.query(SocialAccount).filter(
+    """Get the remaining automated-action budget of an account."""
+    account = db.query(SocialAccount.id).filter(
         SocialAccount.id == account_id,
         SocialAccount.user_id == current_user.id
     ).first()
     
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Social account not found"
+        )
+    
+    return action_limiter.get_budget(account_id)
+
+
+@router.get("/accounts/{account_id}", response_model=SocialAccountResponse)
+async def get_social_account(
+    account_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific social media account."""
+    account = await db.scalar(select(SocialAccount).where(
+        SocialAccount.id == account_id,
+        SocialAccount.user_id == current_user.id
+    ))
+    
     if not account:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -62,7 +123,7 @@ async def get_social_account(
 @router.get("/facebook/status")
 async def get_facebook_status(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Check if user has existing Facebook connections."""
     facebook_accounts = db.query(SocialAccount).filter(
@@ -155,6 +216,38 @@ async def logout_facebook(
         )
 
 
+# Conflict target of the social account upsert (unique per user)
+SOCIAL_ACCOUNT_KEY = ["user_id", "platform", "platform_user_id"]
+
+
+def _existing_social_accounts(db: Session, user_id: int, platform: str, platform_user_ids: List[str]) -> Dict[str, SocialAccount]:
+    """Load the user's accounts on a platform by platform ID, in one query."""
+    return {account.platform_user_id: account for account in db.query(SocialAccount).filter(
+        SocialAccount.user_id == user_id,
+        SocialAccount.platform == platform,
+        SocialAccount.platform_user_id.in_(platform_user_ids)
+    )}
+
+
+def _upsert_social_accounts(db: Session, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    Insert or update social accounts with one INSERT ... ON CONFLICT statement.
+
+    Every row must carry the same columns; all of them except the key are
+    overwritten on conflict. The caller commits.
+
+    Returns:
+        Platform user ID -> social account ID
+    """
+    if not rows:
+        return {}
+    update_columns = [column for column in rows[0] if column not in SOCIAL_ACCOUNT_KEY]
+    stmt = upsert(SocialAccount.__table__, SOCIAL_ACCOUNT_KEY, update_columns).returning(
+        SocialAccount.__table__.c.id, SocialAccount.__table__.c.platform_user_id
+    )
+    return {row.platform_user_id: row.id for row in db.execute(stmt, rows)}
+
+
 @router.post("/facebook/connect")
 async def connect_facebook(
     request: FacebookConnectRequest,
@@ -192,118 +285,82 @@ async def connect_facebook(
                 detail=f"Long-lived token validation failed: {validation_result.get('error')}"
             )
         
-        # Check if account already exists
-        existing_account = db.query(SocialAccount).filter(
-            SocialAccount.user_id == current_user.id,
-            SocialAccount.platform == "facebook",
-            SocialAccount.platform_user_id == request.user_id
-        ).first()
-        
-        if existing_account:
-            # Update existing account with long-lived token
-            existing_account.access_token = long_lived_token
-            existing_account.token_expires_at = expires_at
-            existing_account.is_connected = True
-            existing_account.last_sync_at = datetime.utcnow()
-            existing_account.display_name = validation_result.get("name")
-            existing_account.profile_picture_url = validation_result.get("picture")
-            db.commit()
-            account = existing_account
-        else:
-            # Create new account with long-lived token
-            account = SocialAccount(
-                user_id=current_user.id,
-                platform="facebook",
-                platform_user_id=request.user_id,
-                access_token=long_lived_token,
-                token_expires_at=expires_at,
-                account_type="personal",
-                display_name=validation_result.get("name"),
-                profile_picture_url=validation_result.get("picture"),
-                is_connected=True,
-                last_sync_at=datetime.utcnow()
-            )
-            db.add(account)
-            db.commit()
-            db.refresh(account)
-        
-        # Handle pages if provided - get long-lived page tokens
-        connected_pages = []
+        # Get long-lived page tokens before touching the database
+        pages = []
+        page_token_map = {}
         if request.pages:
             logger.info(f"Processing {len(request.pages)} Facebook pages with long-lived tokens")
-            
-            # Get long-lived page tokens
             long_lived_pages = await facebook_service.get_long_lived_page_tokens(long_lived_token)
-            
-            # Create a mapping of page IDs to long-lived tokens
             page_token_map = {page["id"]: page["access_token"] for page in long_lived_pages}
+            # Ensure we have dicts so we can use .get safely
+            pages = [page.dict() if hasattr(page, "dict") else page for page in request.pages]
+        
+        # One query for every account already connected, then one upsert
+        existing = _existing_social_accounts(
+            db, current_user.id, "facebook", [request.user_id] + [page.get("id") for page in pages]
+        )
+        now = datetime.utcnow()
+        
+        # Personal account with the long-lived user token
+        personal = existing.get(request.user_id)
+        rows = {request.user_id: {
+            "user_id": current_user.id,
+            "platform": "facebook",
+            "platform_user_id": request.user_id,
+            "username": personal.username if personal else None,
+            "display_name": validation_result.get("name"),
+            "access_token": long_lived_token,
+            "token_expires_at": expires_at,
+            "profile_picture_url": validation_result.get("picture"),
+            "follower_count": personal.follower_count if personal else 0,
+            "account_type": personal.account_type if personal else "personal",
+            "platform_data": personal.platform_data if personal else None,
+            "is_connected": True,
+            "last_sync_at": now,
+            "updated_at": now
+        }}
+        
+        connected_pages = {}
+        for page_data in pages:
+            page_id = page_data.get("id")
+            page_access_token = page_token_map.get(page_id, page_data.get("access_token", ""))
             
-            for page_data in request.pages:
-                # Ensure we have a dict so we can use .get safely
-                if hasattr(page_data, "dict"):
-                    page_data = page_data.dict()
-
-                page_id = page_data.get("id")
-                page_access_token = page_token_map.get(page_id, page_data.get("access_token", ""))
-                
-                if not page_access_token:
-                    logger.warning(f"No access token found for page {page_id}")
-                    continue
-                
-                # Check if page account already exists
-                existing_page = db.query(SocialAccount).filter(
-                    SocialAccount.user_id == current_user.id,
-                    SocialAccount.platform == "facebook",
-                    SocialAccount.platform_user_id == page_id
-                ).first()
-                
-                if existing_page:
-                    # Update existing page account
-                    existing_page.access_token = page_access_token
-                    existing_page.token_expires_at = None  # Page tokens don't expire
-                    existing_page.display_name = page_data.get("name", existing_page.display_name)
-                    existing_page.profile_picture_url = page_data.get("picture", {}).get("data", {}).get("url", existing_page.profile_picture_url)
-                    existing_page.follower_count = page_data.get("fan_count", existing_page.follower_count)
-                    existing_page.is_connected = True
-                    existing_page.last_sync_at = datetime.utcnow()
-                    existing_page.platform_data = {
-                        "category": page_data.get("category"),
-                        "tasks": page_data.get("tasks", []),
-                        "can_post": "CREATE_CONTENT" in page_data.get("tasks", []),
-                        "can_comment": "MODERATE" in page_data.get("tasks", [])
-                    }
-                    page_account = existing_page
-                else:
-                    # Create new page account
-                    page_account = SocialAccount(
-                        user_id=current_user.id,
-                        platform="facebook",
-                        platform_user_id=page_id,
-                        username=page_data.get("name", "").replace(" ", "").lower(),
-                        display_name=page_data.get("name"),
-                        access_token=page_access_token,
-                        token_expires_at=None,  # Page tokens don't expire
-                        profile_picture_url=page_data.get("picture", {}).get("data", {}).get("url"),
-                        follower_count=page_data.get("fan_count", 0),
-                        account_type="page",
-                        platform_data={
-                            "category": page_data.get("category"),
-                            "tasks": page_data.get("tasks", []),
-                            "can_post": "CREATE_CONTENT" in page_data.get("tasks", []),
-                            "can_comment": "MODERATE" in page_data.get("tasks", [])
-                        },
-                        is_connected=True,
-                        last_sync_at=datetime.utcnow()
-                    )
-                    db.add(page_account)
-                
-                connected_pages.append({
-                    "id": page_id,
-                    "name": page_data.get("name"),
+            if not page_access_token:
+                logger.warning(f"No access token found for page {page_id}")
+                continue
+            
+            existing_page = existing.get(page_id)
+            picture_url = page_data.get("picture", {}).get("data", {}).get("url")
+            rows[page_id] = {
+                "user_id": current_user.id,
+                "platform": "facebook",
+                "platform_user_id": page_id,
+                "username": existing_page.username if existing_page else page_data.get("name", "").replace(" ", "").lower(),
+                "display_name": page_data.get("name", existing_page.display_name if existing_page else None),
+                "access_token": page_access_token,
+                "token_expires_at": None,  # Page tokens don't expire
+                "profile_picture_url": picture_url or (existing_page.profile_picture_url if existing_page else None),
+                "follower_count": page_data.get("fan_count", existing_page.follower_count if existing_page else 0),
+                "account_type": existing_page.account_type if existing_page else "page",
+                "platform_data": {
                     "category": page_data.get("category"),
-                    "access_token_type": "long_lived_page_token"
-                })
+                    "tasks": page_data.get("tasks", []),
+                    "can_post": "CREATE_CONTENT" in page_data.get("tasks", []),
+                    "can_comment": "MODERATE" in page_data.get("tasks", [])
+                },
+                "is_connected": True,
+                "last_sync_at": now,
+                "updated_at": now
+            }
+            
+            connected_pages[page_id] = {
+                "id": page_id,
+                "name": page_data.get("name"),
+                "category": page_data.get("category"),
+                "access_token_type": "long_lived_page_token"
+            }
         
+        account_ids = _upsert_social_accounts(db, list(rows.values()))
         db.commit()
         
         logger.info(f"Successfully connected Facebook account {request.user_id} with {len(connected_pages)} pages")
@@ -312,10 +369,10 @@ async def connect_facebook(
             "success": True,
             "message": f"Facebook account connected successfully with long-lived tokens",
             "data": {
-                "account_id": account.id,
+                "account_id": account_ids[request.user_id],
                 "user_id": request.user_id,
                 "pages_connected": len(connected_pages),
-                "pages": connected_pages,
+                "pages": list(connected_pages.values()),
                 "token_type": "long_lived_user_token",
                 "token_expires_at": expires_at.isoformat() if expires_at else None
             }
@@ -334,33 +391,67 @@ async def connect_facebook(
 @router.post("/facebook/post")
 async def create_facebook_post(
     request: FacebookPostRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    http_request: Request,
+    prefer: Optional[str] = Header(None),
+    idempotency_key: Optional[str] = Header(None),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Create and schedule a Facebook post with AI integration (replaces Make.com webhook)."""
+    """
+    Create and schedule a Facebook post with AI integration (replaces Make.com webhook).
+
+    With ``Prefer: respond-async`` the request is only validated and queued:
+    it returns 202 with a publish job to follow at ``/jobs/{job_id}`` (or
+    through ``publish_job.status`` push events). An ``Idempotency-Key``
+    header makes retries of the same request return the same job.
+    """
+    if respond_async(prefer):
+        await facebook_page_account(db, current_user.id, request.page_id)
+        job = await db.run_sync(lambda session: publish_job_queue.create(
+            session, current_user.id, "facebook", request.model_dump(), idempotency_key
+        ))
+        return accepted_job(http_request, job)
+    
+    return await publish_facebook_post(db, current_user.id, request)
+
+
+async def facebook_page_account(db: AsyncSession, user_id: int, page_id: str) -> SocialAccount:
+    """The user's connected Facebook page; 404 if unknown, 400 without an access token."""
+    account = await db.scalar(select(SocialAccount).where(
+        SocialAccount.user_id == user_id,
+        SocialAccount.platform == "facebook",
+        SocialAccount.platform_user_id == page_id
+    ))
+    
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Facebook page not found"
+        )
+
+    if not account.access_token:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Facebook access token not found. Please reconnect your account."
+        )
+    return account
+
+
+async def publish_facebook_post(db: AsyncSession, user_id: int, request: FacebookPostRequest) -> SuccessResponse:
+    """
+    Validate the token, generate content if asked to and publish; run by requests and publish jobs.
+
+    An HTTPException raised once the post row exists carries its id as
+    ``post_id``, so a failed publish job still points at the post.
+    """
+    post_id: Optional[int] = None
     try:
         # Import Facebook service
         from app.services.facebook_service import facebook_service
         from app.services.groq_service import groq_service
         
         # Find the Facebook account/page
-        account = db.query(SocialAccount).filter(
-            SocialAccount.user_id == current_user.id,
-            SocialAccount.platform == "facebook",
-            SocialAccount.platform_user_id == request.page_id
-        ).first()
-        
-        if not account:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Facebook page not found"
-            )
-
-        if not account.access_token:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Facebook access token not found. Please reconnect your account."
-            )
+        account = await facebook_page_account(db, user_id, request.page_id)
         
         # Validate and potentially refresh the access token
         logger.info(f"Validating Facebook token for account {account.id}")
@@ -373,7 +464,7 @@ async def create_facebook_post(
             if validation_result.get("expired") or validation_result.get("needs_reconnection"):
                 # Mark account as disconnected
                 account.is_connected = False
-                db.commit()
+                await db.commit()
                 
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -385,10 +476,6 @@ async def create_facebook_post(
                     detail=f"Facebook token validation failed: {validation_result.get('error', 'Unknown error')}"
                 )
         
-        # Update last sync time since token is valid
-        account.last_sync_at = datetime.utcnow()
-        db.commit()
-        
         final_content = request.message
         ai_generated = False
         
@@ -404,27 +491,34 @@ async def create_facebook_post(
                 # Fall back to original message if AI fails
                 print(f"AI generation failed, using original message: {ai_error}")
         
-        # Create post record in database
+        # Unit of work 1: the pending post (outbox record) and the token's last
+        # sync time. The publish lease in next_retry_at lets the retry service
+        # dead-letter the post as interrupted (never republish it) if this
+        # process dies before the result is recorded.
+        account.last_sync_at = datetime.utcnow()
         post = Post(
-            user_id=current_user.id,
+            user_id=user_id,
             social_account_id=account.id,
             content=final_content,
             post_type=PostType.IMAGE if request.image else PostType.TEXT,
             media_urls=[request.image] if request.image else None,
             status=PostStatus.SCHEDULED,
             is_auto_post=ai_generated,
-            metadata={
-                "ai_generated": ai_generated,
-                "original_prompt": request.message if ai_generated else None,
-                "post_type": request.post_type
-            }
+            next_retry_at=publish_retry_service.lease_expiry()
         )
         
         db.add(post)
-        db.commit()
-        db.refresh(post)
+        await db.commit()
+        post_id = post.id
+        payload_store.record(post.id, metadata={
+            "ai_generated": ai_generated,
+            "original_prompt": request.message if ai_generated else None,
+            "post_type": request.post_type
+        })
         
         # Actually post to Facebook
+        publish_error = None
+        session_expired = False
         try:
             # Determine media type
             media_type = "text"
@@ -439,50 +533,41 @@ async def create_facebook_post(
                 media_url=request.image,
                 media_type=media_type
             )
-            
-            # Update post status based on Facebook result
-            if facebook_result and facebook_result.get("success"):
-                post.status = PostStatus.PUBLISHED
-                post.platform_post_id = facebook_result.get("post_id")
-                post.platform_response = facebook_result
-            else:
-                error_msg = facebook_result.get("error", "Unknown Facebook API error")
-                post.status = PostStatus.FAILED
-                post.error_message = error_msg
-                
-                # Check if the error is due to token expiration
-                if "expired" in error_msg.lower() or "session" in error_msg.lower() or "token" in error_msg.lower():
-                    account.is_connected = False
-                    db.commit()
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Facebook login session expired. Please reconnect your account."
-                    )
-            
-            db.commit()
-            
-        except HTTPException:
-            raise
         except Exception as fb_error:
             logger.error(f"Facebook posting error: {fb_error}")
-            post.status = PostStatus.FAILED
-            post.error_message = str(fb_error)
-            db.commit()
+            publish_error = fb_error
+            facebook_result = {"success": False, "error": str(fb_error)}
+        
+        # Unit of work 2: the publish result, whatever it is
+        if facebook_result and facebook_result.get("success"):
+            post.status = PostStatus.PUBLISHED
+            post.platform_post_id = facebook_result.get("post_id")
+            post.next_retry_at = None
+            payload_store.record(post.id, platform_response=facebook_result)
+        else:
+            error_msg = facebook_result.get("error") or "Unknown Facebook API error"
+            # Marks the post failed and schedules a retry or dead-letters it
+            publish_retry_service.record_failure(db, post, {**facebook_result, "error": error_msg}, platform="facebook")
             
-            # Check if the error suggests token expiration
-            error_str = str(fb_error).lower()
-            if "expired" in error_str or "session" in error_str or "unauthorized" in error_str:
+            # Check if the error is due to token expiration
+            error_str = error_msg.lower()
+            expiry_words = ("expired", "session", "unauthorized") if publish_error else ("expired", "session", "token")
+            if any(word in error_str for word in expiry_words):
                 account.is_connected = False
-                db.commit()
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Facebook login session expired. Please reconnect your account."
-                )
-            else:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Failed to post to Facebook: {str(fb_error)}"
-                )
+                session_expired = True
+        
+        await db.commit()
+        
+        if session_expired:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Facebook login session expired. Please reconnect your account."
+            )
+        if publish_error:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to post to Facebook: {str(publish_error)}"
+            )
         
         # Prepare response
         if post.status == PostStatus.PUBLISHED:
@@ -501,18 +586,22 @@ async def create_facebook_post(
                 "page_name": account.display_name,
                 "ai_generated": ai_generated,
                 "facebook_post_id": post.platform_post_id,
-                "content": final_content
+                "content": final_content,
+                "retry_scheduled_at": post.next_retry_at
             }
         )
         
-    except HTTPException:
+    except HTTPException as e:
+        e.post_id = post_id
         raise
     except Exception as e:
         logger.error(f"Error creating Facebook post: {e}")
-        raise HTTPException(
+        error = HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Failed to create post: {str(e)}"
         )
+        error.post_id = post_id
+        raise error
 
 
 @router.post("/facebook/auto-reply")
@@ -723,60 +812,42 @@ async def connect_instagram(
                 detail=str(service_error)
             )
         
-        # Save Instagram accounts to database
-        connected_accounts = []
+        # Save Instagram accounts to database: one query for existing rows, then one upsert
+        existing = _existing_social_accounts(
+            db, current_user.id, "instagram", [ig_account["platform_id"] for ig_account in instagram_accounts]
+        )
+        now = datetime.utcnow()
+        rows = {}
         for ig_account in instagram_accounts:
-            # Check if account already exists
-            existing_account = db.query(SocialAccount).filter(
-                SocialAccount.user_id == current_user.id,
-                SocialAccount.platform == "instagram",
-                SocialAccount.platform_user_id == ig_account["platform_id"]
-            ).first()
-            
-            if existing_account:
-                # Update existing account
-                existing_account.username = ig_account["username"]
-                existing_account.display_name = ig_account["display_name"] or ig_account["username"]
-                existing_account.is_connected = True
-                existing_account.last_sync_at = datetime.utcnow()
-                existing_account.follower_count = ig_account.get("followers_count", 0)
-                existing_account.profile_picture_url = ig_account.get("profile_picture")
-                existing_account.platform_data = {
+            existing_account = existing.get(ig_account["platform_id"])
+            rows[ig_account["platform_id"]] = {
+                "user_id": current_user.id,
+                "platform": "instagram",
+                "platform_user_id": ig_account["platform_id"],
+                "username": ig_account["username"],
+                "display_name": ig_account["display_name"] or ig_account["username"],
+                "account_type": existing_account.account_type if existing_account else "business",
+                "follower_count": ig_account.get("followers_count", 0),
+                "profile_picture_url": ig_account.get("profile_picture"),
+                "platform_data": {
                     "page_id": ig_account.get("page_id"),
                     "page_name": ig_account.get("page_name"),
                     "media_count": ig_account.get("media_count", 0),
                     "page_access_token": ig_account.get("page_access_token")
-                }
-                existing_account.access_token = ig_account.get("page_access_token")
-                db.commit()
-                connected_accounts.append(existing_account)
-                logger.info(f"Updated existing Instagram account: {ig_account['username']} (ID: {ig_account['platform_id']})")
-            else:
-                # Create new account  
-                ig_account_obj = SocialAccount(
-                    user_id=current_user.id,
-                    platform="instagram",
-                    platform_user_id=ig_account["platform_id"],
-                    username=ig_account["username"],
-                    display_name=ig_account["display_name"] or ig_account["username"],
-                    account_type="business",
-                    follower_count=ig_account.get("followers_count", 0),
-                    profile_picture_url=ig_account.get("profile_picture"),
-                    platform_data={
-                        "page_id": ig_account.get("page_id"),
-                        "page_name": ig_account.get("page_name"),
-                        "media_count": ig_account.get("media_count", 0),
-                        "page_access_token": ig_account.get("page_access_token")
-                    },
-                    access_token=ig_account.get("page_access_token"),
-                    is_connected=True,
-                    last_sync_at=datetime.utcnow()
-                )
-                db.add(ig_account_obj)
-                db.commit()
-                db.refresh(ig_account_obj)
-                connected_accounts.append(ig_account_obj)
-                logger.info(f"Created new Instagram account: {ig_account['username']} (ID: {ig_account['platform_id']})")
+                },
+                "access_token": ig_account.get("page_access_token"),
+                "is_connected": True,
+                "last_sync_at": now,
+                "updated_at": now
+            }
+            logger.info(
+                f"{'Updating existing' if existing_account else 'Creating new'} Instagram account: "
+                f"{ig_account['username']} (ID: {ig_account['platform_id']})"
+            )
+        
+        _upsert_social_accounts(db, list(rows.values()))
+        db.commit()
+        connected_accounts = list(rows.values())
         
         logger.info(f"Instagram connection successful. Connected accounts: {len(connected_accounts)}")
         
@@ -784,13 +855,13 @@ async def connect_instagram(
             message=f"Instagram account(s) connected successfully ({len(connected_accounts)} accounts)",
             data={
                 "accounts": [{
-                    "platform_id": acc.platform_user_id,
-                    "username": acc.username,
-                    "display_name": acc.display_name,
-                    "page_name": acc.platform_data.get("page_name"),
-                    "followers_count": acc.follower_count or 0,
-                    "media_count": acc.platform_data.get("media_count", 0),
-                    "profile_picture": acc.profile_picture_url
+                    "platform_id": acc["platform_user_id"],
+                    "username": acc["username"],
+                    "display_name": acc["display_name"],
+                    "page_name": acc["platform_data"].get("page_name"),
+                    "followers_count": acc["follower_count"] or 0,
+                    "media_count": acc["platform_data"].get("media_count", 0),
+                    "profile_picture": acc["profile_picture_url"]
                 } for acc in connected_accounts]
             }
         )
@@ -807,6 +878,7 @@ async def connect_instagram(
 
 @router.post("/instagram/post")
 async def create_instagram_post(
+    http_request: Request,
     request: InstagramPostRequest = None,
     instagram_user_id: str = None,
     caption: str = None,
@@ -815,44 +887,97 @@ async def create_instagram_post(
     use_ai: bool = False,
     prompt: str = None,
     image: UploadFile = File(None),
+    prefer: Optional[str] = Header(None),
+    idempotency_key: Optional[str] = Header(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Create and publish an Instagram post."""
-    try:
-        # Handle both JSON and FormData requests
-        if request:
-            # JSON request
-            instagram_user_id = request.instagram_user_id
-            caption = request.caption
-            image_url = request.image_url
-            post_type = request.post_type
-            use_ai = getattr(request, 'use_ai', False)
-            prompt = getattr(request, 'prompt', None)
-        else:
-            # FormData request - parameters are already available
-            pass
-        
-        # Find the Instagram account
-        account = db.query(SocialAccount).filter(
-            SocialAccount.user_id == current_user.id,
-            SocialAccount.platform == "instagram",
-            SocialAccount.platform_user_id == instagram_user_id
-        ).first()
-        
-        if not account:
+    """
+    Create and publish an Instagram post.
+
+    ``Prefer: respond-async`` (and ``Idempotency-Key``) queue it as a publish
+    job and return 202, like ``/facebook/post``.
+    """
+    # Handle both JSON and FormData requests
+    if request:
+        # JSON request
+        instagram_user_id = request.instagram_user_id
+        caption = request.caption
+        image_url = request.image_url
+        post_type = request.post_type
+        use_ai = getattr(request, 'use_ai', False)
+        prompt = getattr(request, 'prompt', None)
+    else:
+        # FormData request - parameters are already available
+        pass
+    
+    if respond_async(prefer):
+        if image and image.filename:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Instagram account not found"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="File upload not yet implemented. Please use image URL instead."
             )
+
+        # Sync session: keep its queries and the job's commit off the event loop
+        def queue_job() -> PublishJob:
+            instagram_page_account(db, current_user.id, instagram_user_id)
+            return publish_job_queue.create(db, current_user.id, "instagram", {
+                "instagram_user_id": instagram_user_id,
+                "caption": caption,
+                "image_url": image_url,
+                "post_type": post_type,
+                "use_ai": use_ai,
+                "prompt": prompt
+            }, idempotency_key)
+
+        job = await asyncio.to_thread(queue_job)
+        return accepted_job(http_request, job)
+    
+    return await publish_instagram_post(
+        db, current_user.id, instagram_user_id, caption, image_url, post_type, use_ai, prompt, image
+    )
+
+
+def instagram_page_account(db: Session, user_id: int, instagram_user_id: str) -> SocialAccount:
+    """The user's connected Instagram account; 404 if unknown, 400 without a page access token."""
+    account = db.query(SocialAccount).filter(
+        SocialAccount.user_id == user_id,
+        SocialAccount.platform == "instagram",
+        SocialAccount.platform_user_id == instagram_user_id
+    ).first()
+    
+    if not account:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Instagram account not found"
+        )
+    
+    if not (account.platform_data or {}).get("page_access_token"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Page access token not found. Please reconnect your Instagram account."
+        )
+    return account
+
+
+async def publish_instagram_post(
+    db: Session,
+    user_id: int,
+    instagram_user_id: str,
+    caption: Optional[str],
+    image_url: Optional[str],
+    post_type: str = "manual",
+    use_ai: bool = False,
+    prompt: Optional[str] = None,
+    image: Optional[UploadFile] = None
+) -> SuccessResponse:
+    """Generate the caption if asked to and publish; run by requests and publish jobs."""
+    try:
+        # Find the Instagram account
+        account = instagram_page_account(db, user_id, instagram_user_id)
         
         # Get the page access token from platform_data
-        page_access_token = account.platform_data.get("page_access_token")
-        if not page_access_token:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Page access token not found. Please reconnect your Instagram account."
-            )
+        page_access_token = account.platform_data["page_access_token"]
         
         # Handle file upload if present
         final_image_url = image_url
@@ -896,7 +1021,7 @@ async def create_instagram_post(
         
         # Save post to database
         post = Post(
-            user_id=current_user.id,
+            user_id=user_id,
             social_account_id=account.id,
             content=post_result.get("generated_caption") or caption,
             post_type=PostType.IMAGE,
@@ -933,12 +1058,63 @@ async def create_instagram_post(
         )
 
 
+# Publish Jobs
+def respond_async(prefer: Optional[str]) -> bool:
+    """Whether the client asked for a 202 and a job instead of waiting on the platform (RFC 7240)."""
+    if not prefer:
+        return False
+    return any(token.split(";")[0].strip().lower() == "respond-async" for token in prefer.split(","))
+
+
+def accepted_job(http_request: Request, job: PublishJob) -> FastJSONResponse:
+    """202 Accepted with the job and its status URL in Location."""
+    return FastJSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=PublishJobResponse.model_validate(job).model_dump(mode="json"),
+        headers={"Location": str(http_request.url_for("get_publish_job", job_id=job.id))}
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=PublishJobResponse)
+async def get_publish_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get the status of a publish job; ``result`` holds the post response once it has completed."""
+    # Read from the primary: a replica may not have the job a 202 just returned yet
+    job = await db.get(PublishJob, job_id)
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Publish job not found"
+        )
+    return job
+
+
+async def run_facebook_job(job: PublishJob) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Publish job handler for ``/facebook/post``."""
+    async with AsyncSessionLocal() as db:
+        response = await publish_facebook_post(db, job.user_id, FacebookPostRequest(**job.payload))
+    return response.model_dump(mode="json"), response.data["post_id"]
+
+
+async def run_instagram_job(job: PublishJob) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Publish job handler for ``/instagram/post``."""
+    db = SessionLocal()
+    try:
+        response = await publish_instagram_post(db, job.user_id, **job.payload)
+    finally:
+        db.close()
+    return response.model_dump(mode="json"), response.data["database_id"]
+
+
 @router.get("/instagram/media/{instagram_user_id}")
 async def get_instagram_media(
     instagram_user_id: str,
     limit: int = 25,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """Get Instagram media for a connected account."""
     try:
@@ -992,37 +1168,93 @@ async def get_instagram_media(
 # Post Management
 @router.get("/posts", response_model=List[PostResponse])
 async def get_posts(
+    request: Request,
+    response: Response,
     platform: Optional[str] = None,
     status: Optional[PostStatus] = None,
-    limit: int = 50,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
-    """Get user's posts with optional filtering."""
-    query = db.query(Post).filter(Post.user_id == current_user.id)
+    """
+    Get user's posts with optional filtering, newest first.
+
+    Pages are keyset-paginated: pass the ``X-Next-Cursor`` response header
+    back as ``cursor`` to get the next page. Only the columns the response
+    shows are read; ``fields=id,status,...`` narrows the rows further to
+    just those fields (``id`` and ``created_at`` are always included).
+    Supports conditional GETs (``If-None-Match``/``If-Modified-Since``).
+    """
+    projection = parse_fields(fields, Post, PostResponse)
+    query = select(*(projection or POST_LIST_COLUMNS)).where(Post.user_id == current_user.id)
     
     if platform:
-        query = query.join(SocialAccount).filter(SocialAccount.platform == platform)
+        query = query.join(SocialAccount).where(SocialAccount.platform == platform)
+    
+    if status:
+        query = query.where(Post.status == status)
+    
+    version = (await db.execute(query.with_only_columns(*listing_version(Post)))).one()
+    cached = not_modified(request, response, version, current_user.id)
+    if cached:
+        return cached
+    
+    posts = await db.execute(paginate(query, Post, cursor, limit))
+    posts = set_next_cursor(response, posts.all(), limit)
+    if projection:
+        # Partial rows don't satisfy PostResponse, so skip response validation
+        return FastJSONResponse([post._asdict() for post in posts], headers=dict(response.headers))
+    return model_response(POST_LIST_ADAPTER, posts, response)
+
+
+@router.get("/posts/search", response_model=List[PostResponse])
+async def search_posts(
+    response: Response,
+    q: str,
+    platform: Optional[str] = None,
+    status: Optional[PostStatus] = None,
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Full-text search over the user's posts, best matches first.
+
+    All words of ``q`` must appear (``word*`` matches a prefix). Results are
+    keyset-paginated like ``/posts``: pass the ``X-Next-Cursor`` response
+    header back as ``cursor`` for the next page.
+    """
+    search = search_posts_query(POST_LIST_COLUMNS, db.bind.dialect.name, current_user.id, q)
+    if search is None:
+        return []
+    query, rank = search
+    
+    if platform:
+        query = query.join(SocialAccount, SocialAccount.id == Post.social_account_id).where(SocialAccount.platform == platform)
     
     if status:
-        query = query.filter(Post.status == status)
+        query = query.where(Post.status == status)
     
-    posts = query.order_by(Post.created_at.desc()).limit(limit).all()
-    return posts
+    posts = await db.execute(paginate_by_rank(query, rank, Post, cursor, limit))
+    posts = set_next_cursor(response, posts.all(), limit, lambda post: encode_rank_cursor(post.rank, post.id))
+    return model_response(POST_LIST_ADAPTER, posts, response)
 
 
 @router.post("/posts", response_model=PostResponse)
 async def create_post(
     post_data: PostCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new social media post."""
     # Verify user owns the social account
-    account = db.query(SocialAccount).filter(
+    account = await db.scalar(select(SocialAccount.id).where(
         SocialAccount.id == post_data.social_account_id,
         SocialAccount.user_id == current_user.id
-    ).first()
+    ))
     
     if not account:
         raise HTTPException(
@@ -1043,8 +1275,8 @@ async def create_post(
     )
     
     db.add(post)
-    db.commit()
-    db.refresh(post)
+    await db.commit()
+    await db.refresh(post)
     
     return post
 
@@ -1053,14 +1285,14 @@ async def create_post(
 async def update_post(
     post_id: int,
     post_data: PostUpdate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update a post."""
-    post = db.query(Post).filter(
+    post = await db.scalar(select(Post).where(
         Post.id == post_id,
         Post.user_id == current_user.id
-    ).first()
+    ))
     
     if not post:
         raise HTTPException(
@@ -1076,8 +1308,8 @@ async def update_post(
     if post_data.status is not None:
         post.status = post_data.status
     
-    db.commit()
-    db.refresh(post)
+    await db.commit()
+    await db.refresh(post)
     
     return post
 
@@ -1085,12 +1317,16 @@ async def update_post(
 # Automation Rules Management
 @router.get("/automation-rules", response_model=List[AutomationRuleResponse])
 async def get_automation_rules(
+    request: Request,
+    response: Response,
     platform: Optional[str] = None,
     rule_type: Optional[RuleType] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get user's automation rules."""
+    """Get user's automation rules, newest first; paginated like ``/posts``."""
     query = db.query(AutomationRule).filter(AutomationRule.user_id == current_user.id)
     
     if platform:
@@ -1099,8 +1335,13 @@ async def get_automation_rules(
     if rule_type:
         query = query.filter(AutomationRule.rule_type == rule_type)
     
-    rules = query.order_by(AutomationRule.created_at.desc()).all()
-    return rules
+    version = query.with_entities(*listing_version(AutomationRule)).one()
+    cached = not_modified(request, response, version, current_user.id)
+    if cached:
+        return cached
+    
+    rules = paginate(query, AutomationRule, cursor, limit).all()
+    return set_next_cursor(response, rules, limit)
 
 
 @router.post("/automation-rules", response_model=AutomationRuleResponse)
@@ -1207,6 +1448,59 @@ async def delete_automation_rule(
     return SuccessResponse(message="Automation rule deleted successfully")
 
 
+# Comment history
+@router.get("/comments", response_model=List[CommentResponse])
+async def get_comments(
+    account_id: Optional[int] = None,
+    reply_status: Optional[CommentReplyStatus] = None,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get received comments and their auto-reply outcome, newest first."""
+    query = db.query(Comment).join(SocialAccount).filter(SocialAccount.user_id == current_user.id)
+    
+    if account_id:
+        query = query.filter(Comment.social_account_id == account_id)
+    
+    if reply_status:
+        query = query.filter(Comment.reply_status == reply_status)
+    
+    comments = query.order_by(Comment.commented_at.desc(), Comment.id.desc()).limit(limit).all()
+    return comments
+
+
+# Dead-lettered publishes
+@router.get("/dead-letters", response_model=List[DeadLetterPostResponse])
+async def get_dead_letters(
+    include_replayed: bool = False,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get posts that failed permanently or ran out of retries, newest first."""
+    query = db.query(DeadLetterPost).filter(DeadLetterPost.user_id == current_user.id)
+    
+    if not include_replayed:
+        query = query.filter(DeadLetterPost.replayed_at.is_(None))
+    
+    return query.order_by(DeadLetterPost.created_at.desc(), DeadLetterPost.id.desc()).limit(limit).all()
+
+
+@router.post("/dead-letters/replay")
+async def replay_dead_letters(
+    request: DeadLetterReplayRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Requeue dead-lettered posts for another round of retries (all pending ones if no IDs are given)."""
+    replayed = publish_retry_service.replay(db, current_user.id, request.ids)
+    return SuccessResponse(
+        message=f"Requeued {replayed} posts for publishing",
+        data={"replayed": replayed}
+    )
+
+
 # Debug endpoint for troubleshooting Facebook connections
 @router.get("/debug/facebook-accounts")
 async def debug_facebook_accounts(
@@ -1241,13 +1535,33 @@ async def debug_facebook_accounts(
 # Scheduled Posts Endpoints
 @router.get("/scheduled-posts")
 async def get_scheduled_posts(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all scheduled posts for the current user."""
-    scheduled_posts = db.query(ScheduledPost).filter(
-        ScheduledPost.user_id == current_user.id
-    ).all()
+    """Get the current user's scheduled posts, newest first; paginated like ``/posts``."""
+    query = select(ScheduledPost).where(ScheduledPost.user_id == current_user.id)
+    # The listing shows the account's name too; new schedules have no updated_at yet
+    version = (await db.execute(
+        query.outerjoin(ScheduledPost.social_account).with_only_columns(*listing_version(
+            ScheduledPost,
+            func.coalesce(ScheduledPost.updated_at, ScheduledPost.created_at),
+            SocialAccount.updated_at
+        ))
+    )).one()
+    cached = not_modified(request, response, version, current_user.id)
+    if cached:
+        return cached
+    
+    query = query.options(selectinload(ScheduledPost.social_account))
+    scheduled_posts = set_next_cursor(
+        response,
+        (await db.scalars(paginate(query, ScheduledPost, cursor, limit))).all(),
+        limit
+    )
     
     return [{
         "id": post.id,
@@ -1272,8 +1586,8 @@ async def create_scheduled_post(
     post_time: str,
     frequency: str = "daily",
     social_account_id: int = None,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new scheduled post."""
     try:
@@ -1286,18 +1600,18 @@ async def create_scheduled_post(
         
         # If no social account specified, find the first Facebook account
         if not social_account_id:
-            facebook_account = db.query(SocialAccount).filter(
+            facebook_account_id = await db.scalar(select(SocialAccount.id).where(
                 SocialAccount.user_id == current_user.id,
                 SocialAccount.platform == "facebook",
                 SocialAccount.is_connected == True
-            ).first()
+            ).limit(1))
             
-            if not facebook_account:
+            if not facebook_account_id:
                 raise HTTPException(
                     status_code=400,
                     detail="No connected Facebook account found"
                 )
-            social_account_id = facebook_account.id
+            social_account_id = facebook_account_id
         
         # Calculate next execution time
         from datetime import datetime, timedelta
@@ -1343,8 +1657,8 @@ async def create_scheduled_post(
         )
         
         db.add(scheduled_post)
-        db.commit()
-        db.refresh(scheduled_post)
+        await db.commit()
+        await db.refresh(scheduled_post)
         
         logger.info(f"Created scheduled post {scheduled_post.id} for user {current_user.id}")
         
@@ -1372,16 +1686,16 @@ async def create_scheduled_post(
 @router.delete("/scheduled-posts/{schedule_id}")
 async def delete_scheduled_post(
     schedule_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Delete a scheduled post."""
     try:
         # Find the scheduled post
-        scheduled_post = db.query(ScheduledPost).filter(
+        scheduled_post = await db.scalar(select(ScheduledPost).where(
             ScheduledPost.id == schedule_id,
             ScheduledPost.user_id == current_user.id
-        ).first()
+        ))
         
         if not scheduled_post:
             raise HTTPException(
@@ -1390,8 +1704,8 @@ async def delete_scheduled_post(
             )
         
         # Delete the scheduled post
-        db.delete(scheduled_post)
-        db.commit()
+        await db.delete(scheduled_post)
+        await db.commit()
         
         logger.info(f"Deleted scheduled post {schedule_id} for user {current_user.id}")
         
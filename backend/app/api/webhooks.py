@@ -0,0 +1,154 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse
+from typing import Any, Dict, List
+import hashlib
+import hmac
+import json
+import logging
+import time
+
+from app.api.auth import get_current_user
+from app.config import get_settings
+from app.models.user import User
+from app.services.event_queue import event_queue
+from app.services.deferred_events import deferred_events
+from app.services.event_dedup import event_deduplicator
+from app.services.comment_sync_service import comment_sync_service
+from app.services.rule_counters import rule_counters
+from app.services.comment_store import comment_store
+from app.services.payload_store import payload_store
+from app.services.password_hasher import password_hasher
+from app.services.push_hub import push_hub
+from app.services.user_cache import user_cache
+from app.services.social_events import normalize_event
+from app.services.action_limiter import action_limiter
+from app.services.publish_job_queue import publish_job_queue
+from app.services.publish_retry_service import publish_retry_service
+from app.services.db_writer import db_writer
+from app.services.replica_router import replica_router
+
+router = APIRouter(prefix="/webhooks", tags=["webhooks"])
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def verify_signature(body: bytes, signature_header: str | None) -> bool:
+    """Verify the X-Hub-Signature-256 header Meta sends with every webhook delivery."""
+    if not settings.facebook_app_secret or not signature_header:
+        return False
+
+    algorithm, _, signature = signature_header.partition("=")
+    if algorithm != "sha256" or not signature:
+        return False
+
+    expected = hmac.new(
+        settings.facebook_app_secret.encode("utf-8"),
+        body,
+        hashlib.sha256
+    ).hexdigest()
+    return hmac.compare_digest(expected, signature)
+
+
+def extract_events(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Flatten a webhook payload into one event per entry change."""
+    platform = "instagram" if payload.get("object") == "instagram" else "facebook"
+    received_at = time.time()
+
+    events = []
+    for entry in payload.get("entry") or []:
+        for change in entry.get("changes") or []:
+            events.append({
+                "platform": platform,
+                "account_id": str(entry.get("id")),
+                "field": change.get("field"),
+                "value": change.get("value") or {},
+                "entry_time": entry.get("time"),
+                "received_at": received_at
+            })
+    return events
+
+
+@router.get("/facebook", response_class=PlainTextResponse)
+@router.get("/instagram", response_class=PlainTextResponse)
+async def verify_webhook_subscription(
+    hub_mode: str = Query(None, alias="hub.mode"),
+    hub_verify_token: str = Query(None, alias="hub.verify_token"),
+    hub_challenge: str = Query(None, alias="hub.challenge")
+):
+    """Answer Meta's subscription verification handshake."""
+    if (
+        hub_mode == "subscribe"
+        and settings.facebook_webhook_verify_token
+        and hub_verify_token == settings.facebook_webhook_verify_token
+    ):
+        return hub_challenge or ""
+
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="Webhook verification failed"
+    )
+
+
+@router.post("/facebook")
+@router.post("/instagram")
+async def receive_webhook(request: Request):
+    """
+    Receive Facebook/Instagram webhook deliveries.
+
+    The payload is only verified, normalized and queued here; auto-replies
+    and rule matching run on the event workers so the delivery is acknowledged
+    immediately and Meta does not retry it.
+    """
+    started = time.perf_counter()
+    body = await request.body()
+
+    if not verify_signature(body, request.headers.get("X-Hub-Signature-256")):
+        logger.warning("Rejected webhook delivery with invalid signature")
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid webhook signature"
+        )
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid webhook payload"
+        )
+
+    # Normalize up front so unsupported fields never take a queue slot
+    events = [event for event in map(normalize_event, extract_events(payload)) if event is not None]
+    for event in events:
+        if not await event_queue.enqueue(event):
+            # Let Meta redeliver once the workers have caught up
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Event queue is full, retry later"
+            )
+
+    event_queue.record_ack_latency(time.perf_counter() - started)
+    return {"success": True, "received": len(events)}
+
+
+@router.get("/metrics")
+async def get_webhook_metrics(current_user: User = Depends(get_current_user)):
+    """Get event queue, deduplication, comment polling, deferred events, write-behind, replica, user cache, password hashing, push, rate limiter, retry and publish job metrics."""
+    return {
+        **event_queue.get_metrics(),
+        "deduplication": event_deduplicator.get_metrics(),
+        "comment_sync": comment_sync_service.get_metrics(),
+        "deferred_events": deferred_events.get_metrics(),
+        "rule_counters": rule_counters.get_metrics(),
+        "comment_store": comment_store.get_metrics(),
+        "payload_store": payload_store.get_metrics(),
+        "user_cache": user_cache.get_metrics(),
+        "password_hasher": password_hasher.get_metrics(),
+        "push": push_hub.get_metrics(),
+        "db_writer": db_writer.get_metrics(),
+        "read_replica": replica_router.get_metrics(),
+        "action_limiter": action_limiter.get_metrics(),
+        "publish_retries": publish_retry_service.get_metrics(),
+        "publish_jobs": publish_job_queue.get_metrics()
+    }
@@ -8,10 +8,34 @@ class Settings(BaseSettings):
     # Database - default to local SQLite; override in prod via env var
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///./automation_dashboard.db")
 
+    # Read replica for read-only endpoints (optional)
+    database_replica_url: str | None = os.getenv("DATABASE_REPLICA_URL")
+    replica_max_lag: float = float(os.getenv("REPLICA_MAX_LAG", "5"))  # seconds
+    replica_lag_check_interval: float = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", "5"))  # seconds
+    replica_sticky_seconds: float = float(os.getenv("REPLICA_STICKY_SECONDS", "10"))  # primary reads after a write
+    replica_sticky_url: str | None = os.getenv("REPLICA_STICKY_URL")  # redis://... to share that across instances
+
+    # SQLite tuning (ignored for Postgres)
+    sqlite_journal_mode: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    sqlite_synchronous: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    sqlite_cache_size: int = int(os.getenv("SQLITE_CACHE_SIZE", "-64000"))  # negative = KiB
+    sqlite_mmap_size: int = int(os.getenv("SQLITE_MMAP_SIZE", "268435456"))  # bytes
+    sqlite_busy_timeout: int = int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000"))  # milliseconds
+    sqlite_pool_size: int = int(os.getenv("SQLITE_POOL_SIZE", "10"))
+
+    # Serialized writer for background (write-behind) writes
+    db_writer_max_batch: int = int(os.getenv("DB_WRITER_MAX_BATCH", "200"))
+    db_writer_max_delay: float = float(os.getenv("DB_WRITER_MAX_DELAY", "0"))  # seconds to wait for more jobs
+    write_behind_max_attempts: int = int(os.getenv("WRITE_BEHIND_MAX_ATTEMPTS", "5"))  # per buffered row, then dropped
+
     # JWT Authentication
     secret_key: str = os.getenv("SECRET_KEY", "change-me")
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 440
+    user_cache_ttl: float = float(os.getenv("USER_CACHE_TTL", "60"))  # seconds; 0 disables the cache
+    user_cache_size: int = int(os.getenv("USER_CACHE_SIZE", "10000"))
+    password_hash_rounds: int = int(os.getenv("PASSWORD_HASH_ROUNDS", "12"))  # bcrypt cost factor
+    password_hash_workers: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))  # processes
 
     # Facebook Integration
     facebook_app_id: str | None = os.getenv("FACEBOOK_APP_ID")
@@ -21,6 +45,44 @@ class Settings(BaseSettings):
     instagram_app_id: str | None = os.getenv("INSTAGRAM_APP_ID")
     instagram_app_secret: str | None = os.getenv("INSTAGRAM_APP_SECRET")
 
+    # Webhook ingestion (Facebook/Instagram)
+    facebook_webhook_verify_token: str | None = os.getenv("FACEBOOK_WEBHOOK_VERIFY_TOKEN")
+    webhook_queue_max_size: int = int(os.getenv("WEBHOOK_QUEUE_MAX_SIZE", "1000"))
+    webhook_workers: int = int(os.getenv("WEBHOOK_WORKERS", "4"))
+    webhook_enqueue_timeout: float = float(os.getenv("WEBHOOK_ENQUEUE_TIMEOUT", "0.05"))
+    event_dedup_cache_size: int = int(os.getenv("EVENT_DEDUP_CACHE_SIZE", "10000"))
+    rule_counter_flush_interval: float = float(os.getenv("RULE_COUNTER_FLUSH_INTERVAL", "5"))  # seconds
+    comment_store_flush_interval: float = float(os.getenv("COMMENT_STORE_FLUSH_INTERVAL", "2"))  # seconds
+    comment_store_batch_size: int = int(os.getenv("COMMENT_STORE_BATCH_SIZE", "500"))
+
+    # Batched writes of raw platform responses (stored compressed in post_payloads)
+    payload_store_flush_interval: float = float(os.getenv("PAYLOAD_STORE_FLUSH_INTERVAL", "2"))  # seconds
+    payload_store_batch_size: int = int(os.getenv("PAYLOAD_STORE_BATCH_SIZE", "200"))
+    payload_compression_level: int = int(os.getenv("PAYLOAD_COMPRESSION_LEVEL", "6"))  # zlib, 1-9
+
+    # Outbound limits for automated actions, per social account
+    action_limit_burst: int = int(os.getenv("ACTION_LIMIT_BURST", "5"))
+    action_limit_per_minute: float = float(os.getenv("ACTION_LIMIT_PER_MINUTE", "6"))
+    action_limit_window_seconds: int = int(os.getenv("ACTION_LIMIT_WINDOW_SECONDS", "3600"))
+    action_limit_window_max: int = int(os.getenv("ACTION_LIMIT_WINDOW_MAX", "120"))
+    deferred_event_poll_interval: float = float(os.getenv("DEFERRED_EVENT_POLL_INTERVAL", "5"))  # seconds
+    deferred_event_lease_seconds: float = float(os.getenv("DEFERRED_EVENT_LEASE_SECONDS", "300"))  # replay in flight, then retried
+
+    # Retries for failed publishes
+    publish_retry_interval: int = int(os.getenv("PUBLISH_RETRY_INTERVAL", "60"))  # seconds
+    publish_max_retries: int = int(os.getenv("PUBLISH_MAX_RETRIES", "5"))
+    publish_retry_base_delay: float = float(os.getenv("PUBLISH_RETRY_BASE_DELAY", "60"))  # seconds
+    publish_retry_max_delay: float = float(os.getenv("PUBLISH_RETRY_MAX_DELAY", "3600"))  # seconds
+    publish_retry_batch_size: int = int(os.getenv("PUBLISH_RETRY_BATCH_SIZE", "100"))
+    publish_lease_seconds: float = float(os.getenv("PUBLISH_LEASE_SECONDS", "300"))  # in-flight publish, then dead-lettered as interrupted
+    publish_job_workers: int = int(os.getenv("PUBLISH_JOB_WORKERS", "4"))  # concurrent publishes accepted with 202
+    publish_job_poll_interval: float = float(os.getenv("PUBLISH_JOB_POLL_INTERVAL", "10"))  # seconds
+
+    # Comment polling for pages without webhooks
+    comment_sync_enabled: bool = os.getenv("COMMENT_SYNC_ENABLED", "False").lower() == "true"
+    comment_sync_interval: int = int(os.getenv("COMMENT_SYNC_INTERVAL", "300"))  # seconds
+    comment_sync_lookback_days: int = int(os.getenv("COMMENT_SYNC_LOOKBACK_DAYS", "7"))
+
     # Groq AI Integration
     groq_api_key: str | None = os.getenv("GROQ_API_KEY")
 
@@ -31,6 +93,17 @@ class Settings(BaseSettings):
     # CORS
     cors_origins: List[str] = ["*"]
 
+    # Live updates pushed to the dashboard over SSE/WebSocket
+    push_broker_url: str | None = os.getenv("PUSH_BROKER_URL")  # redis://... for multi-instance fan-out
+    push_channel: str = os.getenv("PUSH_CHANNEL", "automation-dashboard:push")
+    push_queue_size: int = int(os.getenv("PUSH_QUEUE_SIZE", "100"))  # pending events per connection
+    push_keepalive_interval: float = float(os.getenv("PUSH_KEEPALIVE_INTERVAL", "15"))  # seconds
+
+    # Response compression (brotli when installed and accepted, else gzip)
+    compression_minimum_size: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))  # bytes
+    gzip_compression_level: int = int(os.getenv("GZIP_COMPRESSION_LEVEL", "6"))  # 1-9
+    brotli_quality: int = int(os.getenv("BROTLI_QUALITY", "4"))  # 0-11
+
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
 
 
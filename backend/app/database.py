@@ -1,10 +1,66 @@
-from sqlalchemy import create_engine
+import logging
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import get_settings
 
+logger = logging.getLogger(__name__)
+
 settings = get_settings()
 
+
+def is_sqlite_memory(database_url: str) -> bool:
+    database = make_url(database_url).database
+    return not database or database == ":memory:" or database.startswith("file::memory:")
+
+
+def sqlite_pragmas(database_url: str) -> list:
+    """PRAGMAs run on every new SQLite connection."""
+    pragmas = [
+        f"synchronous = {settings.sqlite_synchronous}",
+        f"cache_size = {settings.sqlite_cache_size}",
+        f"busy_timeout = {settings.sqlite_busy_timeout}",
+    ]
+    if not is_sqlite_memory(database_url):
+        pragmas += [
+            f"journal_mode = {settings.sqlite_journal_mode}",
+            f"mmap_size = {settings.sqlite_mmap_size}",
+        ]
+    return pragmas
+
+
+def configure_sqlite(sync_engine: Engine, database_url: str, begin_immediate: bool = False):
+    """
+    Tune a SQLite engine for concurrent use.
+
+    WAL lets readers run alongside the writer, ``busy_timeout`` makes writers
+    wait for the lock instead of failing with "database is locked", and
+    ``synchronous = NORMAL`` drops the per-commit fsync (safe with WAL).
+
+    With ``begin_immediate`` the driver's implicit transaction handling is
+    switched off and every transaction starts with BEGIN IMMEDIATE: the write
+    lock is taken up front (no read-to-write upgrade, which busy_timeout
+    can't wait out) and SAVEPOINTs work. Only for engines that always write.
+    """
+    pragmas = sqlite_pragmas(database_url)
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+        if begin_immediate:
+            dbapi_connection.isolation_level = None
+
+    if begin_immediate:
+        @event.listens_for(sync_engine, "begin")
+        def _on_begin(connection):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
 # Create database engine
 if settings.database_url.startswith("postgresql"):
     engine = create_engine(
@@ -15,15 +71,124 @@ if settings.database_url.startswith("postgresql"):
         max_overflow=20
     )
 else:
+    # Pooled connections are shared across threadpool workers; a local file
+    # can't go away, so no pre-ping round trip on every checkout
     engine = create_engine(
         settings.database_url,
-        pool_pre_ping=True,
-        echo=settings.debug
+        echo=settings.debug,
+        connect_args={"check_same_thread": False},
+        **({} if is_sqlite_memory(settings.database_url) else {
+            "pool_size": settings.sqlite_pool_size,
+            "max_overflow": settings.sqlite_pool_size * 2
+        })
+    )
+    configure_sqlite(engine, settings.database_url)
+
+# Connection for the serialized background writer (app/services/db_writer.py)
+if settings.database_url.startswith("postgresql") or is_sqlite_memory(settings.database_url):
+    write_engine = engine
+else:
+    write_engine = create_engine(
+        settings.database_url,
+        echo=settings.debug,
+        connect_args={"check_same_thread": False},
+        pool_size=1,
+        max_overflow=0
     )
+    configure_sqlite(write_engine, settings.database_url, begin_immediate=True)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def get_async_database_url(database_url: str) -> str:
+    """Map the configured (sync) database URL onto its asyncio driver."""
+    url = make_url(database_url)
+    if url.drivername.startswith("postgresql"):
+        url = url.set(drivername="postgresql+asyncpg")
+        # asyncpg takes `ssl` instead of libpq's `sslmode`
+        if "sslmode" in url.query:
+            query = dict(url.query)
+            query["ssl"] = query.pop("sslmode")
+            url = url.set(query=query)
+    elif url.drivername.startswith("sqlite"):
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
+
+# Create async engine (asyncpg / aiosqlite) for endpoints that use get_async_db
+try:
+    if settings.database_url.startswith("postgresql"):
+        async_engine = create_async_engine(
+            get_async_database_url(settings.database_url),
+            pool_pre_ping=True,
+            echo=settings.debug,
+            pool_size=10,
+            max_overflow=20
+        )
+    else:
+        async_engine = create_async_engine(
+            get_async_database_url(settings.database_url),
+            echo=settings.debug
+        )
+        configure_sqlite(async_engine.sync_engine, settings.database_url)
+    AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+except ImportError as e:
+    logger.warning(f"Async database driver not installed ({e}); async endpoints are unavailable")
+    async_engine = None
+    AsyncSessionLocal = None
+
+# Read replica engines for read-only endpoints (app/services/replica_router.py)
+replica_engine = None
+ReplicaSessionLocal = None
+async_replica_engine = None
+AsyncReplicaSessionLocal = None
+if settings.database_replica_url:
+    replica_engine = create_engine(
+        settings.database_replica_url,
+        pool_pre_ping=True,
+        echo=settings.debug,
+        pool_size=10,
+        max_overflow=20
+    )
+    ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+    try:
+        async_replica_engine = create_async_engine(
+            get_async_database_url(settings.database_replica_url),
+            pool_pre_ping=True,
+            echo=settings.debug,
+            pool_size=10,
+            max_overflow=20
+        )
+        AsyncReplicaSessionLocal = async_sessionmaker(
+            async_replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+        )
+    except ImportError as e:
+        logger.warning(f"Async database driver not installed ({e}); async reads use the primary")
+
+
+def insert_ignore_duplicates(table):
+    """Build an INSERT that skips rows violating the table's unique keys."""
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table).on_conflict_do_nothing()
+
+
+def upsert(table, index_elements, update_columns):
+    """Build an INSERT that updates ``update_columns`` of rows conflicting on ``index_elements``."""
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    stmt = insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={column: stmt.excluded[column] for column in update_columns}
+    )
+
+
 # Create base class for models
 Base = declarative_base()
 
@@ -37,11 +202,19 @@ def get_db():
         db.close()
 
 
+# Dependency to get an async database session
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database driver not installed (pip install asyncpg aiosqlite)")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 # Create all tables
 def create_tables():
     try:
         # Import all models to ensure they're registered
-        from app.models import user, automation_rule, post, social_account
+        from app.models import user, automation_rule, post, post_payload, social_account, processed_event, comment_sync_cursor, comment, dead_letter_post, scheduled_post, publish_job, deferred_event
         Base.metadata.create_all(bind=engine)
         print("✅ Database tables created successfully")
     except Exception as e:
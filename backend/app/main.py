@@ -1,10 +1,25 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from app.config import get_settings
 from app.database import create_tables
-from app.api import auth, social_media
+from app.api import auth, push, social_media, webhooks
+from app.api.compression import CompressionMiddleware
+from app.api.responses import FastJSONResponse
 from app.services.scheduler_service import scheduler_service
+from app.services.event_queue import event_queue
+from app.services.deferred_events import deferred_events
+from app.services.automation_service import automation_service
+from app.services.comment_sync_service import comment_sync_service
+from app.services.rule_counters import rule_counters
+from app.services.comment_store import comment_store
+from app.services.payload_store import payload_store
+from app.services.publish_job_queue import publish_job_queue
+from app.services.publish_retry_service import publish_retry_service
+from app.services.db_writer import db_writer
+from app.services.password_hasher import password_hasher
+from app.services.push_hub import push_hub
+from app.services.replica_router import replica_router, session_key
 import logging
 import asyncio
 
@@ -21,6 +36,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    default_response_class=FastJSONResponse,
 )
 
 # Add CORS middleware
@@ -33,6 +49,14 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Compress large responses
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.gzip_compression_level,
+    brotli_quality=settings.brotli_quality,
+)
+
 # Add trusted host middleware for production
 if settings.environment == "production":
     app.add_middleware(
@@ -41,6 +65,15 @@ if settings.environment == "production":
     )
 
 
+@app.middleware("http")
+async def track_session_writes(request: Request, call_next):
+    """Keep a session's reads on the primary right after it writes (read-your-writes)."""
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS"):
+        await replica_router.mark_write(session_key(request))
+    return response
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize the application."""
@@ -61,6 +94,69 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Failed to start scheduler service: {e}")
     
+    # Start webhook event workers (auto-reply and rule matching)
+    try:
+        await event_queue.start(automation_service.handle_event)
+    except Exception as e:
+        logger.error(f"Failed to start event queue: {e}")
+    
+    # Start replaying auto-replies postponed by the action limiter
+    try:
+        asyncio.create_task(deferred_events.start())
+    except Exception as e:
+        logger.error(f"Failed to start deferred event poller: {e}")
+    
+    # Start write-behind flushing of automation rule counters
+    try:
+        asyncio.create_task(rule_counters.start())
+    except Exception as e:
+        logger.error(f"Failed to start rule counter flusher: {e}")
+    
+    # Start batched writes of received comments and reply outcomes
+    try:
+        asyncio.create_task(comment_store.start())
+    except Exception as e:
+        logger.error(f"Failed to start comment store flusher: {e}")
+    
+    # Start batched writes of raw platform responses
+    try:
+        asyncio.create_task(payload_store.start())
+    except Exception as e:
+        logger.error(f"Failed to start payload store flusher: {e}")
+    
+    # Start retries of failed publishes
+    try:
+        asyncio.create_task(publish_retry_service.start())
+    except Exception as e:
+        logger.error(f"Failed to start publish retry service: {e}")
+    
+    # Start the workers for publishes accepted with 202
+    try:
+        await publish_job_queue.start({
+            "facebook": social_media.run_facebook_job,
+            "instagram": social_media.run_instagram_job
+        })
+    except Exception as e:
+        logger.error(f"Failed to start publish job queue: {e}")
+    
+    # Start comment polling for pages without webhooks
+    try:
+        asyncio.create_task(comment_sync_service.start())
+    except Exception as e:
+        logger.error(f"Failed to start comment sync service: {e}")
+    
+    # Start live updates to dashboard connections
+    try:
+        await push_hub.start()
+    except Exception as e:
+        logger.error(f"Failed to start push hub: {e}")
+    
+    # Start read replica lag monitoring (no-op without DATABASE_REPLICA_URL)
+    try:
+        asyncio.create_task(replica_router.start())
+    except Exception as e:
+        logger.error(f"Failed to start read replica routing: {e}")
+    
     # Log registered routes for debugging
     routes = [route.path for route in app.routes]
     logger.info(f"Registered routes: {routes}")
@@ -79,6 +175,78 @@ async def shutdown_event():
         logger.info("Scheduler service stopped")
     except Exception as e:
         logger.error(f"Error stopping scheduler service: {e}")
+    
+    # Stop publish retries
+    try:
+        publish_retry_service.stop()
+    except Exception as e:
+        logger.error(f"Error stopping publish retry service: {e}")
+    
+    # Stop publish job workers (before the push hub, so their last status goes out)
+    try:
+        await publish_job_queue.stop()
+    except Exception as e:
+        logger.error(f"Error stopping publish job queue: {e}")
+    
+    # End live update streams
+    try:
+        await push_hub.stop()
+    except Exception as e:
+        logger.error(f"Error stopping push hub: {e}")
+    
+    # Stop read replica lag monitoring
+    try:
+        replica_router.stop()
+    except Exception as e:
+        logger.error(f"Error stopping read replica routing: {e}")
+    
+    # Stop comment polling
+    try:
+        comment_sync_service.stop()
+    except Exception as e:
+        logger.error(f"Error stopping comment sync service: {e}")
+    
+    # Stop replaying deferred events (they stay stored for the next start)
+    try:
+        deferred_events.stop()
+    except Exception as e:
+        logger.error(f"Error stopping deferred event poller: {e}")
+    
+    # Stop webhook event workers
+    try:
+        await event_queue.stop()
+    except Exception as e:
+        logger.error(f"Error stopping event queue: {e}")
+    
+    # Flush buffered comments
+    try:
+        comment_store.stop()
+    except Exception as e:
+        logger.error(f"Error stopping comment store flusher: {e}")
+    
+    # Flush buffered platform responses
+    try:
+        payload_store.stop()
+    except Exception as e:
+        logger.error(f"Error stopping payload store flusher: {e}")
+    
+    # Flush outstanding rule counters
+    try:
+        rule_counters.stop()
+    except Exception as e:
+        logger.error(f"Error stopping rule counter flusher: {e}")
+    
+    # Stop password hashing workers
+    try:
+        password_hasher.stop()
+    except Exception as e:
+        logger.error(f"Error stopping password hashing pool: {e}")
+    
+    # Commit whatever the flushers queued, last
+    try:
+        db_writer.stop()
+    except Exception as e:
+        logger.error(f"Error stopping database writer: {e}")
 
 
 # Health check endpoint
@@ -128,6 +296,8 @@ async def test_post_endpoint(data: dict = None):
 # Include API routers
 app.include_router(auth.router, prefix="/api")
 app.include_router(social_media.router, prefix="/api")
+app.include_router(webhooks.router, prefix="/api")
+app.include_router(push.router, prefix="/api")
 
 # Import and include AI router
 from app.api import ai
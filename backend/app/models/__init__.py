@@ -2,5 +2,12 @@
 from .user import User
 from .social_account import SocialAccount
 from .post import Post
+from .post_payload import PostPayload
 from .automation_rule import AutomationRule
-from .scheduled_post import ScheduledPost
\ No newline at end of file
+from .scheduled_post import ScheduledPost
+from .processed_event import ProcessedEvent
+from .comment_sync_cursor import CommentSyncCursor
+from .comment import Comment
+from .dead_letter_post import DeadLetterPost
+from .publish_job import PublishJob
+from .deferred_event import DeferredEvent
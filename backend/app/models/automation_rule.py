@@ -1,7 +1,10 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.services.active_window import ActiveWindow, compile_active_window
+from datetime import datetime
+from typing import Optional
 import enum
 
 
@@ -25,6 +28,10 @@ class TriggerType(str, enum.Enum):
 
 class AutomationRule(Base):
     __tablename__ = "automation_rules"
+    __table_args__ = (
+        # Rule listing, keyset-paginated on (created_at, id)
+        Index("ix_automation_rules_user_created", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -73,7 +80,16 @@ class AutomationRule(Base):
     def __repr__(self):
         return f"<AutomationRule(id={self.id}, name='{self.name}', type='{self.rule_type}', active={self.is_active})>"
     
-    def can_execute(self) -> bool:
+    def active_window(self) -> ActiveWindow:
+        """Get the compiled active-hours/active-days window for this rule."""
+        return compile_active_window(
+            self.active_hours_start,
+            self.active_hours_end,
+            tuple(self.active_days) if self.active_days else None,
+            self.timezone
+        )
+    
+    def can_execute(self, now: Optional[datetime] = None) -> bool:
         """Check if rule can execute based on limits and schedule."""
         if not self.is_active:
             return False
@@ -82,19 +98,20 @@ class AutomationRule(Base):
         if self.daily_limit and self.daily_count >= self.daily_limit:
             return False
             
-        # TODO: Add time-based checks for active_hours and active_days
+        # Check active hours and days in the rule's timezone
+        if not self.active_window().contains(now):
+            return False
         
         return True
     
     def increment_execution(self, success: bool = True):
-        """Increment execution counters."""
-        self.total_executions += 1
-        self.daily_count += 1
-        self.last_execution_at = func.now()
+        """
+        Increment execution counters.
+        
+        Counters are accumulated in memory and written with atomic
+        ``x = x + delta`` updates by the rule counter flusher.
+        """
+        from app.services.rule_counters import rule_counters
         
-        if success:
-            self.success_count += 1
-            self.last_success_at = func.now()
-        else:
-            self.error_count += 1
-            self.last_error_at = func.now() 
\ No newline at end of file
+        rule_counters.reserve(self, enforce_limit=False)
+        rule_counters.record_outcome(self.id, success, self.last_error_message if not success else None) 
\ No newline at end of file
@@ -0,0 +1,60 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.database import Base
+import enum
+
+
+class CommentReplyStatus(str, enum.Enum):
+    PENDING = "pending"
+    REPLIED = "replied"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+class Comment(Base):
+    __tablename__ = "comments"
+    __table_args__ = (
+        UniqueConstraint("platform", "platform_comment_id", name="uq_comments_platform_comment"),
+        # "Unreplied comments for account X, newest first"; on Postgres the
+        # platform ids are included so the reply queue scan is index-only.
+        Index(
+            "ix_comments_account_status_time",
+            "social_account_id", "reply_status", "commented_at",
+            postgresql_include=["platform_comment_id", "platform_post_id"]
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    social_account_id = Column(Integer, ForeignKey("social_accounts.id"), nullable=False)
+    post_id = Column(Integer, ForeignKey("posts.id"), nullable=True)  # Set when the post was created here
+
+    # Platform identifiers
+    platform = Column(String, nullable=False)  # facebook, instagram
+    platform_comment_id = Column(String, nullable=False)
+    platform_post_id = Column(String, nullable=True)
+    parent_comment_id = Column(String, nullable=True)  # For replies to comments
+
+    # Comment content
+    author_id = Column(String, nullable=True)
+    author_name = Column(String, nullable=True)
+    message = Column(Text, nullable=True)
+    commented_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Auto-reply outcome
+    reply_status = Column(Enum(CommentReplyStatus), default=CommentReplyStatus.PENDING, nullable=False)
+    reply_id = Column(String, nullable=True)  # ID of our reply on the platform
+    reply_content = Column(Text, nullable=True)
+    replied_at = Column(DateTime(timezone=True), nullable=True)
+    error_message = Column(Text, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    social_account = relationship("SocialAccount", back_populates="comments")
+    post = relationship("Post", back_populates="comments")
+
+    def __repr__(self):
+        return f"<Comment(id={self.id}, platform='{self.platform}', status='{self.reply_status}')>"
@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.database import Base
+
+
+class CommentSyncCursor(Base):
+    __tablename__ = "comment_sync_cursors"
+    __table_args__ = (
+        UniqueConstraint("social_account_id", "platform_post_id", name="uq_comment_sync_cursors_post"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    social_account_id = Column(Integer, ForeignKey("social_accounts.id"), nullable=False)
+    platform_post_id = Column(String, nullable=False)  # Post ID on the platform
+
+    # Checkpoint: newest comment seen and the Graph paging cursor after it
+    since = Column(DateTime(timezone=True), nullable=True)
+    after_cursor = Column(String, nullable=True)
+    last_synced_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Relationships
+    social_account = relationship("SocialAccount")
+
+    def __repr__(self):
+        return f"<CommentSyncCursor(post='{self.platform_post_id}', since={self.since})>"
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.database import Base
+
+
+class DeadLetterPost(Base):
+    """A publish that failed for good: retries exhausted, a non-retryable error, or interrupted mid-publish."""
+
+    __tablename__ = "dead_letter_posts"
+    __table_args__ = (
+        # "Dead letters of user X not replayed yet, newest first"
+        Index("ix_dead_letter_posts_user_replayed", "user_id", "replayed_at", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    post_id = Column(Integer, ForeignKey("posts.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    social_account_id = Column(Integer, ForeignKey("social_accounts.id"), nullable=False)
+    platform = Column(String, nullable=False)
+
+    # Failure details
+    reason = Column(String, nullable=False)  # retries_exhausted, auth, permanent, interrupted
+    error_code = Column(String, nullable=True)  # Platform error code, if any
+    error_message = Column(Text, nullable=True)
+    attempts = Column(Integer, default=1)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    replayed_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Relationships
+    post = relationship("Post")
+
+    def __repr__(self):
+        return f"<DeadLetterPost(id={self.id}, post_id={self.post_id}, reason='{self.reason}')>"
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class DeferredEvent(Base):
+    """An inbound event postponed by the action limiter, put back on the event queue once due."""
+
+    __tablename__ = "deferred_events"
+    __table_args__ = (
+        # Same identity as processed_events: one pending deferral per event
+        UniqueConstraint("platform", "event_type", "event_key", name="uq_deferred_events_key"),
+        Index("ix_deferred_events_due_at", "due_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Identity of the event (e.g. facebook / comment / <comment_id>)
+    platform = Column(String, nullable=False)
+    event_type = Column(String, nullable=False)
+    event_key = Column(String, nullable=False)
+
+    # The SocialEvent, replayed as is
+    payload = Column(JSON, nullable=False)
+
+    due_at = Column(DateTime(timezone=True), nullable=False)
+    locked_until = Column(DateTime(timezone=True), nullable=True)  # Lease of the instance replaying it
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<DeferredEvent(platform='{self.platform}', type='{self.event_type}', key='{self.event_key}')>"
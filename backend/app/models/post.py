@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum
+from sqlalchemy import Column, DDL, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum, Index, event
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -23,6 +23,13 @@ class PostType(str, enum.Enum):
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # Retry queue scan: failed posts whose next attempt is due
+        Index("ix_posts_next_retry_at", "next_retry_at"),
+        # Post listings: newest first, optionally filtered by status; keyset-paginated on (created_at, id)
+        Index("ix_posts_user_status_created", "user_id", "status", "created_at"),
+        Index("ix_posts_user_created", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -42,9 +49,13 @@ class Post(Base):
     
     # Platform response
     platform_post_id = Column(String, nullable=True)  # ID from social platform
-    platform_response = Column(JSON, nullable=True)  # Full response from platform
     error_message = Column(Text, nullable=True)
     
+    # Publish retries (next_retry_at is set while a failed post waits for another attempt,
+    # and holds the publish lease while a post is in flight)
+    retry_count = Column(Integer, default=0)
+    next_retry_at = Column(DateTime(timezone=True), nullable=True)
+    
     # Engagement metrics (updated periodically)
     likes_count = Column(Integer, default=0)
     comments_count = Column(Integer, default=0)
@@ -63,6 +74,41 @@ class Post(Base):
     # Relationships
     user = relationship("User", back_populates="posts")
     social_account = relationship("SocialAccount", back_populates="posts")
+    comments = relationship("Comment", back_populates="post")
+    # Raw platform response and creation metadata, compressed in post_payloads
+    payload = relationship(
+        "PostPayload", back_populates="post", uselist=False,
+        cascade="all, delete-orphan", passive_deletes=True
+    )
     
     def __repr__(self):
-        return f"<Post(id={self.id}, status='{self.status}', platform='{self.social_account.platform if self.social_account else 'Unknown'}')>" 
\ No newline at end of file
+        return f"<Post(id={self.id}, status='{self.status}', platform='{self.social_account.platform if self.social_account else 'Unknown'}')>" 
+
+
+# Full-text index over post content, kept in sync by the database itself:
+# an FTS5 table fed by triggers on SQLite (user_id is indexed too, so a search
+# only walks the searching user's postings), a generated tsvector column with a
+# GIN index on PostgreSQL. Same DDL as migration e3b7c9d1f468. Note that SQLite
+# batch migrations that recreate ``posts`` drop the triggers with it.
+POST_SEARCH_DDL = {
+    "sqlite": [
+        "CREATE VIRTUAL TABLE posts_fts USING fts5(content, user_id, content='posts', content_rowid='id')",
+        "CREATE TRIGGER posts_fts_insert AFTER INSERT ON posts BEGIN "
+        "INSERT INTO posts_fts(rowid, content, user_id) VALUES (new.id, new.content, new.user_id); END",
+        "CREATE TRIGGER posts_fts_delete AFTER DELETE ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, content, user_id) VALUES ('delete', old.id, old.content, old.user_id); END",
+        "CREATE TRIGGER posts_fts_update AFTER UPDATE OF content, user_id ON posts BEGIN "
+        "INSERT INTO posts_fts(posts_fts, rowid, content, user_id) VALUES ('delete', old.id, old.content, old.user_id); "
+        "INSERT INTO posts_fts(rowid, content, user_id) VALUES (new.id, new.content, new.user_id); END",
+    ],
+    "postgresql": [
+        "ALTER TABLE posts ADD COLUMN search_vector tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED",
+        "CREATE INDEX ix_posts_search_vector ON posts USING gin (search_vector)",
+    ],
+}
+
+for _dialect, _statements in POST_SEARCH_DDL.items():
+    for _statement in _statements:
+        event.listen(Post.__table__, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+event.listen(Post.__table__, "after_drop", DDL("DROP TABLE IF EXISTS posts_fts").execute_if(dialect="sqlite"))
@@ -0,0 +1,48 @@
+import json
+import zlib
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, LargeBinary
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator
+from app.config import get_settings
+from app.database import Base
+
+settings = get_settings()
+
+
+class CompressedJSON(TypeDecorator):
+    """JSON stored as a zlib-compressed blob."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        data = json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+        return zlib.compress(data, settings.payload_compression_level)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return json.loads(zlib.decompress(value))
+
+
+class PostPayload(Base):
+    """
+    Bulky per-post data kept off the hot ``posts`` table: the raw platform
+    response and the metadata recorded when the post was created.
+    """
+
+    __tablename__ = "post_payloads"
+
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    platform_response = Column(CompressedJSON, nullable=True)  # Full response from platform
+    post_metadata = Column(CompressedJSON, nullable=True)  # AI generation / schedule details
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    post = relationship("Post", back_populates="payload")
+
+    def __repr__(self):
+        return f"<PostPayload(post_id={self.post_id})>"
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ProcessedEvent(Base):
+    __tablename__ = "processed_events"
+    __table_args__ = (
+        UniqueConstraint("platform", "event_type", "event_key", name="uq_processed_events_key"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # Identity of the event (e.g. facebook / comment / <comment_id>)
+    platform = Column(String, nullable=False)
+    event_type = Column(String, nullable=False)
+    event_key = Column(String, nullable=False)
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<ProcessedEvent(platform='{self.platform}', type='{self.event_type}', key='{self.event_key}')>"
@@ -0,0 +1,48 @@
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, JSON, Enum, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from app.database import Base
+import enum
+
+
+class PublishJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"  # The publish request was handled; see result
+    FAILED = "failed"
+
+
+class PublishJob(Base):
+    """A publish request accepted with 202 and carried out by the publish job workers."""
+
+    __tablename__ = "publish_jobs"
+    __table_args__ = (
+        # A client retrying with the same Idempotency-Key gets the same job
+        UniqueConstraint("user_id", "idempotency_key", name="uq_publish_jobs_idempotency_key"),
+        # Workers picking up queued jobs and jobs whose worker went away
+        Index("ix_publish_jobs_status_locked", "status", "locked_until"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    platform = Column(String, nullable=False)  # facebook, instagram
+    idempotency_key = Column(String, nullable=True)
+
+    # The validated request, replayed by the worker
+    payload = Column(JSON, nullable=False)
+
+    # Progress
+    status = Column(Enum(PublishJobStatus), default=PublishJobStatus.QUEUED, nullable=False)
+    locked_until = Column(DateTime(timezone=True), nullable=True)  # Lease of the worker running it
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="SET NULL"), nullable=True)
+    result = Column(JSON, nullable=True)  # Body the synchronous request would have returned
+    error = Column(Text, nullable=True)
+    error_status_code = Column(Integer, nullable=True)  # HTTP status the synchronous request would have failed with
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self):
+        return f"<PublishJob(id={self.id}, platform='{self.platform}', status='{self.status}')>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, ForeignKey, Enum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -13,6 +13,16 @@ class FrequencyType(enum.Enum):
 
 class ScheduledPost(Base):
     __tablename__ = "scheduled_posts"
+    __table_args__ = (
+        # Scheduler scan for due posts; partial, so paused schedules cost nothing
+        Index(
+            "ix_scheduled_posts_due", "next_execution",
+            sqlite_where=text("is_active = 1"),
+            postgresql_where=text("is_active = true")
+        ),
+        # Schedule listing, keyset-paginated on (created_at, id)
+        Index("ix_scheduled_posts_user_created", "user_id", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
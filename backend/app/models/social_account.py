@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -6,6 +6,13 @@ from app.database import Base
 
 class SocialAccount(Base):
     __tablename__ = "social_accounts"
+    __table_args__ = (
+        # One row per connected account of a user; also the conflict target for
+        # the bulk upsert on connect, and serves account lookups of a user
+        Index("uq_social_accounts_user_platform_account", "user_id", "platform", "platform_user_id", unique=True),
+        # Webhook routing: page / Instagram user ID -> connected accounts
+        Index("ix_social_accounts_platform_user", "platform", "platform_user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -44,6 +51,7 @@ class SocialAccount(Base):
     posts = relationship("Post", back_populates="social_account")
     scheduled_posts = relationship("ScheduledPost", back_populates="social_account")
     automation_rules = relationship("AutomationRule", back_populates="social_account")
+    comments = relationship("Comment", back_populates="social_account")
     
     def __repr__(self):
         return f"<SocialAccount(id={self.id}, platform='{self.platform}', username='{self.username}')>" 
\ No newline at end of file
@@ -3,6 +3,8 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from app.models.post import PostStatus, PostType
 from app.models.automation_rule import RuleType, TriggerType
+from app.models.comment import CommentReplyStatus
+from app.models.publish_job import PublishJobStatus
 
 
 class SocialAccountBase(BaseModel):
@@ -66,6 +68,8 @@ class PostResponse(PostBase):
     shares_count: int
     views_count: int
     error_message: Optional[str] = None
+    retry_count: Optional[int] = 0
+    next_retry_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
     
@@ -116,6 +120,62 @@ class AutomationRuleResponse(AutomationRuleBase):
         from_attributes = True
 
 
+class CommentResponse(BaseModel):
+    id: int
+    social_account_id: int
+    post_id: Optional[int] = None
+    platform: str
+    platform_comment_id: str
+    platform_post_id: Optional[str] = None
+    author_name: Optional[str] = None
+    message: Optional[str] = None
+    commented_at: Optional[datetime] = None
+    reply_status: CommentReplyStatus
+    reply_id: Optional[str] = None
+    reply_content: Optional[str] = None
+    replied_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class DeadLetterPostResponse(BaseModel):
+    id: int
+    post_id: int
+    social_account_id: int
+    platform: str
+    reason: str
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    replayed_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class DeadLetterReplayRequest(BaseModel):
+    ids: Optional[List[int]] = None  # Replay everything pending when omitted
+
+
+class PublishJobResponse(BaseModel):
+    id: int
+    platform: str
+    status: PublishJobStatus
+    post_id: Optional[int] = None
+    result: Optional[Dict[str, Any]] = None  # Body the synchronous request would have returned
+    error: Optional[str] = None
+    error_status_code: Optional[int] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
 # Facebook-specific schemas
 class FacebookPageInfo(BaseModel):
     id: str
@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class _AccountBudget:
+    __slots__ = ("tokens", "updated_at", "recent")
+
+    def __init__(self, tokens: float, now: float):
+        self.tokens = tokens
+        self.updated_at = now
+        # Timestamps of actions inside the sliding window
+        self.recent: Deque[float] = deque()
+
+
+class ActionLimiter:
+    """
+    Outbound rate limiter for automated actions, keyed by social account.
+
+    Two limits apply together: a token bucket (``burst`` actions at once,
+    refilled at ``rate_per_minute``) smooths out bursts, and a sliding window
+    caps the total number of actions per ``window_seconds``. Callers that are
+    denied get the number of seconds to wait, so the action can be scheduled
+    for later instead of being dropped.
+    """
+
+    def __init__(self, burst: int, rate_per_minute: float, window_seconds: int, window_max: int):
+        self.burst = burst
+        self.rate_per_second = rate_per_minute / 60
+        self.window_seconds = window_seconds
+        self.window_max = window_max
+        self._lock = threading.Lock()
+        self._accounts: Dict[int, _AccountBudget] = {}
+
+        # Metrics
+        self.allowed = 0
+        self.denied = 0
+
+    def _budget(self, social_account_id: int, now: float) -> _AccountBudget:
+        budget = self._accounts.get(social_account_id)
+        if budget is None:
+            budget = self._accounts[social_account_id] = _AccountBudget(self.burst, now)
+            return budget
+
+        # Refill the bucket and expire actions that left the window
+        budget.tokens = min(self.burst, budget.tokens + (now - budget.updated_at) * self.rate_per_second)
+        budget.updated_at = now
+        cutoff = now - self.window_seconds
+        while budget.recent and budget.recent[0] <= cutoff:
+            budget.recent.popleft()
+        return budget
+
+    def _wait_seconds(self, budget: _AccountBudget, now: float) -> float:
+        wait = 0.0
+        if budget.tokens < 1:
+            wait = (1 - budget.tokens) / self.rate_per_second if self.rate_per_second > 0 else float(self.window_seconds)
+        if self.window_max and len(budget.recent) >= self.window_max:
+            # The window frees a slot when its oldest counted action expires
+            oldest = budget.recent[len(budget.recent) - self.window_max]
+            wait = max(wait, oldest + self.window_seconds - now)
+        return wait
+
+    def acquire(self, social_account_id: int) -> float:
+        """
+        Take one action from the account's budget.
+
+        Returns:
+            0 if the action may run now, otherwise the seconds until it may be retried
+        """
+        now = time.monotonic()
+        with self._lock:
+            budget = self._budget(social_account_id, now)
+            wait = self._wait_seconds(budget, now)
+            if wait > 0:
+                self.denied += 1
+                return wait
+
+            budget.tokens -= 1
+            budget.recent.append(now)
+            self.allowed += 1
+            return 0.0
+
+    def get_budget(self, social_account_id: int) -> Dict[str, Any]:
+        """Return the account's remaining budget without consuming anything."""
+        now = time.monotonic()
+        with self._lock:
+            budget = self._budget(social_account_id, now)
+            return {
+                "social_account_id": social_account_id,
+                "tokens": round(budget.tokens, 2),
+                "burst": self.burst,
+                "rate_per_minute": round(self.rate_per_second * 60, 2),
+                "window_seconds": self.window_seconds,
+                "window_used": len(budget.recent),
+                "window_max": self.window_max,
+                "retry_after_seconds": round(self._wait_seconds(budget, now), 1),
+            }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return allow/deny counters."""
+        with self._lock:
+            accounts = len(self._accounts)
+        return {
+            "accounts": accounts,
+            "allowed": self.allowed,
+            "denied": self.denied,
+        }
+
+
+# Global action limiter instance
+action_limiter = ActionLimiter(
+    burst=settings.action_limit_burst,
+    rate_per_minute=settings.action_limit_per_minute,
+    window_seconds=settings.action_limit_window_seconds,
+    window_max=settings.action_limit_window_max
+)
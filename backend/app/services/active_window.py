@@ -0,0 +1,154 @@
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+logger = logging.getLogger(__name__)
+
+DAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# Unix epoch was a Thursday; weeks are anchored on Monday 00:00 UTC
+_EPOCH_MONDAY_OFFSET = 3 * MINUTES_PER_DAY
+
+
+def parse_hhmm(value: Optional[str], default: int) -> int:
+    """Parse "HH:MM" into minutes after midnight ("24:00" is allowed as an end time)."""
+    if not value:
+        return default
+    try:
+        hours, minutes = value.strip().split(":")[:2]
+        total = int(hours) * 60 + int(minutes)
+    except (ValueError, AttributeError):
+        logger.warning(f"Invalid active hours value {value!r}, ignoring")
+        return default
+    return min(max(total, 0), MINUTES_PER_DAY)
+
+
+class ActiveWindow:
+    """
+    Compiled active-hours/active-days constraint of an automation rule.
+
+    The rule's local schedule is expanded once into a bitmap with one bit per
+    UTC minute of the current week, converting every local interval through
+    the rule's timezone (so DST shifts are applied at compile time). Checking
+    an event is then an integer division and a single bit test; the bitmap is
+    rebuilt only when the clock moves into another week.
+    """
+
+    __slots__ = ("start_minute", "end_minute", "days", "tz", "always", "_state")
+
+    def __init__(self, start_minute: int, end_minute: int, days: Optional[Sequence[int]], tz: ZoneInfo):
+        self.start_minute = start_minute
+        self.end_minute = end_minute
+        self.days = frozenset(days) if days is not None else frozenset(range(7))
+        self.tz = tz
+        self.always = (
+            start_minute == 0 and end_minute == MINUTES_PER_DAY and len(self.days) == 7
+        )
+        # (first UTC epoch minute covered, bitmap bytes)
+        self._state: Tuple[int, bytes] = (0, b"")
+
+    def contains(self, now: Optional[datetime] = None) -> bool:
+        """Check whether ``now`` (default: current time) falls inside the window."""
+        if self.always:
+            return True
+        if not self.days:
+            return False
+
+        if now is None:
+            now = datetime.now(timezone.utc)
+        elif now.tzinfo is None:
+            now = now.replace(tzinfo=timezone.utc)
+
+        minute = int(now.timestamp() // 60)
+        week_start, bits = self._state
+        offset = minute - week_start
+        if not 0 <= offset < MINUTES_PER_WEEK:
+            week_start, bits = self._compile(minute)
+            offset = minute - week_start
+
+        return bool(bits[offset >> 3] & (1 << (offset & 7)))
+
+    def _compile(self, minute: int) -> Tuple[int, bytes]:
+        """Build the bitmap for the UTC week containing the given epoch minute."""
+        week_start = minute - (minute - _EPOCH_MONDAY_OFFSET) % MINUTES_PER_WEEK
+        week_end = week_start + MINUTES_PER_WEEK
+
+        start_utc = datetime.fromtimestamp(week_start * 60, timezone.utc)
+        first_day = start_utc.astimezone(self.tz).date() - timedelta(days=1)
+
+        bits = 0
+        for day_offset in range(9):
+            local_day = first_day + timedelta(days=day_offset)
+            if local_day.weekday() not in self.days:
+                continue
+
+            begin, end = self._interval_minutes(local_day)
+            begin, end = max(begin, week_start), min(end, week_end)
+            if begin < end:
+                bits |= ((1 << (end - begin)) - 1) << (begin - week_start)
+
+        state = (week_start, bits.to_bytes(MINUTES_PER_WEEK // 8, "little"))
+        self._state = state
+        return state
+
+    def _interval_minutes(self, local_day: date) -> Tuple[int, int]:
+        """Convert the local active interval starting on ``local_day`` to UTC epoch minutes."""
+        end_day = local_day
+        if self.end_minute <= self.start_minute:
+            # Overnight window, e.g. 22:00-06:00
+            end_day = local_day + timedelta(days=1)
+
+        begin = self._local_to_epoch_minute(local_day, self.start_minute)
+        end = self._local_to_epoch_minute(end_day, self.end_minute)
+        return begin, end
+
+    def _local_to_epoch_minute(self, local_day: date, minute_of_day: int) -> int:
+        day = local_day + timedelta(days=minute_of_day // MINUTES_PER_DAY)
+        minute_of_day %= MINUTES_PER_DAY
+        wall = datetime.combine(day, time(minute_of_day // 60, minute_of_day % 60))
+        epoch_minute = int(wall.replace(tzinfo=self.tz).timestamp() // 60)
+
+        if self._wall_time(epoch_minute) != wall:
+            # Wall time skipped by a DST jump: the edge moves to the jump itself
+            epoch_minute = int(wall.replace(tzinfo=self.tz, fold=1).timestamp() // 60)
+            while self._wall_time(epoch_minute) < wall:
+                epoch_minute += 1
+        return epoch_minute
+
+    def _wall_time(self, epoch_minute: int) -> datetime:
+        return datetime.fromtimestamp(epoch_minute * 60, self.tz).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=4096)
+def compile_active_window(
+    active_hours_start: Optional[str],
+    active_hours_end: Optional[str],
+    active_days: Optional[Tuple[str, ...]],
+    timezone_name: Optional[str]
+) -> ActiveWindow:
+    """
+    Compile (and cache) the active window for a rule's time constraints.
+
+    The cache is keyed on the constraint values themselves, so editing a rule
+    transparently yields a freshly compiled window.
+    """
+    try:
+        tz = ZoneInfo(timezone_name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        logger.warning(f"Unknown timezone {timezone_name!r}, using UTC")
+        tz = ZoneInfo("UTC")
+
+    days = None
+    if active_days:
+        days = [DAY_NAMES.index(day.lower()) for day in active_days if day.lower() in DAY_NAMES]
+
+    return ActiveWindow(
+        start_minute=parse_hhmm(active_hours_start, 0),
+        end_minute=parse_hhmm(active_hours_end, MINUTES_PER_DAY),
+        days=days,
+        tz=tz
+    )
@@ -0,0 +1,169 @@
+import logging
+from typing import Optional
+from app.database import SessionLocal
+from app.models.social_account import SocialAccount
+from app.models.automation_rule import AutomationRule, RuleType, TriggerType
+from app.services.groq_service import groq_service
+from app.services.event_dedup import event_deduplicator
+from app.services.rule_counters import rule_counters
+from app.services.action_limiter import action_limiter
+from app.services.deferred_events import deferred_events
+from app.services.comment_store import comment_store
+from app.services.reply_adapters import REPLY_ADAPTERS
+from app.services.social_events import SocialEvent
+from app.models.comment import CommentReplyStatus
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_REPLY = "Thank you for your comment! We appreciate your engagement. 😊"
+
+
+class AutomationService:
+    """Runs automation rules (auto-reply, etc.) against incoming social events."""
+
+    async def handle_event(self, event: SocialEvent):
+        """
+        Process a single event taken off the event queue.
+
+        Args:
+            event: Normalized comment or mention event from any platform
+        """
+        adapter = REPLY_ADAPTERS.get(event.platform)
+        if adapter is None:
+            logger.debug(f"No reply adapter for {event.platform}, ignoring {event.kind} {event.object_id}")
+            return
+
+        # Never answer the account's own comments (including our own replies)
+        if event.is_own:
+            return
+
+        # Meta redelivers webhooks and polling windows overlap (deferred events were already claimed)
+        if not event.deferrals and not await event_deduplicator.claim(event.platform, event.kind, event.object_id):
+            logger.debug(f"Skipping duplicate {event.platform} {event.kind} event {event.object_id}")
+            return
+
+        try:
+            await self.run_auto_reply(event)
+        except Exception:
+            # Not handled: let a redelivery or the next poll try again
+            await event_deduplicator.release(event.platform, event.kind, event.object_id)
+            raise
+        finally:
+            if event.deferrals:
+                await deferred_events.complete(event)
+
+    async def run_auto_reply(self, event: SocialEvent):
+        """Store the event, then reply with the first matching auto-reply rule for the account."""
+        adapter = REPLY_ADAPTERS[event.platform]
+        db = SessionLocal()
+        try:
+            accounts = db.query(SocialAccount).filter(
+                SocialAccount.platform == event.platform,
+                SocialAccount.platform_user_id == event.account_id,
+                SocialAccount.is_connected == True
+            ).order_by(SocialAccount.id).all()
+
+            if not accounts:
+                logger.debug(f"No connected {event.platform} account {event.account_id}, ignoring {event.kind} {event.object_id}")
+                return
+
+            rules = db.query(AutomationRule).filter(
+                AutomationRule.social_account_id.in_([account.id for account in accounts]),
+                AutomationRule.rule_type == RuleType.AUTO_REPLY,
+                AutomationRule.is_active == True
+            ).order_by(AutomationRule.id).all()
+
+            tokens = {account.id: account.access_token for account in accounts}
+            social_account_id = rules[0].social_account_id if rules else accounts[0].id
+
+            text = event.text
+            if rules and not text:
+                text = await adapter.load_text(event, tokens[social_account_id])
+
+            comment_store.record_comment(
+                social_account_id=social_account_id,
+                platform=event.platform,
+                platform_comment_id=event.object_id,
+                platform_post_id=event.post_id,
+                parent_comment_id=event.parent_id,
+                author_id=event.author_id,
+                author_name=event.author_name,
+                message=text,
+                commented_at=event.created_at
+            )
+
+            for rule in rules:
+                if not rule.can_execute() or not self.matches_trigger(rule, text):
+                    continue
+
+                # Keep the page under platform spam limits; retry once budget frees up
+                wait = action_limiter.acquire(rule.social_account_id)
+                if wait:
+                    event.deferrals += 1
+                    await deferred_events.defer(event, wait)
+                    logger.info(
+                        f"⏳ Action budget exhausted for account {rule.social_account_id}, "
+                        f"deferring {event.kind} {event.object_id} by {wait:.0f}s"
+                    )
+                    return
+
+                # Counts the execution and enforces daily_limit across workers
+                if not rule_counters.reserve(rule):
+                    logger.info(f"Rule {rule.id} reached its daily limit, skipping {event.kind} {event.object_id}")
+                    continue
+
+                reply_content = await self.generate_reply(text, (rule.actions or {}).get("response_template"))
+                result = await adapter.send_reply(event, reply_content, tokens[rule.social_account_id])
+
+                rule_counters.record_outcome(rule.id, result["success"], result.get("error"))
+                if result["success"]:
+                    logger.info(f"💬 Auto-replied to {event.platform} {event.kind} {event.object_id} (rule {rule.id})")
+                    comment_store.record_outcome(
+                        event.platform, event.object_id, CommentReplyStatus.REPLIED,
+                        reply_id=result.get("reply_id"),
+                        reply_content=reply_content
+                    )
+                else:
+                    logger.error(f"Auto-reply failed for {event.platform} {event.kind} {event.object_id}: {result.get('error')}")
+                    comment_store.record_outcome(
+                        event.platform, event.object_id, CommentReplyStatus.FAILED,
+                        error_message=result.get("error")
+                    )
+
+                # One reply per comment, even when several rules match
+                break
+            else:
+                comment_store.record_outcome(event.platform, event.object_id, CommentReplyStatus.SKIPPED)
+
+        except Exception as e:
+            logger.error(f"Error running auto-reply for {event.platform} {event.kind} {event.object_id}: {e}")
+            raise
+        finally:
+            db.close()
+
+    async def generate_reply(self, text: str, context: Optional[str] = None) -> str:
+        """Generate the reply text with Groq, falling back to a generic thank-you."""
+        reply_result = await groq_service.generate_auto_reply(text, context)
+        if not reply_result["success"]:
+            return FALLBACK_REPLY
+        return reply_result["content"]
+
+    def matches_trigger(self, rule: AutomationRule, text: Optional[str]) -> bool:
+        """Check the rule's trigger conditions against the event text."""
+        conditions = rule.trigger_conditions or {}
+        text = (text or "").lower()
+
+        if rule.trigger_type == TriggerType.KEYWORD:
+            keywords = conditions.get("keywords") or []
+            return any(keyword.lower() in text for keyword in keywords)
+
+        if rule.trigger_type == TriggerType.HASHTAG:
+            hashtags = conditions.get("hashtags") or []
+            return any(f"#{tag.lower().lstrip('#')}" in text for tag in hashtags)
+
+        # Engagement based rules (e.g. {"event": "comment"}) match every comment
+        return True
+
+
+# Create a singleton instance
+automation_service = AutomationService()
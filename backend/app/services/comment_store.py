@@ -0,0 +1,307 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+from sqlalchemy import and_, bindparam, select, update
+from app.config import get_settings
+from app.database import insert_ignore_duplicates
+from app.services.db_writer import db_writer
+from app.models.comment import Comment, CommentReplyStatus
+from app.models.post import Post
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+comments_table = Comment.__table__
+
+
+def parse_event_time(value: Union[int, float, str, None]) -> Optional[datetime]:
+    """Parse a comment timestamp from a webhook (unix seconds) or the Graph API (ISO 8601)."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, timezone.utc)
+    for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+class CommentStore:
+    """
+    Buffered writer for the comments table.
+
+    Incoming comments and auto-reply outcomes are collected in memory and
+    written in one transaction per batch: a multi-row insert (duplicates
+    ignored) followed by a single executemany UPDATE for outcomes. An outcome
+    for a comment still waiting in the buffer is merged into the pending row,
+    so the common path costs no statement of its own.
+
+    Recording never writes: a full buffer only wakes the flush loop, so a
+    failing write can't abort the auto-reply that recorded the comment. A
+    batch that fails is retried one row at a time, and a row that keeps
+    failing (e.g. its account was deleted) is dropped after
+    ``WRITE_BEHIND_MAX_ATTEMPTS`` flushes instead of holding up the rest.
+    """
+
+    def __init__(self, flush_interval: float, batch_size: int):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.running = False
+        self._lock = threading.Lock()
+        self._inserts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._outcomes: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # ("comment" | "outcome", key) -> failed writes so far
+        self._attempts: Dict[Tuple[str, Tuple[str, str]], int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+
+        # Metrics
+        self.rows_inserted = 0
+        self.outcomes_updated = 0
+        self.flushes = 0
+        self.dropped = 0
+
+    async def start(self):
+        """Start the periodic flush loop."""
+        if self.running:
+            return
+
+        self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._flush_requested = asyncio.Event()
+        logger.info(f"🗂️ Comment store flusher started (every {self.flush_interval}s)")
+
+        while self.running:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            try:
+                await self.flush_async()
+            except Exception as e:
+                logger.error(f"Error flushing comments: {e}")
+
+    def stop(self):
+        """Stop the loop and write out whatever is still buffered."""
+        self.running = False
+        self._loop = None
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Error flushing comments on shutdown: {e}")
+        logger.info("🛑 Comment store flusher stopped")
+
+    def record_comment(
+        self,
+        social_account_id: int,
+        platform: str,
+        platform_comment_id: str,
+        platform_post_id: Optional[str] = None,
+        parent_comment_id: Optional[str] = None,
+        author_id: Optional[str] = None,
+        author_name: Optional[str] = None,
+        message: Optional[str] = None,
+        commented_at: Optional[datetime] = None
+    ):
+        """Buffer a newly received comment (stored as pending)."""
+        key = (platform, str(platform_comment_id))
+        with self._lock:
+            self._inserts.setdefault(key, {
+                "social_account_id": social_account_id,
+                "post_id": None,
+                "platform": platform,
+                "platform_comment_id": key[1],
+                "platform_post_id": platform_post_id,
+                "parent_comment_id": parent_comment_id,
+                "author_id": author_id,
+                "author_name": author_name,
+                "message": message,
+                "commented_at": commented_at,
+                "reply_status": CommentReplyStatus.PENDING,
+                "reply_id": None,
+                "reply_content": None,
+                "replied_at": None,
+                "error_message": None,
+            })
+            buffered = len(self._inserts)
+
+        if buffered >= self.batch_size:
+            self._request_flush()
+
+    def _request_flush(self):
+        """Wake the flush loop early (safe from any thread)."""
+        loop, flush_requested = self._loop, self._flush_requested
+        if loop is not None and flush_requested is not None:
+            loop.call_soon_threadsafe(flush_requested.set)
+
+    def record_outcome(
+        self,
+        platform: str,
+        platform_comment_id: str,
+        reply_status: CommentReplyStatus,
+        reply_id: Optional[str] = None,
+        reply_content: Optional[str] = None,
+        error_message: Optional[str] = None
+    ):
+        """Record the auto-reply outcome for a comment."""
+        key = (platform, str(platform_comment_id))
+        outcome = {
+            "reply_status": reply_status,
+            "reply_id": reply_id,
+            "reply_content": reply_content,
+            "replied_at": datetime.now(timezone.utc) if reply_status == CommentReplyStatus.REPLIED else None,
+            "error_message": error_message,
+        }
+
+        with self._lock:
+            pending_row = self._inserts.get(key)
+            if pending_row is not None:
+                pending_row.update(outcome)
+            else:
+                self._outcomes[key] = outcome
+
+    async def flush_async(self) -> int:
+        """
+        Write buffered comments and outcomes in a single transaction.
+
+        If the batch fails its rows are written one at a time; those that
+        still fail go back into the buffer (or are dropped, see above).
+
+        Returns:
+            Number of rows written (inserted + updated)
+        """
+        inserts, outcomes = self._take()
+        if not inserts and not outcomes:
+            return 0
+
+        try:
+            await db_writer.execute_async(self._write_job(inserts, outcomes))
+            errors = {}
+        except Exception as e:
+            self._batch_failed(inserts, outcomes, e)
+            errors = await db_writer.execute_each_async(self._row_jobs(inserts, outcomes))
+
+        self.flushes += 1
+        return self._settle(inserts, outcomes, errors)
+
+    def flush(self) -> int:
+        """``flush_async`` for shutdown, when the event loop is going away: blocks until written."""
+        inserts, outcomes = self._take()
+        if not inserts and not outcomes:
+            return 0
+
+        try:
+            db_writer.execute(self._write_job(inserts, outcomes))
+            errors = {}
+        except Exception as e:
+            self._batch_failed(inserts, outcomes, e)
+            errors = db_writer.execute_each(self._row_jobs(inserts, outcomes))
+
+        self.flushes += 1
+        return self._settle(inserts, outcomes, errors)
+
+    def _take(self):
+        with self._lock:
+            inserts, self._inserts = self._inserts, {}
+            outcomes, self._outcomes = self._outcomes, {}
+        return inserts, outcomes
+
+    def _batch_failed(self, inserts, outcomes, error: Exception):
+        logger.warning(f"Comment batch of {len(inserts) + len(outcomes)} rows failed ({error}), retrying row by row")
+
+    def _row_jobs(self, inserts, outcomes) -> Dict[Any, Any]:
+        """One write job per row, to find the rows at fault."""
+        return {
+            **{("comment", key): self._write_job({key: row}, {}) for key, row in inserts.items()},
+            **{("outcome", key): self._write_job({}, {key: outcome}) for key, outcome in outcomes.items()},
+        }
+
+    def _write_job(self, inserts: Dict[Tuple[str, str], Dict[str, Any]], outcomes: Dict[Tuple[str, str], Dict[str, Any]]):
+        rows: List[Dict[str, Any]] = list(inserts.values())
+        updates = [
+            {"b_platform": platform, "b_comment_id": comment_id, **{f"b_{k}": v for k, v in outcome.items()}}
+            for (platform, comment_id), outcome in outcomes.items()
+        ]
+
+        def write(conn):
+            if rows:
+                # Link comments to posts created through the dashboard
+                post_ids = {row["platform_post_id"] for row in rows if row["platform_post_id"]}
+                if post_ids:
+                    post_map = dict(conn.execute(
+                        select(Post.platform_post_id, Post.id).where(Post.platform_post_id.in_(post_ids))
+                    ).all())
+                    for row in rows:
+                        row["post_id"] = post_map.get(row["platform_post_id"])
+
+                conn.execute(insert_ignore_duplicates(comments_table), rows)
+
+            if updates:
+                c = comments_table.c
+                conn.execute(
+                    update(comments_table)
+                    .where(and_(
+                        c.platform == bindparam("b_platform"),
+                        c.platform_comment_id == bindparam("b_comment_id")
+                    ))
+                    .values(
+                        reply_status=bindparam("b_reply_status"),
+                        reply_id=bindparam("b_reply_id"),
+                        reply_content=bindparam("b_reply_content"),
+                        replied_at=bindparam("b_replied_at"),
+                        error_message=bindparam("b_error_message"),
+                    ),
+                    updates
+                )
+
+        return write
+
+    def _settle(self, inserts, outcomes, errors: Dict[Any, BaseException]) -> int:
+        """Count what was written; put failed rows back for the next flush, or drop them."""
+        written = {"comment": 0, "outcome": 0}
+        with self._lock:
+            for kind, buffer, items in (("comment", self._inserts, inserts), ("outcome", self._outcomes, outcomes)):
+                for key, value in items.items():
+                    error = errors.get((kind, key))
+                    if error is None:
+                        self._attempts.pop((kind, key), None)
+                        written[kind] += 1
+                        continue
+
+                    attempts = self._attempts.get((kind, key), 0) + 1
+                    if attempts >= settings.write_behind_max_attempts:
+                        self._attempts.pop((kind, key), None)
+                        self.dropped += 1
+                        logger.error(f"Dropping {kind} {key} after {attempts} failed writes: {error}")
+                    else:
+                        self._attempts[(kind, key)] = attempts
+                        # Newer values recorded meanwhile win
+                        buffer.setdefault(key, value)
+
+        self.rows_inserted += written["comment"]
+        self.outcomes_updated += written["outcome"]
+        return written["comment"] + written["outcome"]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return buffer sizes and write counters."""
+        with self._lock:
+            buffered = len(self._inserts) + len(self._outcomes)
+        return {
+            "buffered": buffered,
+            "flushes": self.flushes,
+            "rows_inserted": self.rows_inserted,
+            "outcomes_updated": self.outcomes_updated,
+            "dropped": self.dropped,
+        }
+
+
+# Global comment store instance
+comment_store = CommentStore(
+    flush_interval=settings.comment_store_flush_interval,
+    batch_size=settings.comment_store_batch_size
+)
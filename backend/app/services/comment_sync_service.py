@@ -0,0 +1,247 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+import httpx
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.automation_rule import AutomationRule, RuleType
+from app.models.comment_sync_cursor import CommentSyncCursor
+from app.models.post import Post, PostStatus
+from app.models.social_account import SocialAccount
+from app.services.event_queue import event_queue
+from app.services.facebook_service import facebook_service
+from app.services.social_events import COMMENT, SocialEvent
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def parse_graph_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse a Graph API timestamp such as 2024-01-01T12:00:00+0000."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z")
+    except ValueError:
+        return None
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize datetimes read back from the database (SQLite drops tzinfo)."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+class CommentSyncService:
+    """
+    Incremental comment polling for pages that don't deliver webhooks.
+
+    Each published post keeps a checkpoint (newest comment time plus the
+    Graph paging cursor), so a sync run only pages through comments added
+    since the previous run. New comments are fed to the event queue as the
+    same SocialEvents that webhook deliveries are normalized into.
+    """
+
+    def __init__(self):
+        self.running = False
+        self.check_interval = settings.comment_sync_interval
+
+        # Throughput totals across runs
+        self.total_comments = 0
+        self.total_api_calls = 0
+        self.total_seconds = 0.0
+        self.last_run: Optional[Dict[str, Any]] = None
+
+    async def start(self):
+        """Start the periodic sync loop."""
+        if self.running:
+            return
+        if not settings.comment_sync_enabled:
+            logger.info("Comment sync disabled (COMMENT_SYNC_ENABLED=false)")
+            return
+
+        self.running = True
+        logger.info("🔁 Comment sync service started")
+
+        while self.running:
+            try:
+                await self.sync_all()
+            except Exception as e:
+                logger.error(f"Error in comment sync loop: {e}")
+            await asyncio.sleep(self.check_interval)
+
+    def stop(self):
+        """Stop the sync loop."""
+        self.running = False
+        logger.info("🛑 Comment sync service stopped")
+
+    async def sync_all(self) -> Dict[str, Any]:
+        """Sync new comments for every recent post on accounts with active auto-reply rules."""
+        started = time.perf_counter()
+        run = {"posts": 0, "comments": 0, "api_calls": 0}
+
+        db: Session = SessionLocal()
+        try:
+            cutoff = datetime.utcnow() - timedelta(days=settings.comment_sync_lookback_days)
+            posts = db.query(Post).join(SocialAccount).filter(
+                SocialAccount.platform == "facebook",
+                SocialAccount.is_connected == True,
+                Post.status == PostStatus.PUBLISHED,
+                Post.platform_post_id.isnot(None),
+                Post.created_at >= cutoff,
+                SocialAccount.id.in_(
+                    db.query(AutomationRule.social_account_id).filter(
+                        AutomationRule.rule_type == RuleType.AUTO_REPLY,
+                        AutomationRule.is_active == True
+                    )
+                )
+            ).all()
+
+            cursors = {
+                (cursor.social_account_id, cursor.platform_post_id): cursor
+                for cursor in db.query(CommentSyncCursor).filter(
+                    CommentSyncCursor.platform_post_id.in_([post.platform_post_id for post in posts])
+                )
+            } if posts else {}
+
+            async with httpx.AsyncClient() as client:
+                for post in posts:
+                    key = (post.social_account_id, post.platform_post_id)
+                    cursor = cursors.get(key)
+                    if cursor is None:
+                        cursor = CommentSyncCursor(
+                            social_account_id=post.social_account_id,
+                            platform_post_id=post.platform_post_id
+                        )
+                        db.add(cursor)
+
+                    comments, calls = await self.sync_post(client, post.social_account, cursor)
+                    run["posts"] += 1
+                    run["comments"] += comments
+                    run["api_calls"] += calls
+
+            # One commit for all checkpoints of the run
+            db.commit()
+
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        elapsed = time.perf_counter() - started
+        self.total_comments += run["comments"]
+        self.total_api_calls += run["api_calls"]
+        self.total_seconds += elapsed
+        self.last_run = {
+            **run,
+            "seconds": round(elapsed, 3),
+            "finished_at": datetime.utcnow().isoformat(),
+            **self._rates(run["comments"], run["api_calls"], elapsed)
+        }
+
+        if run["posts"]:
+            logger.info(
+                f"🔁 Comment sync: {run['comments']} new comments on {run['posts']} posts, "
+                f"{run['api_calls']} Graph calls in {elapsed:.2f}s "
+                f"({self.last_run['comments_per_sec']} comments/s, "
+                f"{self.last_run['calls_per_1k_comments']} calls/1k comments)"
+            )
+        return self.last_run
+
+    async def sync_post(self, client: httpx.AsyncClient, account: SocialAccount, cursor: CommentSyncCursor):
+        """
+        Fetch comments newer than the post's checkpoint and enqueue them.
+
+        Returns:
+            Tuple of (new comments enqueued, Graph API calls made)
+        """
+        since = as_utc(cursor.since)
+        after = cursor.after_cursor
+        newest = since
+        comments_enqueued = 0
+        calls = 0
+
+        while True:
+            result = await facebook_service.get_comments(
+                cursor.platform_post_id,
+                account.access_token,
+                after=after,
+                client=client
+            )
+            calls += 1
+
+            if not result["success"]:
+                if after and cursor.after_cursor:
+                    # Stale paging cursor: restart from the oldest comment and rely on `since`
+                    logger.warning(f"Resetting comment cursor for post {cursor.platform_post_id}: {result.get('error')}")
+                    cursor.after_cursor = None
+                    after = None
+                    continue
+                return comments_enqueued, calls
+
+            for comment in result["comments"]:
+                created = parse_graph_time(comment.get("created_time"))
+                # created_time has second resolution: re-read the checkpoint's
+                # second and let the deduplicator drop what was already seen
+                if since and created and created < since:
+                    continue
+
+                author = comment.get("from") or {}
+                queued = await event_queue.enqueue(SocialEvent(
+                    platform="facebook",
+                    kind=COMMENT,
+                    account_id=account.platform_user_id,
+                    object_id=comment.get("id"),
+                    post_id=cursor.platform_post_id,
+                    text=comment.get("message") or "",
+                    author_id=author.get("id"),
+                    author_name=author.get("name"),
+                    created_at=created,
+                    source="poll"
+                ))
+                if not queued:
+                    # Keep the old checkpoint; the next run re-reads this window
+                    # and the deduplicator drops what was already queued.
+                    logger.warning(f"Event queue full, deferring comment sync for post {cursor.platform_post_id}")
+                    return comments_enqueued, calls
+
+                comments_enqueued += 1
+                if created and (newest is None or created > newest):
+                    newest = created
+
+            if result.get("after"):
+                after = result["after"]
+            if not result.get("has_next"):
+                break
+
+        cursor.since = newest
+        cursor.after_cursor = after
+        cursor.last_synced_at = datetime.utcnow()
+        return comments_enqueued, calls
+
+    @staticmethod
+    def _rates(comments: int, calls: int, seconds: float) -> Dict[str, Optional[float]]:
+        return {
+            "comments_per_sec": round(comments / seconds, 2) if seconds > 0 else None,
+            "calls_per_1k_comments": round(calls * 1000 / comments, 1) if comments else None
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return throughput totals and the last run summary."""
+        return {
+            "enabled": settings.comment_sync_enabled,
+            "running": self.running,
+            "total_comments": self.total_comments,
+            "total_api_calls": self.total_api_calls,
+            **self._rates(self.total_comments, self.total_api_calls, self.total_seconds),
+            "last_run": self.last_run
+        }
+
+
+# Global comment sync instance
+comment_sync_service = CommentSyncService()
@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+from sqlalchemy.engine import Connection, Engine
+from app.config import get_settings
+from app.database import write_engine
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+WriteJob = Callable[[Connection], Any]
+
+
+class SerializedWriter:
+    """
+    Single writer thread for background writes.
+
+    Write-behind services (comment store, rule counters, event dedup) hand
+    their statements to this thread instead of each opening a transaction.
+    Whatever has queued up while the previous commit ran is written in one
+    transaction, so many small writes cost one commit, and SQLite's single
+    write lock is taken by one connection instead of being fought over.
+    Each job runs in its own SAVEPOINT, so a failing job is rolled back and
+    reported to its caller without affecting the rest of the batch.
+    """
+
+    def __init__(self, engine: Engine, max_batch: int, max_delay: float):
+        self.engine = engine
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: "queue.Queue[Tuple[WriteJob, Future]]" = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+        # Metrics
+        self.jobs = 0
+        self.commits = 0
+        self.failed_jobs = 0
+
+    def _ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+                logger.info("✍️ Database writer started")
+
+    def stop(self, timeout: float = 10):
+        """Write out queued jobs and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+        logger.info("🛑 Database writer stopped")
+
+    def submit(self, job: WriteJob) -> Future:
+        """Queue a job; the future resolves with its return value once committed."""
+        future: Future = Future()
+        self._queue.put((job, future))
+        self._ensure_started()
+        return future
+
+    def execute(self, job: WriteJob) -> Any:
+        """Run a job on the writer and block until it is committed."""
+        return self.submit(job).result()
+
+    async def execute_async(self, job: WriteJob) -> Any:
+        """Run a job on the writer without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(job))
+
+    def execute_each(self, jobs: Dict[Hashable, WriteJob]) -> Dict[Hashable, BaseException]:
+        """
+        Run jobs on the writer, each in its own savepoint, and block until committed.
+
+        Returns:
+            The error of every job that failed, by key
+        """
+        futures = {key: self.submit(job) for key, job in jobs.items()}
+        return {key: future.exception() for key, future in futures.items() if future.exception() is not None}
+
+    async def execute_each_async(self, jobs: Dict[Hashable, WriteJob]) -> Dict[Hashable, BaseException]:
+        """``execute_each`` without blocking the event loop."""
+        keys = list(jobs)
+        results = await asyncio.gather(
+            *(asyncio.wrap_future(self.submit(jobs[key])) for key in keys), return_exceptions=True
+        )
+        return {key: result for key, result in zip(keys, results) if isinstance(result, BaseException)}
+
+    def _next_batch(self) -> Tuple[List[Tuple[WriteJob, Future]], bool]:
+        item = self._queue.get()
+        if item is None:
+            return [], True
+
+        batch = [item]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            try:
+                remaining = deadline - time.monotonic()
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _run(self):
+        stopping = False
+        while not stopping or not self._queue.empty():
+            batch, stop = self._next_batch()
+            stopping = stopping or stop
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: List[Tuple[WriteJob, Future]]):
+        # Skip jobs whose awaiter was cancelled; the rest can no longer be cancelled
+        batch = [(job, future) for job, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        results: List[Tuple[Future, Any, BaseException]] = []
+        try:
+            with self.engine.begin() as conn:
+                for job, future in batch:
+                    savepoint = conn.begin_nested()
+                    try:
+                        value = job(conn)
+                        savepoint.commit()
+                        results.append((future, value, None))
+                    except Exception as e:
+                        savepoint.rollback()
+                        results.append((future, None, e))
+        except Exception as e:
+            # The commit itself failed; nothing in the batch was written
+            logger.error(f"Database writer commit failed for {len(batch)} jobs: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            self.failed_jobs += len(batch)
+            return
+
+        self.commits += 1
+        self.jobs += len(batch)
+        for future, value, error in results:
+            if error is not None:
+                self.failed_jobs += 1
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(value)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return queue depth and commit coalescing counters."""
+        return {
+            "queued": self._queue.qsize(),
+            "jobs": self.jobs,
+            "commits": self.commits,
+            "jobs_per_commit": round(self.jobs / self.commits, 2) if self.commits else 0,
+            "failed_jobs": self.failed_jobs,
+        }
+
+
+# Global database writer instance
+db_writer = SerializedWriter(
+    engine=write_engine,
+    max_batch=settings.db_writer_max_batch,
+    max_delay=settings.db_writer_max_delay
+)
@@ -0,0 +1,161 @@
+import asyncio
+import dataclasses
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from sqlalchemy import delete, or_, select, update
+from app.config import get_settings
+from app.database import upsert
+from app.models.deferred_event import DeferredEvent
+from app.services.db_writer import db_writer
+from app.services.event_queue import event_queue
+from app.services.social_events import SocialEvent
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+deferred_events_table = DeferredEvent.__table__
+
+
+def _dump(event: SocialEvent) -> Dict[str, Any]:
+    payload = dataclasses.asdict(event)
+    if event.created_at is not None:
+        payload["created_at"] = event.created_at.isoformat()
+    return payload
+
+
+def _load(payload: Dict[str, Any]) -> SocialEvent:
+    payload = dict(payload)
+    if payload.get("created_at"):
+        payload["created_at"] = datetime.fromisoformat(payload["created_at"])
+    return SocialEvent(**payload)
+
+
+class DeferredEventStore:
+    """
+    Durable schedule for events postponed by the action limiter.
+
+    A deferred event was already claimed by the deduplicator, so neither a
+    redelivery nor the polling fallback would bring it back if it only
+    lived in memory. It is written to ``deferred_events`` with its due time
+    instead, and a poll loop puts due events back on the event queue. Rows
+    are claimed under a lease, so they survive restarts and two instances
+    never replay the same event; a row is deleted once its event was handled.
+    """
+
+    def __init__(self, poll_interval: float, lease_seconds: float, batch_size: int = 100):
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.batch_size = batch_size
+        self.running = False
+
+        # Metrics
+        self.deferred = 0
+        self.replayed = 0
+        self.completed = 0
+
+    async def start(self):
+        """Start the loop that puts due events back on the event queue."""
+        if self.running:
+            return
+
+        self.running = True
+        logger.info(f"⏳ Deferred event poller started (every {self.poll_interval}s)")
+
+        while self.running:
+            try:
+                await self.enqueue_due()
+            except Exception as e:
+                logger.error(f"Error replaying deferred events: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    def stop(self):
+        """Stop the loop; pending events stay in the table for the next start."""
+        self.running = False
+        logger.info("🛑 Deferred event poller stopped")
+
+    async def defer(self, event: SocialEvent, delay: float):
+        """Schedule an event to be handled again in ``delay`` seconds."""
+        stmt = upsert(
+            deferred_events_table,
+            ["platform", "event_type", "event_key"],
+            ("payload", "due_at", "locked_until")
+        ).values(
+            platform=event.platform,
+            event_type=event.kind,
+            event_key=str(event.object_id),
+            payload=_dump(event),
+            due_at=datetime.utcnow() + timedelta(seconds=delay),
+            locked_until=None
+        )
+        await db_writer.execute_async(lambda conn: conn.execute(stmt))
+        self.deferred += 1
+
+    async def complete(self, event: SocialEvent):
+        """Forget a replayed event once handled (unless handling deferred it again)."""
+        c = deferred_events_table.c
+        stmt = delete(deferred_events_table).where(
+            c.platform == event.platform,
+            c.event_type == event.kind,
+            c.event_key == str(event.object_id),
+            c.locked_until.isnot(None)
+        )
+        await db_writer.execute_async(lambda conn: conn.execute(stmt))
+        self.completed += 1
+
+    async def enqueue_due(self) -> int:
+        """
+        Claim due events and put them back on the event queue.
+
+        Returns:
+            Number of events queued
+        """
+        events = await db_writer.execute_async(self._claim_due)
+        unqueued: List[int] = []
+        for row_id, payload in events:
+            if not await event_queue.enqueue(_load(payload)):
+                unqueued.append(row_id)
+
+        if unqueued:
+            # Queue full or stopped: leave them for the next poll
+            stmt = update(deferred_events_table).where(
+                deferred_events_table.c.id.in_(unqueued)
+            ).values(locked_until=None)
+            await db_writer.execute_async(lambda conn: conn.execute(stmt))
+
+        queued = len(events) - len(unqueued)
+        self.replayed += queued
+        return queued
+
+    def _claim_due(self, conn) -> List[tuple]:
+        now = datetime.utcnow()
+        c = deferred_events_table.c
+        unlocked = or_(c.locked_until.is_(None), c.locked_until < now)
+        rows = conn.execute(
+            select(c.id, c.payload).where(c.due_at <= now, unlocked).order_by(c.due_at).limit(self.batch_size)
+        ).all()
+
+        claimed = []
+        for row_id, payload in rows:
+            # Conditional, so another instance can't claim the same row
+            if conn.execute(
+                update(deferred_events_table).where(c.id == row_id, unlocked)
+                .values(locked_until=now + timedelta(seconds=self.lease_seconds))
+            ).rowcount:
+                claimed.append((row_id, payload))
+        return claimed
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return deferral and replay counters."""
+        return {
+            "deferred": self.deferred,
+            "replayed": self.replayed,
+            "completed": self.completed,
+        }
+
+
+# Global deferred event store instance
+deferred_events = DeferredEventStore(
+    poll_interval=settings.deferred_event_poll_interval,
+    lease_seconds=settings.deferred_event_lease_seconds
+)
@@ -0,0 +1,108 @@
+import logging
+from collections import OrderedDict
+from sqlalchemy import delete
+from app.config import get_settings
+from app.database import insert_ignore_duplicates
+from app.models.processed_event import ProcessedEvent
+from app.services.db_writer import db_writer
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+processed_events_table = ProcessedEvent.__table__
+
+
+class EventDeduplicator:
+    """
+    Idempotency guard for comment/mention events.
+
+    Recently seen keys are kept in a bounded LRU so redeliveries are dropped
+    without touching the database; the unique key on ``processed_events``
+    makes the claim durable across restarts and between concurrent workers.
+    Claims go through the database writer, so a burst of events costs one
+    commit rather than one per event.
+    """
+
+    def __init__(self, cache_size: int):
+        self.cache_size = cache_size
+        self._recent: OrderedDict = OrderedDict()
+
+        # Metrics
+        self.cache_hits = 0
+        self.db_hits = 0
+        self.claimed = 0
+        self.released = 0
+
+    def _remember(self, key: tuple):
+        self._recent[key] = True
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.cache_size:
+            self._recent.popitem(last=False)
+
+    async def claim(self, platform: str, event_type: str, event_key: str) -> bool:
+        """
+        Claim an event for processing.
+
+        Returns:
+            True the first time an event is seen, False for duplicates
+        """
+        key = (platform, event_type, str(event_key))
+        if key in self._recent:
+            self._recent.move_to_end(key)
+            self.cache_hits += 1
+            return False
+
+        # Remember before the insert so a concurrent redelivery is dropped early
+        self._remember(key)
+
+        stmt = insert_ignore_duplicates(processed_events_table).values(
+            platform=platform, event_type=event_type, event_key=key[2]
+        )
+        try:
+            inserted = await db_writer.execute_async(lambda conn: conn.execute(stmt).rowcount)
+        except Exception as e:
+            # Fail open: a missed duplicate is better than a dropped event
+            self._recent.pop(key, None)
+            logger.error(f"Error recording processed event {key}: {e}")
+            inserted = 1
+
+        if not inserted:
+            self.db_hits += 1
+            return False
+
+        self.claimed += 1
+        return True
+
+    async def release(self, platform: str, event_type: str, event_key: str):
+        """
+        Give up a claim whose processing failed, so a redelivery or the
+        polling fallback can process the event again.
+        """
+        key = (platform, event_type, str(event_key))
+        self._recent.pop(key, None)
+
+        stmt = delete(processed_events_table).where(
+            processed_events_table.c.platform == platform,
+            processed_events_table.c.event_type == event_type,
+            processed_events_table.c.event_key == key[2]
+        )
+        try:
+            await db_writer.execute_async(lambda conn: conn.execute(stmt))
+            self.released += 1
+        except Exception as e:
+            logger.error(f"Error releasing processed event {key}: {e}")
+
+    def get_metrics(self):
+        """Return dedup hit counters and cache occupancy."""
+        return {
+            "cache_size": len(self._recent),
+            "cache_capacity": self.cache_size,
+            "cache_hits": self.cache_hits,
+            "db_hits": self.db_hits,
+            "claimed": self.claimed,
+            "released": self.released
+        }
+
+
+# Global deduplicator instance
+event_deduplicator = EventDeduplicator(cache_size=settings.event_dedup_cache_size)
@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+EventHandler = Callable[[Any], Awaitable[None]]
+
+
+class EventQueue:
+    """Bounded in-process queue that feeds incoming events to a pool of async workers."""
+
+    def __init__(self, max_size: int, workers: int, enqueue_timeout: float):
+        self.max_size = max_size
+        self.worker_count = workers
+        self.enqueue_timeout = enqueue_timeout
+        self.queue: Optional[asyncio.Queue] = None
+        self.handler: Optional[EventHandler] = None
+        self._workers: List[asyncio.Task] = []
+        self._busy_workers = 0
+
+        # Metrics
+        self.enqueued = 0
+        self.processed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.high_water_mark = 0
+        self._ack_latencies = deque(maxlen=1000)
+        self._processing_times = deque(maxlen=1000)
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self, handler: EventHandler):
+        """Create the queue and spawn the worker pool."""
+        if self.running:
+            return
+
+        self.handler = handler
+        self.queue = asyncio.Queue(maxsize=self.max_size)
+        self._workers = [
+            asyncio.create_task(self._worker(i)) for i in range(self.worker_count)
+        ]
+        logger.info(f"📥 Event queue started with {self.worker_count} workers (max depth {self.max_size})")
+
+    async def stop(self):
+        """Cancel the workers. Events still queued are dropped."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logger.info("🛑 Event queue stopped")
+
+    async def enqueue(self, event: Any) -> bool:
+        """
+        Put an event on the queue.
+
+        Waits at most ``enqueue_timeout`` seconds for a free slot so callers
+        (webhook requests) are never held open by a saturated worker pool.
+
+        Returns:
+            True if the event was queued, False if the queue is full or not running
+        """
+        if self.queue is None:
+            self.rejected += 1
+            return False
+
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self.queue.put(event), timeout=self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                logger.warning(f"Event queue full ({self.max_size}), rejecting event")
+                return False
+
+        self.enqueued += 1
+        self.high_water_mark = max(self.high_water_mark, self.queue.qsize())
+        return True
+
+    def record_ack_latency(self, seconds: float):
+        """Record how long an ingestion request took to acknowledge."""
+        self._ack_latencies.append(seconds)
+
+    async def _worker(self, worker_id: int):
+        while True:
+            event = await self.queue.get()
+            self._busy_workers += 1
+            started = time.perf_counter()
+            try:
+                await self.handler(event)
+                self.processed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Event worker {worker_id} failed to process event: {e}")
+            finally:
+                self._processing_times.append(time.perf_counter() - started)
+                self._busy_workers -= 1
+                self.queue.task_done()
+
+    @staticmethod
+    def _percentile_ms(samples, percentile: float) -> Optional[float]:
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(round(percentile * (len(ordered) - 1))))
+        return round(ordered[index] * 1000, 3)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return a snapshot of queue depth, throughput counters and latencies."""
+        return {
+            "running": self.running,
+            "depth": self.queue.qsize() if self.queue else 0,
+            "max_depth": self.max_size,
+            "high_water_mark": self.high_water_mark,
+            "workers": self.worker_count,
+            "busy_workers": self._busy_workers,
+            "enqueued": self.enqueued,
+            "processed": self.processed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "ack_latency_ms": {
+                "p50": self._percentile_ms(self._ack_latencies, 0.5),
+                "p99": self._percentile_ms(self._ack_latencies, 0.99),
+            },
+            "processing_time_ms": {
+                "p50": self._percentile_ms(self._processing_times, 0.5),
+                "p99": self._percentile_ms(self._processing_times, 0.99),
+            },
+        }
+
+
+# Global event queue instance
+event_queue = EventQueue(
+    max_size=settings.webhook_queue_max_size,
+    workers=settings.webhook_workers,
+    enqueue_timeout=settings.webhook_enqueue_timeout,
+)
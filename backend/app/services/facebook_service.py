@@ -284,7 +284,9 @@ class FacebookService:
                     logger.error(f"Failed to create post: {error_data}")
                     return {
                         "success": False,
-                        "error": error_data.get("error", {}).get("message", "Unknown error")
+                        "error": error_data.get("error", {}).get("message", "Unknown error"),
+                        "error_code": error_data.get("error", {}).get("code"),
+                        "status_code": response.status_code
                     }
                     
         except Exception as e:
@@ -374,12 +376,9 @@ class FacebookService:
             Dict containing setup result
         """
         try:
-            # In a real implementation, you would:
-            # 1. Set up Facebook webhooks for comment events
-            # 2. Store auto-reply settings in database
-            # 3. Configure webhook endpoint to handle comment events
-            
-            # For now, we'll just store the setting (you'll need to implement webhook handling)
+            # Comment events are delivered to /api/webhooks/facebook (subscribe the
+            # page's "feed" field in the app dashboard); the auto-reply rule stored
+            # by the caller decides whether the event workers answer them.
             logger.info(f"Auto-reply {'enabled' if enabled else 'disabled'} for page {page_id}")
             
             return {
@@ -427,11 +426,37 @@ class FacebookService:
                 reply_content = reply_result["content"]
             
             # Post reply to Facebook
+            result = await self.reply_to_comment(comment_id, reply_content, page_access_token)
+            if result["success"]:
+                result["reply_content"] = reply_content
+                result["ai_generated"] = reply_result["success"]
+            return result
+                    
+        except Exception as e:
+            logger.error(f"Error handling auto-reply: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    async def reply_to_comment(self, comment_id: str, message: str, page_access_token: str) -> Dict[str, Any]:
+        """
+        Post a reply to a Facebook comment.
+        
+        Args:
+            comment_id: Facebook comment ID
+            message: Reply text
+            page_access_token: Page access token
+            
+        Returns:
+            Dict containing reply result
+        """
+        try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
                     f"{self.graph_api_base}/{comment_id}/comments",
                     data={
-                        "message": reply_content,
+                        "message": message,
                         "access_token": page_access_token
                     }
                 )
@@ -440,9 +465,7 @@ class FacebookService:
                     result = response.json()
                     return {
                         "success": True,
-                        "reply_id": result.get("id"),
-                        "reply_content": reply_content,
-                        "ai_generated": reply_result["success"]
+                        "reply_id": result.get("id")
                     }
                 else:
                     error_data = response.json()
@@ -453,12 +476,75 @@ class FacebookService:
                     }
                     
         except Exception as e:
-            logger.error(f"Error handling auto-reply: {e}")
+            logger.error(f"Error posting reply to comment {comment_id}: {e}")
             return {
                 "success": False,
                 "error": str(e)
             }
     
+    async def get_comments(
+        self,
+        object_id: str,
+        access_token: str,
+        after: Optional[str] = None,
+        limit: int = 100,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of comments on a post, oldest first.
+
+        Args:
+            object_id: Facebook post (or comment) ID
+            access_token: Page access token
+            after: Paging cursor returned by a previous call
+            limit: Page size
+            client: Optional shared HTTP client for connection reuse
+
+        Returns:
+            Dict containing the comments and the paging cursor after the last one
+        """
+        params = {
+            "access_token": access_token,
+            # Only what the auto-reply pipeline needs, to keep payloads small
+            "fields": "id,message,created_time,from{id,name}",
+            "filter": "stream",
+            "order": "chronological",
+            "limit": limit
+        }
+        if after:
+            params["after"] = after
+
+        try:
+            if client is None:
+                async with httpx.AsyncClient() as own_client:
+                    response = await own_client.get(f"{self.graph_api_base}/{object_id}/comments", params=params)
+            else:
+                response = await client.get(f"{self.graph_api_base}/{object_id}/comments", params=params)
+
+            if response.status_code == 200:
+                result = response.json()
+                paging = result.get("paging", {})
+                return {
+                    "success": True,
+                    "comments": result.get("data", []),
+                    "after": paging.get("cursors", {}).get("after"),
+                    "has_next": "next" in paging
+                }
+            else:
+                error_data = response.json()
+                logger.error(f"Failed to get comments for {object_id}: {error_data}")
+                return {
+                    "success": False,
+                    "error": error_data.get("error", {}).get("message", "Unknown error")
+                }
+
+        except Exception as e:
+            logger.error(f"Error getting comments for {object_id}: {e}")
+            return {
+                "success": False,
+                "error": str(e)
+            }
+
     def is_configured(self) -> bool:
         """Check if Facebook service is properly configured."""
         return bool(self.app_id and self.app_secret)
@@ -1,3 +1,4 @@
+import httpx
 import requests
 import logging
 from typing import Dict, List, Optional, Tuple, Any
@@ -308,6 +309,97 @@ class InstagramService:
                 "error": str(e)
             }
     
+    async def reply_to_comment(self, comment_id: str, message: str, access_token: str) -> Dict[str, Any]:
+        """
+        Reply to a comment on one of our own Instagram media.
+        
+        Args:
+            comment_id: Instagram comment ID
+            message: Reply text
+            access_token: Page access token of the linked Facebook page
+            
+        Returns:
+            Dict containing reply result
+        """
+        return await self._post_reply(
+            f"{self.graph_url}/{comment_id}/replies",
+            {"message": message, "access_token": access_token}
+        )
+    
+    async def reply_to_mention(
+        self,
+        instagram_user_id: str,
+        media_id: str,
+        message: str,
+        access_token: str,
+        comment_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Reply to an @mention of our account on someone else's media.
+        
+        Args:
+            instagram_user_id: Our Instagram Business account ID
+            media_id: Media the mention appeared on
+            message: Reply text
+            access_token: Page access token of the linked Facebook page
+            comment_id: Mentioning comment (omit for a mention in the caption)
+            
+        Returns:
+            Dict containing reply result
+        """
+        data = {"media_id": media_id, "message": message, "access_token": access_token}
+        if comment_id:
+            data["comment_id"] = comment_id
+        return await self._post_reply(f"{self.graph_url}/{instagram_user_id}/mentions", data)
+    
+    async def get_mention_text(
+        self,
+        instagram_user_id: str,
+        media_id: str,
+        access_token: str,
+        comment_id: Optional[str] = None
+    ) -> Optional[str]:
+        """Fetch the text of a mentioning comment (or caption); mention webhooks only carry IDs."""
+        if comment_id:
+            fields = f"mentioned_comment.comment_id({comment_id}){{text}}"
+        else:
+            fields = f"mentioned_media.media_id({media_id}){{caption}}"
+        
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(
+                    f"{self.graph_url}/{instagram_user_id}",
+                    params={"fields": fields, "access_token": access_token}
+                )
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch mention {comment_id or media_id}: {response.text}")
+                return None
+            data = response.json()
+            if comment_id:
+                return (data.get("mentioned_comment") or {}).get("text")
+            return (data.get("mentioned_media") or {}).get("caption")
+        except Exception as e:
+            logger.error(f"Error fetching mention {comment_id or media_id}: {e}")
+            return None
+    
+    async def _post_reply(self, url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.post(url, data=data)
+            
+            if response.status_code == 200:
+                return {"success": True, "reply_id": response.json().get("id")}
+            
+            error_data = response.json() if response.content else {}
+            logger.error(f"Failed to post Instagram reply: {error_data}")
+            return {
+                "success": False,
+                "error": error_data.get("error", {}).get("message", "Unknown error")
+            }
+        except Exception as e:
+            logger.error(f"Error posting Instagram reply: {e}")
+            return {"success": False, "error": str(e)}
+    
     def is_configured(self) -> bool:
         """Check if Instagram service is properly configured."""
         return bool(self.app_id and self.app_secret)
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from passlib.context import CryptContext
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+@lru_cache(maxsize=None)
+def crypt_context(rounds: int) -> CryptContext:
+    """The bcrypt context for a cost factor; hashes of any other cost need updating."""
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+# Run in the worker processes (module-level so they can be pickled)
+def _hash(password: str, rounds: int) -> str:
+    return crypt_context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    return crypt_context(rounds).verify_and_update(password, hashed)
+
+
+class PasswordHasher:
+    """
+    Password hashing off the request path.
+
+    bcrypt is deliberately slow; run in the request threadpool, a burst of
+    logins occupies its threads and competes for CPU with every other sync
+    endpoint. Hashes are computed in a dedicated process pool instead, so
+    hashing never uses more than ``workers`` cores and callers simply await
+    the result while the event loop keeps serving.
+
+    ``rounds`` is the bcrypt cost factor for new hashes: a login whose stored
+    hash has a different cost gets it recomputed with the current one.
+
+    Workers are spawned rather than forked, so they don't inherit the
+    server's threads, sockets and connection pools. If a worker dies the
+    pool is broken for good; it is then replaced and the call retried once.
+    """
+
+    def __init__(self, rounds: int, workers: int):
+        self.rounds = rounds
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._start_lock = threading.Lock()
+
+        # Metrics
+        self.hashed = 0
+        self.verified = 0
+        self.rehashed = 0
+        self.pool_restarts = 0
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._start_lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+                    logger.info(f"🔐 Password hashing pool started ({self.workers} workers, cost {self.rounds})")
+        return self._pool
+
+    def _replace(self, broken: ProcessPoolExecutor):
+        """Drop a broken pool so the next call starts a new one."""
+        with self._start_lock:
+            if self._pool is broken:
+                self._pool = None
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.pool_restarts += 1
+        logger.warning("Password hashing pool broke (a worker died), restarting it")
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        pool = self._executor()
+        try:
+            return await loop.run_in_executor(pool, fn, *args)
+        except BrokenProcessPool:
+            self._replace(pool)
+            return await loop.run_in_executor(self._executor(), fn, *args)
+
+    def stop(self):
+        """Shut down the worker processes."""
+        if self._pool is None:
+            return
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._pool = None
+        logger.info("🛑 Password hashing pool stopped")
+
+    async def hash(self, password: str) -> str:
+        """Hash a new password with the current cost factor."""
+        hashed = await self._run(_hash, password, self.rounds)
+        self.hashed += 1
+        return hashed
+
+    async def verify(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """
+        Check a password against its stored hash.
+
+        Returns:
+            (valid, new_hash): new_hash is set when the password is valid but
+            the stored hash was made with another cost factor and should be
+            replaced
+        """
+        valid, new_hash = await self._run(_verify_and_update, password, hashed, self.rounds)
+        self.verified += 1
+        if new_hash:
+            self.rehashed += 1
+        return valid, new_hash
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return pool settings and hashing counters."""
+        return {
+            "workers": self.workers,
+            "rounds": self.rounds,
+            "hashed": self.hashed,
+            "verified": self.verified,
+            "rehashed": self.rehashed,
+            "pool_restarts": self.pool_restarts,
+        }
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher(
+    rounds=settings.password_hash_rounds,
+    workers=settings.password_hash_workers
+)
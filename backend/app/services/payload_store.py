@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+from app.config import get_settings
+from app.database import upsert
+from app.services.db_writer import db_writer
+from app.models.post_payload import PostPayload
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+payloads_table = PostPayload.__table__
+
+# Buffered keys -> post_payloads columns
+PAYLOAD_COLUMNS = ("platform_response", "post_metadata")
+
+
+class PayloadStore:
+    """
+    Buffered writer for the post_payloads table.
+
+    Publishing code hands over raw platform responses and creation metadata
+    here instead of writing them with the post. Entries for the same post are
+    merged in memory and written as one upsert per column set and batch, so
+    the publish transaction stays small and a burst of publishes costs a few
+    statements in one commit of the database writer.
+
+    Recording never writes: a full buffer only wakes the flush loop, so a
+    failing write can't fail a publish that already went out. A batch that
+    fails is retried one post at a time, and a post whose payload keeps
+    failing is dropped after ``WRITE_BEHIND_MAX_ATTEMPTS`` flushes instead
+    of holding up the rest.
+    """
+
+    def __init__(self, flush_interval: float, batch_size: int):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.running = False
+        self._lock = threading.Lock()
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        # post_id -> failed writes so far
+        self._attempts: Dict[int, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+
+        # Metrics
+        self.rows_written = 0
+        self.flushes = 0
+        self.dropped = 0
+
+    async def start(self):
+        """Start the periodic flush loop."""
+        if self.running:
+            return
+
+        self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._flush_requested = asyncio.Event()
+        logger.info(f"📦 Payload store flusher started (every {self.flush_interval}s)")
+
+        while self.running:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            try:
+                await self.flush_async()
+            except Exception as e:
+                logger.error(f"Error flushing post payloads: {e}")
+
+    def stop(self):
+        """Stop the loop and write out whatever is still buffered."""
+        self.running = False
+        self._loop = None
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Error flushing post payloads on shutdown: {e}")
+        logger.info("🛑 Payload store flusher stopped")
+
+    def record(
+        self,
+        post_id: int,
+        platform_response: Optional[Dict[str, Any]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """Buffer a post's platform response and/or creation metadata."""
+        values = {}
+        if platform_response is not None:
+            values["platform_response"] = platform_response
+        if metadata is not None:
+            values["post_metadata"] = metadata
+        if not values:
+            return
+
+        with self._lock:
+            self._pending.setdefault(post_id, {}).update(values)
+            buffered = len(self._pending)
+
+        if buffered >= self.batch_size:
+            self._request_flush()
+
+    def _request_flush(self):
+        """Wake the flush loop early (safe from any thread)."""
+        loop, flush_requested = self._loop, self._flush_requested
+        if loop is not None and flush_requested is not None:
+            loop.call_soon_threadsafe(flush_requested.set)
+
+    async def flush_async(self) -> int:
+        """
+        Write buffered payloads in a single transaction.
+
+        If the batch fails its posts are written one at a time; those that
+        still fail go back into the buffer (or are dropped, see above).
+
+        Returns:
+            Number of posts whose payload was written
+        """
+        pending = self._take()
+        if not pending:
+            return 0
+
+        try:
+            await db_writer.execute_async(self._write_job(pending))
+            errors = {}
+        except Exception as e:
+            self._batch_failed(pending, e)
+            errors = await db_writer.execute_each_async(self._row_jobs(pending))
+
+        self.flushes += 1
+        return self._settle(pending, errors)
+
+    def flush(self) -> int:
+        """``flush_async`` for shutdown, when the event loop is going away: blocks until written."""
+        pending = self._take()
+        if not pending:
+            return 0
+
+        try:
+            db_writer.execute(self._write_job(pending))
+            errors = {}
+        except Exception as e:
+            self._batch_failed(pending, e)
+            errors = db_writer.execute_each(self._row_jobs(pending))
+
+        self.flushes += 1
+        return self._settle(pending, errors)
+
+    def _take(self) -> Dict[int, Dict[str, Any]]:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def _batch_failed(self, pending: Dict[int, Dict[str, Any]], error: Exception):
+        logger.warning(f"Payload batch of {len(pending)} posts failed ({error}), retrying post by post")
+
+    def _row_jobs(self, pending: Dict[int, Dict[str, Any]]) -> Dict[int, Any]:
+        """One write job per post, to find the posts at fault."""
+        return {post_id: self._write_job({post_id: values}) for post_id, values in pending.items()}
+
+    def _write_job(self, pending: Dict[int, Dict[str, Any]]):
+        # One upsert per column set, so a response never clears stored metadata
+        now = datetime.utcnow()
+        groups: Dict[tuple, list] = {}
+        for post_id, values in pending.items():
+            columns = tuple(column for column in PAYLOAD_COLUMNS if column in values)
+            groups.setdefault(columns, []).append({"post_id": post_id, "updated_at": now, **values})
+
+        def write(conn):
+            for columns, rows in groups.items():
+                conn.execute(upsert(payloads_table, ["post_id"], columns + ("updated_at",)), rows)
+        return write
+
+    def _settle(self, pending: Dict[int, Dict[str, Any]], errors: Dict[Any, BaseException]) -> int:
+        """Count what was written; put failed posts back for the next flush, or drop them."""
+        written = 0
+        with self._lock:
+            for post_id, values in pending.items():
+                error = errors.get(post_id)
+                if error is None:
+                    self._attempts.pop(post_id, None)
+                    written += 1
+                    continue
+
+                attempts = self._attempts.get(post_id, 0) + 1
+                if attempts >= settings.write_behind_max_attempts:
+                    self._attempts.pop(post_id, None)
+                    self.dropped += 1
+                    logger.error(f"Dropping payload of post {post_id} after {attempts} failed writes: {error}")
+                else:
+                    self._attempts[post_id] = attempts
+                    # Newer values recorded meanwhile win
+                    self._pending[post_id] = {**values, **self._pending.get(post_id, {})}
+
+        self.rows_written += written
+        return written
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return buffer size and write counters."""
+        with self._lock:
+            buffered = len(self._pending)
+        return {
+            "buffered": buffered,
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+            "dropped": self.dropped,
+        }
+
+
+# Global payload store instance
+payload_store = PayloadStore(
+    flush_interval=settings.payload_store_flush_interval,
+    batch_size=settings.payload_store_batch_size
+)
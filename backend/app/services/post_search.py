@@ -0,0 +1,67 @@
+from typing import Optional, Sequence, Tuple
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.sql import Select
+from app.models.post import Post
+
+# FTS5 table maintained by the triggers in app/models/post.py
+posts_fts = table("posts_fts", column("rowid"))
+_fts_table = literal_column("posts_fts")
+
+
+def fts5_query(text: str, user_id: int) -> Optional[str]:
+    """
+    Turn free text into an FTS5 query for one user's posts.
+
+    Every word becomes a quoted phrase, so quotes, operators and punctuation in
+    the input can't break the query syntax; a trailing ``*`` keeps its prefix
+    meaning. All words must match. Returns None if nothing searchable is left.
+    """
+    phrases = []
+    for word in text.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*")
+        if word:
+            phrases.append('"' + word.replace('"', '""') + '"' + ("*" if prefix else ""))
+
+    if not phrases:
+        return None
+    return f'user_id : "{user_id}" AND content : ({" ".join(phrases)})'
+
+
+def search_posts_query(
+    columns: Sequence,
+    dialect_name: str,
+    user_id: int,
+    text: str
+) -> Optional[Tuple[Select, object]]:
+    """
+    Select ``columns`` of the user's posts matching ``text``, plus their ``rank``.
+
+    Returns the query and the rank expression (lower is more relevant) to
+    order and page by, or None when the text has nothing to search for.
+    PostgreSQL matches with ``websearch_to_tsquery`` against the generated
+    ``search_vector``, ranked by ``ts_rank_cd``; SQLite matches through the
+    FTS5 index, ranked by BM25 over the content column.
+    """
+    if dialect_name == "postgresql":
+        tsquery = func.websearch_to_tsquery("simple", text)
+        vector = literal_column("posts.search_vector")
+        rank = -func.ts_rank_cd(vector, tsquery)
+        query = select(*columns, rank.label("rank")).where(
+            Post.user_id == user_id,
+            vector.op("@@")(tsquery)
+        )
+        return query, rank
+
+    match = fts5_query(text, user_id)
+    if match is None:
+        return None
+    # The user_id column only filters; give it no weight in the score
+    rank = func.bm25(_fts_table, 1.0, 0.0)
+    query = (
+        select(*columns, rank.label("rank"))
+        .select_from(posts_fts)
+        .join(Post, Post.id == posts_fts.c.rowid)
+        .where(_fts_table.op("MATCH")(match))
+    )
+    return query, rank
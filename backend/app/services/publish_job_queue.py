@@ -0,0 +1,280 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.publish_job import PublishJob, PublishJobStatus
+from app.services.push_hub import push_hub
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Carries out a job; returns the response body the synchronous request would
+# have returned and the id of the post it created. Raising HTTPException
+# fails the job with that status code and detail (and the exception's
+# ``post_id`` attribute, if any, as the post it created before failing).
+JobHandler = Callable[[PublishJob], Awaitable[Tuple[Dict[str, Any], Optional[int]]]]
+
+
+class PublishJobQueue:
+    """
+    Publish requests accepted with 202, carried out by a pool of async workers.
+
+    ``create`` stores the validated request as a job and hands its id to the
+    workers; at most ``workers`` publishes are in flight however many
+    requests come in, and no request waits on the platform. Jobs are
+    claimed with a conditional UPDATE, so instances can share the table; the
+    poll loop picks up jobs queued before a restart or on another instance.
+
+    A job runs at most once. One whose worker went away (lease expired, or
+    cancelled at shutdown) is failed rather than run again, because its
+    publish may already have gone out; for the same reason a Facebook post
+    it created is dead-lettered as interrupted once the post's own lease
+    expires, for the user to check and replay.
+    """
+
+    def __init__(self, workers: int, poll_interval: float, lease_seconds: float):
+        self.worker_count = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.handlers: Dict[str, JobHandler] = {}
+        self.queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: List[asyncio.Task] = []
+        self._pending: Set[int] = set()
+
+        # Metrics
+        self.created = 0
+        self.duplicates = 0
+        self.completed = 0
+        self.failed = 0
+        self.interrupted = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self, handlers: Dict[str, JobHandler]):
+        """Spawn the workers and the poll loop; ``handlers`` maps a platform to its publish."""
+        if self.running:
+            return
+
+        self.handlers = handlers
+        self.queue = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.worker_count)]
+        self._tasks.append(asyncio.create_task(self._poll()))
+        logger.info(f"📤 Publish job queue started with {self.worker_count} workers")
+
+    async def stop(self):
+        """Cancel the workers; jobs they were running are failed as interrupted."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._loop = None
+        self._pending.clear()
+        logger.info("🛑 Publish job queue stopped")
+
+    def create(
+        self,
+        db: Session,
+        user_id: int,
+        platform: str,
+        payload: Dict[str, Any],
+        idempotency_key: Optional[str] = None
+    ) -> PublishJob:
+        """
+        Store a job and queue it.
+
+        A retried request carrying an ``idempotency_key`` the user already
+        used gets the existing job back instead of a duplicate publish.
+        """
+        if idempotency_key:
+            existing = self._find(db, user_id, idempotency_key)
+            if existing is not None:
+                self.duplicates += 1
+                return existing
+
+        job = PublishJob(user_id=user_id, platform=platform, payload=payload, idempotency_key=idempotency_key)
+        db.add(job)
+        try:
+            db.commit()
+        except IntegrityError:
+            # The same key raced in from a concurrent retry
+            db.rollback()
+            self.duplicates += 1
+            return self._find(db, user_id, idempotency_key)
+        db.refresh(job)
+
+        self.created += 1
+        push_hub.publish(*self._status_event(job))
+        self._submit(job.id)
+        return job
+
+    def _find(self, db: Session, user_id: int, idempotency_key: str) -> Optional[PublishJob]:
+        return db.query(PublishJob).filter(
+            PublishJob.user_id == user_id,
+            PublishJob.idempotency_key == idempotency_key
+        ).first()
+
+    def _submit(self, job_id: int):
+        # Not running yet: the poll loop finds the job once it is
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._enqueue, job_id)
+
+    def _enqueue(self, job_id: int):
+        if self.queue is not None and job_id not in self._pending:
+            self._pending.add(job_id)
+            self.queue.put_nowait(job_id)
+
+    async def _worker(self):
+        while True:
+            job_id = await self.queue.get()
+            try:
+                await self.run(job_id)
+            except Exception as e:
+                logger.error(f"Error running publish job {job_id}: {e}")
+            finally:
+                self._pending.discard(job_id)
+
+    async def run(self, job_id: int):
+        """Claim a queued job and carry it out; does nothing if someone else claimed it."""
+        # Job bookkeeping runs off the event loop: a SQLite write waiting on
+        # the lock must not stall the async sessions holding it
+        job = await asyncio.to_thread(self._claim, job_id)
+        if job is None:
+            return
+
+        handler = self.handlers.get(job.platform)
+        try:
+            if handler is None:
+                raise HTTPException(status_code=400, detail=f"Unsupported platform: {job.platform}")
+            result, post_id = await handler(job)
+        except asyncio.CancelledError:
+            await asyncio.to_thread(
+                self._finish, job_id, PublishJobStatus.FAILED, error="Interrupted before the publish finished"
+            )
+            self.interrupted += 1
+            raise
+        except HTTPException as e:
+            await asyncio.to_thread(
+                self._finish, job_id, PublishJobStatus.FAILED, error=str(e.detail), error_status_code=e.status_code,
+                post_id=getattr(e, "post_id", None)
+            )
+            self.failed += 1
+        except Exception as e:
+            logger.error(f"Publish job {job_id} failed: {e}")
+            await asyncio.to_thread(self._finish, job_id, PublishJobStatus.FAILED, error=str(e), error_status_code=500)
+            self.failed += 1
+        else:
+            await asyncio.to_thread(self._finish, job_id, PublishJobStatus.COMPLETED, result=result, post_id=post_id)
+            self.completed += 1
+
+    def _claim(self, job_id: int) -> Optional[PublishJob]:
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            claimed = db.query(PublishJob).filter(
+                PublishJob.id == job_id,
+                PublishJob.status == PublishJobStatus.QUEUED
+            ).update({
+                "status": PublishJobStatus.RUNNING,
+                "started_at": now,
+                "locked_until": now + timedelta(seconds=self.lease_seconds)
+            }, synchronize_session=False)
+            db.commit()
+            if not claimed:
+                return None
+
+            job = db.get(PublishJob, job_id)
+            push_hub.publish(*self._status_event(job))
+            return job
+        finally:
+            db.close()
+
+    def _finish(self, job_id: int, status: PublishJobStatus, **fields):
+        db = SessionLocal()
+        try:
+            job = db.get(PublishJob, job_id)
+            job.status = status
+            job.locked_until = None
+            job.finished_at = datetime.utcnow()
+            for name, value in fields.items():
+                setattr(job, name, value)
+            event = self._status_event(job)
+            db.commit()
+            push_hub.publish(*event)
+        finally:
+            db.close()
+
+    def _status_event(self, job: PublishJob) -> Tuple[int, Dict[str, Any]]:
+        """The push event announcing the job's current status, for its user."""
+        return job.user_id, {
+            "type": "publish_job.status",
+            "job_id": job.id,
+            "platform": job.platform,
+            "status": job.status.value,
+            "post_id": job.post_id,
+            "error": job.error,
+        }
+
+    async def _poll(self):
+        while True:
+            try:
+                await asyncio.to_thread(self.recover)
+            except Exception as e:
+                logger.error(f"Error in publish job poll loop: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    def recover(self):
+        """Fail jobs whose worker went away and queue jobs this process doesn't know about."""
+        db = SessionLocal()
+        try:
+            abandoned = db.query(PublishJob).filter(
+                PublishJob.status == PublishJobStatus.RUNNING,
+                PublishJob.locked_until < datetime.utcnow()
+            ).all()
+            for job in abandoned:
+                job.status = PublishJobStatus.FAILED
+                job.error = "Interrupted before the publish finished"
+                job.locked_until = None
+                job.finished_at = datetime.utcnow()
+                logger.warning(f"⚠️ Publish job {job.id} was abandoned by its worker")
+            events = [self._status_event(job) for job in abandoned]
+            db.commit()
+            for event in events:
+                push_hub.publish(*event)
+            self.interrupted += len(abandoned)
+
+            queued = db.query(PublishJob.id).filter(
+                PublishJob.status == PublishJobStatus.QUEUED
+            ).order_by(PublishJob.id).all()
+            for (job_id,) in queued:
+                self._submit(job_id)
+        finally:
+            db.close()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return worker, queue and job outcome counters."""
+        return {
+            "workers": self.worker_count,
+            "queued": self.queue.qsize() if self.queue is not None else 0,
+            "created": self.created,
+            "duplicates": self.duplicates,
+            "completed": self.completed,
+            "failed": self.failed,
+            "interrupted": self.interrupted,
+        }
+
+
+# Global publish job queue instance
+publish_job_queue = PublishJobQueue(
+    workers=settings.publish_job_workers,
+    poll_interval=settings.publish_job_poll_interval,
+    lease_seconds=settings.publish_lease_seconds
+)
@@ -0,0 +1,447 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import and_
+from sqlalchemy.orm import Session, joinedload
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.dead_letter_post import DeadLetterPost
+from app.models.post import Post, PostStatus, PostType
+from app.models.social_account import SocialAccount
+from app.services.action_limiter import action_limiter
+from app.services.facebook_service import facebook_service
+from app.services.instagram_service import instagram_service
+from app.services.payload_store import payload_store
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Failure classes
+RETRYABLE = "retryable"
+AUTH = "auth"
+PERMANENT = "permanent"
+INTERRUPTED = "interrupted"
+
+INTERRUPTED_ERROR = "Interrupted before the publish result was recorded; check the page before replaying"
+
+# Graph API error codes (https://developers.facebook.com/docs/graph-api/guides/error-handling)
+RETRYABLE_ERROR_CODES = {1, 2, 4, 17, 32, 341, 368, 613}
+AUTH_ERROR_CODES = {10, 102, 190}
+
+
+def classify_publish_error(result: Dict[str, Any]) -> str:
+    """Decide whether a failed publish is worth retrying."""
+    code = result.get("error_code")
+    status_code = result.get("status_code")
+
+    if code is not None:
+        try:
+            code = int(code)
+        except (TypeError, ValueError):
+            code = None
+
+    if code in AUTH_ERROR_CODES or (code is not None and 200 <= code < 300):
+        return AUTH
+    if code in RETRYABLE_ERROR_CODES or (status_code and status_code >= 500):
+        return RETRYABLE
+    if code is None and status_code is None:
+        # Network errors and exceptions carry only a message
+        message = (result.get("error") or "").lower()
+        if "expired" in message or "session" in message or "unauthorized" in message:
+            return AUTH
+        return RETRYABLE
+    return PERMANENT
+
+
+class PublishRetryService:
+    """
+    Retry queue for failed publishes.
+
+    Failed posts with a retryable error get ``next_retry_at`` set with
+    exponential backoff. The retry loop picks up due posts, groups them by
+    social account (one account lookup, one action budget and one token
+    failure per group) and publishes them again. Posts that run out of
+    retries, or fail with a non-retryable error, are moved to the dead-letter
+    table where they can be inspected and replayed. Each due post is claimed
+    (put back in flight under a lease) and committed before it is
+    published, and its result is committed right after, so a crash or a
+    failed commit never loses a published result of other posts and two
+    instances never retry the same post.
+
+    Publishes started from the API are recorded first as a scheduled post
+    whose ``next_retry_at`` is a lease (outbox style). The result normally
+    clears it in the same update that records it. An expired lease means
+    the process died mid-publish or the publish is taking too long, and the
+    platform may well have accepted the post, so it is never published
+    again automatically: the post is failed and dead-lettered with reason
+    ``interrupted``, for the user to check the page and replay it. A result
+    that still arrives afterwards is recorded as usual.
+    """
+
+    def __init__(self):
+        self.running = False
+        self.check_interval = settings.publish_retry_interval
+        self.max_retries = settings.publish_max_retries
+        self.base_delay = settings.publish_retry_base_delay
+        self.max_delay = settings.publish_retry_max_delay
+        self.batch_size = settings.publish_retry_batch_size
+        self.lease_seconds = settings.publish_lease_seconds
+
+        # Metrics
+        self.retried = 0
+        self.recovered = 0
+        self.dead_lettered = 0
+        self.interrupted = 0
+
+    async def start(self):
+        """Start the retry loop."""
+        if self.running:
+            return
+
+        self.running = True
+        logger.info("🔁 Publish retry service started")
+
+        while self.running:
+            try:
+                await self.process_due_retries()
+            except Exception as e:
+                logger.error(f"Error in publish retry loop: {e}")
+            await asyncio.sleep(self.check_interval)
+
+    def stop(self):
+        """Stop the retry loop."""
+        self.running = False
+        logger.info("🛑 Publish retry service stopped")
+
+    def backoff(self, retry_count: int) -> float:
+        """Seconds to wait before the next attempt (exponential, with jitter)."""
+        delay = min(self.max_delay, self.base_delay * (2 ** retry_count))
+        return delay * random.uniform(0.8, 1.2)
+
+    def lease_expiry(self) -> datetime:
+        """When an in-flight publish counts as interrupted (see above)."""
+        return datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+
+    def record_failure(self, db: Session, post: Post, result: Dict[str, Any], platform: Optional[str] = None) -> str:
+        """
+        Mark a post as failed and either schedule a retry or dead-letter it.
+
+        The caller commits, so this adds no round trip to the failing request.
+        Works with sync and async sessions alike; async callers pass
+        ``platform`` so the account relationship isn't lazy-loaded.
+
+        Returns:
+            The failure class (RETRYABLE, AUTH or PERMANENT)
+        """
+        failure = classify_publish_error(result)
+        post.status = PostStatus.FAILED
+        post.error_message = result.get("error") or "Unknown error"
+        retry_count = post.retry_count or 0
+
+        if failure == RETRYABLE and retry_count < self.max_retries:
+            post.next_retry_at = datetime.utcnow() + timedelta(seconds=self.backoff(retry_count))
+            logger.info(f"⏳ Post {post.id} failed ({post.error_message}), retry {retry_count + 1} at {post.next_retry_at}")
+            return failure
+
+        post.next_retry_at = None
+        db.add(DeadLetterPost(
+            post_id=post.id,
+            user_id=post.user_id,
+            social_account_id=post.social_account_id,
+            platform=platform or (post.social_account.platform if post.social_account else "facebook"),
+            reason="retries_exhausted" if failure == RETRYABLE else failure,
+            error_code=str(result["error_code"]) if result.get("error_code") is not None else None,
+            error_message=post.error_message,
+            attempts=retry_count + 1
+        ))
+        self.dead_lettered += 1
+        logger.warning(f"☠️ Post {post.id} moved to dead letters ({failure}): {post.error_message}")
+        return failure
+
+    async def process_due_retries(self) -> int:
+        """
+        Dead-letter in-flight publishes whose lease expired and retry every
+        failed post whose next attempt is due. Returns the number of posts attempted.
+        """
+        # Bookkeeping runs off the event loop, in one short session per unit
+        # of work; no session is held across a Graph API call
+        await asyncio.to_thread(self._fail_interrupted)
+        due_posts, accounts = await asyncio.to_thread(self._claim_due)
+        if not due_posts:
+            return 0
+
+        logger.info(f"🔁 Retrying {len(due_posts)} failed posts")
+
+        # Accounts are retried concurrently, posts of one account in order
+        groups = [
+            (account_id, list(posts))
+            for account_id, posts in groupby(due_posts, key=lambda post: post.social_account_id)
+        ]
+        results = await asyncio.gather(
+            *[self._retry_account(accounts.get(account_id), posts) for account_id, posts in groups],
+            return_exceptions=True
+        )
+        for (account_id, _), result in zip(groups, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error retrying posts of account {account_id}: {result}")
+        return len(due_posts)
+
+    def _claim_due(self) -> Tuple[List[Post], Dict[int, SocialAccount]]:
+        """
+        Claim a batch of due posts and load them with their accounts.
+
+        The claim moves the post back in flight (scheduled, with a publish
+        lease in ``next_retry_at``) and is committed before anything is
+        published, so another instance or the next pass won't pick it up.
+        """
+        db: Session = SessionLocal()
+        try:
+            due = and_(
+                Post.status == PostStatus.FAILED,
+                Post.next_retry_at.isnot(None),
+                Post.next_retry_at <= datetime.utcnow()
+            )
+            due_ids = [
+                post_id for (post_id,) in db.query(Post.id).filter(due)
+                .order_by(Post.social_account_id, Post.next_retry_at).limit(self.batch_size)
+            ]
+
+            claimed = []
+            for post_id in due_ids:
+                # Conditional, so another instance can't claim the same post
+                if db.query(Post).filter(Post.id == post_id, due).update({
+                    Post.status: PostStatus.SCHEDULED,
+                    Post.next_retry_at: self.lease_expiry()
+                }, synchronize_session=False):
+                    claimed.append(post_id)
+            db.commit()
+            if not claimed:
+                return [], {}
+
+            posts = db.query(Post).filter(Post.id.in_(claimed)).all()
+            posts.sort(key=lambda post: (post.social_account_id, claimed.index(post.id)))
+            accounts = {
+                account.id: account
+                for account in db.query(SocialAccount).filter(
+                    SocialAccount.id.in_({post.social_account_id for post in posts})
+                )
+            }
+            # Detached, for reading while publishing
+            db.expunge_all()
+            return posts, accounts
+        finally:
+            db.close()
+
+    def _fail_interrupted(self) -> int:
+        """Fail and dead-letter in-flight publishes whose lease expired; returns how many."""
+        db: Session = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            expired = and_(
+                Post.status == PostStatus.SCHEDULED,
+                Post.next_retry_at.isnot(None),
+                Post.next_retry_at <= now
+            )
+            candidates = db.query(Post.id).filter(expired).limit(self.batch_size).all()
+
+            interrupted = []
+            for (post_id,) in candidates:
+                # Conditional, so a result recorded meanwhile (or another instance) wins
+                if db.query(Post).filter(Post.id == post_id, expired).update({
+                    Post.status: PostStatus.FAILED,
+                    Post.next_retry_at: None,
+                    Post.error_message: INTERRUPTED_ERROR
+                }, synchronize_session=False):
+                    interrupted.append(post_id)
+            if not interrupted:
+                return 0
+
+            posts = db.query(Post).options(joinedload(Post.social_account)).filter(Post.id.in_(interrupted)).all()
+            for post in posts:
+                db.add(DeadLetterPost(
+                    post_id=post.id,
+                    user_id=post.user_id,
+                    social_account_id=post.social_account_id,
+                    platform=post.social_account.platform if post.social_account else "facebook",
+                    reason="interrupted",
+                    error_message=INTERRUPTED_ERROR,
+                    attempts=(post.retry_count or 0) + 1
+                ))
+                logger.warning(f"☠️ Post {post.id} was interrupted mid-publish, moved to dead letters")
+            db.commit()
+        finally:
+            db.close()
+
+        self.interrupted += len(interrupted)
+        self.dead_lettered += len(interrupted)
+        return len(interrupted)
+
+    async def _retry_account(self, account: Optional[SocialAccount], posts: List[Post]):
+        platform = account.platform if account is not None else "facebook"
+        for index, post in enumerate(posts):
+            if account is None or not account.is_connected or not account.access_token:
+                await asyncio.to_thread(
+                    self._record, post.id, platform, {"error": "Social account is disconnected", "error_code": 190}
+                )
+                continue
+
+            wait = action_limiter.acquire(account.id)
+            if wait:
+                # Push the rest of this account's batch back as a group
+                retry_at = datetime.utcnow() + timedelta(seconds=wait)
+                await asyncio.to_thread(self._release, [pending.id for pending in posts[index:]], retry_at)
+                return
+
+            self.retried += 1
+            try:
+                result = await self.publish(account, post)
+            except Exception as e:
+                result = {"success": False, "error": str(e)}
+
+            failure = await asyncio.to_thread(self._record, post.id, platform, result, True)
+            if failure == AUTH:
+                # The token is dead for the whole group; don't burn the remaining posts' attempts
+                for pending in posts[index + 1:]:
+                    await asyncio.to_thread(self._record, pending.id, platform, result)
+                return
+
+    def _record(
+        self, post_id: int, platform: str, result: Dict[str, Any], attempted: bool = False
+    ) -> Optional[str]:
+        """
+        Commit the outcome of one claimed post.
+
+        Returns:
+            The failure class, or None if the post was published
+        """
+        db: Session = SessionLocal()
+        try:
+            post = db.get(Post, post_id)
+            if attempted:
+                post.retry_count = (post.retry_count or 0) + 1
+
+            if not result.get("success") and post.status != PostStatus.SCHEDULED:
+                # Its lease expired meanwhile and it was dead-lettered as interrupted
+                db.commit()
+                return INTERRUPTED
+
+            if result.get("success"):
+                post.status = PostStatus.PUBLISHED
+                post.platform_post_id = result.get("post_id")
+                post.published_at = datetime.utcnow()
+                post.error_message = None
+                post.next_retry_at = None
+                failure = None
+            else:
+                failure = self.record_failure(db, post, result, platform=platform)
+            retry_count = post.retry_count
+            db.commit()
+        finally:
+            db.close()
+
+        if failure is None:
+            payload_store.record(post_id, platform_response=result)
+            self.recovered += 1
+            logger.info(f"✅ Post {post_id} published on retry {retry_count}")
+        return failure
+
+    def _release(self, post_ids: List[int], retry_at: datetime):
+        """Give claimed posts back, to be retried at ``retry_at``."""
+        db: Session = SessionLocal()
+        try:
+            db.query(Post).filter(
+                Post.id.in_(post_ids),
+                Post.status == PostStatus.SCHEDULED
+            ).update({
+                Post.status: PostStatus.FAILED,
+                Post.next_retry_at: retry_at
+            }, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    async def publish(self, account: SocialAccount, post: Post) -> Dict[str, Any]:
+        """Publish a stored post to its account's platform."""
+        media_url = post.media_urls[0] if post.media_urls else None
+
+        if account.platform == "instagram":
+            try:
+                return await asyncio.to_thread(
+                    instagram_service.create_post,
+                    account.platform_user_id,
+                    account.access_token,
+                    post.content,
+                    media_url
+                )
+            except Exception as e:
+                return {"success": False, "error": str(e)}
+
+        media_type = "text"
+        if media_url and post.post_type == PostType.IMAGE:
+            media_type = "photo"
+        elif media_url and post.post_type == PostType.VIDEO:
+            media_type = "video"
+
+        return await facebook_service.create_post(
+            page_id=account.platform_user_id,
+            access_token=account.access_token,
+            message=post.content,
+            link=post.link_url,
+            media_url=media_url,
+            media_type=media_type
+        )
+
+    def replay(self, db: Session, user_id: int, dead_letter_ids: Optional[List[int]] = None) -> int:
+        """
+        Requeue dead-lettered posts for an immediate retry with a fresh retry budget.
+
+        Args:
+            db: Database session (committed here)
+            user_id: Owner of the dead letters
+            dead_letter_ids: Dead letters to replay; all pending ones when omitted
+
+        Returns:
+            Number of posts requeued
+        """
+        query = db.query(DeadLetterPost).filter(
+            DeadLetterPost.user_id == user_id,
+            DeadLetterPost.replayed_at.is_(None)
+        )
+        if dead_letter_ids:
+            query = query.filter(DeadLetterPost.id.in_(dead_letter_ids))
+
+        dead_letters = query.all()
+        if not dead_letters:
+            return 0
+
+        now = datetime.utcnow()
+        post_ids = {dead_letter.post_id for dead_letter in dead_letters}
+        query.update({DeadLetterPost.replayed_at: now}, synchronize_session=False)
+        db.query(Post).filter(
+            Post.id.in_(post_ids),
+            Post.status == PostStatus.FAILED
+        ).update({
+            Post.retry_count: 0,
+            Post.next_retry_at: now
+        }, synchronize_session=False)
+        db.commit()
+
+        logger.info(f"🔁 Replaying {len(post_ids)} dead-lettered posts for user {user_id}")
+        return len(post_ids)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return retry counters."""
+        return {
+            "running": self.running,
+            "retried": self.retried,
+            "recovered": self.recovered,
+            "dead_lettered": self.dead_lettered,
+            "interrupted": self.interrupted,
+        }
+
+
+# Global publish retry instance
+publish_retry_service = PublishRetryService()
@@ -0,0 +1,297 @@
+import asyncio
+import json
+import logging
+from contextlib import contextmanager
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.models.post import Post
+from app.models.scheduled_post import ScheduledPost
+from app.models.social_account import SocialAccount
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - only needed with PUSH_BROKER_URL
+    aioredis = None
+
+# Called on the event loop with (user_id, event) for every published event
+Deliver = Callable[[int, Dict[str, Any]], None]
+
+
+class InMemoryBroker:
+    """Fan-out within this process (single-instance deployments)."""
+
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver):
+        self._deliver = deliver
+
+    async def publish(self, user_id: int, event: Dict[str, Any]):
+        if self._deliver is not None:
+            self._deliver(user_id, event)
+
+    async def stop(self):
+        self._deliver = None
+
+
+class RedisBroker:
+    """
+    Fan-out across instances over a Redis pub/sub channel.
+
+    Every instance publishes its events to the channel and delivers what it
+    receives from it to its own connections, so a user's browser gets the
+    event whichever instance it is connected to.
+    """
+
+    def __init__(self, url: str, channel: str):
+        if aioredis is None:
+            raise RuntimeError("PUSH_BROKER_URL needs the redis package (pip install redis)")
+        self.url = url
+        self.channel = channel
+        self._client = None
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, deliver: Deliver):
+        self._client = aioredis.from_url(self.url)
+        self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.channel)
+        self._listener = asyncio.create_task(self._listen(deliver))
+
+    async def _listen(self, deliver: Deliver):
+        while True:
+            try:
+                async for message in self._pubsub.listen():
+                    try:
+                        data = json.loads(message["data"])
+                        deliver(data["user_id"], data["event"])
+                    except (KeyError, TypeError, ValueError) as e:
+                        logger.warning(f"Ignoring malformed push message: {e}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # The client resubscribes when it reconnects
+                logger.error(f"Push broker connection lost: {e}")
+                await asyncio.sleep(1)
+
+    async def publish(self, user_id: int, event: Dict[str, Any]):
+        await self._client.publish(self.channel, json.dumps({"user_id": user_id, "event": event}))
+
+    async def stop(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            await self._client.aclose()
+            self._pubsub = self._client = None
+
+
+def create_broker(url: Optional[str], channel: str):
+    """In-process fan-out without a URL, Redis pub/sub for ``redis://`` URLs."""
+    if not url:
+        return InMemoryBroker()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBroker(url, channel)
+    raise ValueError(f"Unsupported push broker URL: {url}")
+
+
+class PushHub:
+    """
+    Per-user push channel for live dashboard updates.
+
+    Each open SSE/WebSocket connection subscribes a bounded queue for its
+    user; events go through the broker and are fanned out to the queues of
+    that user's connections. A connection that doesn't keep up loses its
+    oldest events rather than holding up the others.
+    """
+
+    def __init__(self, broker, queue_size: int):
+        self.broker = broker
+        self.queue_size = queue_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+
+        # Metrics
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    async def start(self):
+        """Connect the broker; events published before this are dropped."""
+        if self._loop is not None:
+            return
+        await self.broker.start(self._deliver)
+        self._loop = asyncio.get_running_loop()
+        logger.info(f"📡 Push hub started ({type(self.broker).__name__})")
+
+    async def stop(self):
+        """Disconnect the broker and end every open stream."""
+        if self._loop is None:
+            return
+        self._loop = None
+        await self.broker.stop()
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._put(queue, None)
+        logger.info("🛑 Push hub stopped")
+
+    def publish(self, user_id: int, event: Dict[str, Any]):
+        """Send an event to the user's connections on every instance. Safe to call from any thread."""
+        loop = self._loop
+        if loop is None:
+            return
+        self.published += 1
+        asyncio.run_coroutine_threadsafe(self._publish(user_id, event), loop)
+
+    async def _publish(self, user_id: int, event: Dict[str, Any]):
+        try:
+            await self.broker.publish(user_id, event)
+        except Exception as e:
+            logger.error(f"Failed to publish push event {event.get('type')}: {e}")
+
+    def _deliver(self, user_id: int, event: Dict[str, Any]):
+        for queue in self._subscribers.get(user_id, ()):
+            self._put(queue, event)
+            self.delivered += 1
+
+    def _put(self, queue: asyncio.Queue, event: Optional[Dict[str, Any]]):
+        if queue.full():
+            queue.get_nowait()
+            self.dropped += 1
+        queue.put_nowait(event)
+
+    @contextmanager
+    def subscription(self, user_id: int) -> Iterator[asyncio.Queue]:
+        """
+        Subscribe a connection to the user's events for the duration of the block.
+
+        The queue yields event dicts, then None when the hub shuts down.
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        try:
+            yield queue
+        finally:
+            queues = self._subscribers.get(user_id)
+            if queues is not None:
+                queues.discard(queue)
+                if not queues:
+                    del self._subscribers[user_id]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return broker, connection and event counters."""
+        return {
+            "broker": type(self.broker).__name__,
+            "users": len(self._subscribers),
+            "connections": sum(len(queues) for queues in self._subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+
+# Global push hub instance
+push_hub = PushHub(
+    broker=create_broker(settings.push_broker_url, settings.push_channel),
+    queue_size=settings.push_queue_size
+)
+
+
+# Events are collected at flush and published once the transaction commits,
+# so nothing is announced that a rollback takes back
+_PENDING_EVENTS = "push_events"
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _changed(obj, attribute: str) -> Tuple[bool, Any]:
+    """
+    Whether the attribute changed in this flush, and its previous value.
+
+    The previous value is None if it wasn't loaded (set after a commit
+    expired the object).
+    """
+    history = inspect(obj).attrs[attribute].history
+    return bool(history.added), history.deleted[0] if history.deleted else None
+
+
+def _post_events(post: Post, is_new: bool) -> List[Dict[str, Any]]:
+    changed, _ = _changed(post, "status")
+    if not (changed or is_new):
+        return []
+    return [{
+        "type": "post.status",
+        "post_id": post.id,
+        "social_account_id": post.social_account_id,
+        "status": _json_value(post.status),
+        "platform_post_id": post.platform_post_id,
+        "error_message": post.error_message,
+    }]
+
+
+def _scheduled_post_events(scheduled_post: ScheduledPost) -> List[Dict[str, Any]]:
+    changed, _ = _changed(scheduled_post, "last_executed")
+    if not changed or scheduled_post.last_executed is None:
+        return []
+    return [{
+        "type": "scheduled_post.executed",
+        "scheduled_post_id": scheduled_post.id,
+        "last_executed": _json_value(scheduled_post.last_executed),
+        "next_execution": _json_value(scheduled_post.next_execution),
+    }]
+
+
+def _account_events(account: SocialAccount) -> List[Dict[str, Any]]:
+    changed, was_connected = _changed(account, "is_connected")
+    if not changed or account.is_connected or was_connected is False:
+        return []
+    return [{
+        "type": "account.disconnected",
+        "account_id": account.id,
+        "platform": account.platform,
+        # Disconnecting on request clears the token; a dead token keeps it
+        "reason": "token_expired" if account.access_token else "disconnected",
+    }]
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_push_events(session, flush_context):
+    events = []
+    for obj in session.new:
+        if isinstance(obj, Post):
+            events += [(obj.user_id, e) for e in _post_events(obj, is_new=True)]
+    for obj in session.dirty:
+        if isinstance(obj, Post):
+            events += [(obj.user_id, e) for e in _post_events(obj, is_new=False)]
+        elif isinstance(obj, ScheduledPost):
+            events += [(obj.user_id, e) for e in _scheduled_post_events(obj)]
+        elif isinstance(obj, SocialAccount):
+            events += [(obj.user_id, e) for e in _account_events(obj)]
+    if events:
+        session.info.setdefault(_PENDING_EVENTS, []).extend(events)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_push_events(session):
+    for user_id, push_event in session.info.pop(_PENDING_EVENTS, ()):
+        push_hub.publish(user_id, push_event)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_push_events(session):
+    session.info.pop(_PENDING_EVENTS, None)
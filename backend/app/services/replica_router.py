@@ -0,0 +1,212 @@
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+from fastapi import Request
+from sqlalchemy import text
+from app.config import get_settings
+from app.database import (
+    AsyncReplicaSessionLocal, AsyncSessionLocal, ReplicaSessionLocal, SessionLocal, replica_engine
+)
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+try:
+    import redis
+    import redis.asyncio as aioredis
+except ImportError:  # pragma: no cover - only needed with REPLICA_STICKY_URL
+    redis = aioredis = None
+
+# Seconds since the last replayed transaction, or 0 while fully caught up
+# (an idle primary writes nothing, so the replay timestamp alone would drift)
+POSTGRES_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+
+def session_key(request: Request) -> Optional[str]:
+    """Identify the client session a request belongs to (its bearer token)."""
+    return request.headers.get("authorization")
+
+
+class ReplicaRouter:
+    """
+    Decides whether a read-only request may be served by the read replica.
+
+    Reads go to the replica unless the client session wrote something within
+    the last ``sticky_seconds`` (read-your-writes: a dashboard refresh right
+    after creating a post must see it), or the replica's measured lag is
+    above ``max_lag`` or unknown. Lag is sampled by a background loop so the
+    routing decision never costs a query.
+
+    Writes are remembered in this process, which is enough for a single
+    worker. With several workers or instances the follow-up read usually
+    lands elsewhere, so with ``sticky_url`` set they are also stored in
+    Redis as keys expiring after ``sticky_seconds``, and a read not pinned
+    locally checks there (one EXISTS). If Redis can't be reached the read
+    goes to the primary.
+    """
+
+    def __init__(self, max_lag: float, check_interval: float, sticky_seconds: float, sticky_url: Optional[str] = None):
+        self.enabled = ReplicaSessionLocal is not None
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.sticky_seconds = sticky_seconds
+        self.running = False
+        self.lag: Optional[float] = None
+        self._lock = threading.Lock()
+        self._last_write: Dict[str, float] = {}
+        self._redis = None
+        self._async_redis = None
+        if self.enabled and sticky_url:
+            if redis is None:
+                raise RuntimeError("REPLICA_STICKY_URL needs the redis package (pip install redis)")
+            self._redis = redis.Redis.from_url(sticky_url)
+            self._async_redis = aioredis.from_url(sticky_url)
+
+        # Metrics
+        self.replica_reads = 0
+        self.primary_reads = 0
+        self.sticky_reads = 0
+
+    async def start(self):
+        """Start the replica lag monitor."""
+        if self.running or not self.enabled:
+            return
+
+        self.running = True
+        logger.info(f"🪞 Read replica routing started (max lag {self.max_lag}s)")
+
+        while self.running:
+            self.lag = await asyncio.to_thread(self.measure_lag)
+            self._forget_old_writes()
+            await asyncio.sleep(self.check_interval)
+
+    def stop(self):
+        """Stop the lag monitor."""
+        self.running = False
+        logger.info("🛑 Read replica routing stopped")
+
+    def measure_lag(self) -> Optional[float]:
+        """Return the replica's replication lag in seconds, or None if it can't be reached."""
+        try:
+            with replica_engine.connect() as conn:
+                if conn.dialect.name != "postgresql":
+                    return 0.0
+                return float(conn.execute(POSTGRES_LAG_QUERY).scalar() or 0)
+        except Exception as e:
+            logger.warning(f"Read replica lag check failed: {e}")
+            return None
+
+    def _forget_old_writes(self):
+        cutoff = time.monotonic() - self.sticky_seconds
+        with self._lock:
+            for key in [key for key, written_at in self._last_write.items() if written_at < cutoff]:
+                del self._last_write[key]
+
+    def _shared_key(self, key: str) -> str:
+        # The key is a bearer token: only its hash leaves the process
+        return f"replica_sticky:{hashlib.sha256(key.encode()).hexdigest()}"
+
+    def _wrote_here(self, key: str) -> bool:
+        with self._lock:
+            written_at = self._last_write.get(key)
+        return written_at is not None and time.monotonic() - written_at < self.sticky_seconds
+
+    async def mark_write(self, key: Optional[str]):
+        """Pin the session's reads to the primary for the next ``sticky_seconds``."""
+        if not self.enabled or not key:
+            return
+        with self._lock:
+            self._last_write[key] = time.monotonic()
+        if self._async_redis is not None:
+            try:
+                await self._async_redis.set(self._shared_key(key), 1, px=int(self.sticky_seconds * 1000))
+            except Exception as e:
+                logger.warning(f"Could not share read-your-writes state: {e}")
+
+    def use_replica(self, key: Optional[str]) -> bool:
+        """Decide where the session's next read goes (blocking; for sync dependencies)."""
+        if not self.enabled:
+            return False
+        if key and not self._wrote_here(key) and self._redis is not None:
+            try:
+                return self._route(bool(self._redis.exists(self._shared_key(key))))
+            except Exception as e:
+                logger.warning(f"Read-your-writes check failed, reading from the primary: {e}")
+                return self._route(True)
+        return self._route(bool(key) and self._wrote_here(key))
+
+    async def use_replica_async(self, key: Optional[str]) -> bool:
+        """``use_replica`` for async dependencies."""
+        if not self.enabled:
+            return False
+        if key and not self._wrote_here(key) and self._async_redis is not None:
+            try:
+                return self._route(bool(await self._async_redis.exists(self._shared_key(key))))
+            except Exception as e:
+                logger.warning(f"Read-your-writes check failed, reading from the primary: {e}")
+                return self._route(True)
+        return self._route(bool(key) and self._wrote_here(key))
+
+    def _route(self, sticky: bool) -> bool:
+        if sticky:
+            self.sticky_reads += 1
+            return False
+
+        if self.lag is None or self.lag > self.max_lag:
+            self.primary_reads += 1
+            return False
+
+        self.replica_reads += 1
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return routing counters and the last measured lag."""
+        with self._lock:
+            sticky_sessions = len(self._last_write)
+        return {
+            "enabled": self.enabled,
+            "lag_seconds": self.lag,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+            "sticky_reads": self.sticky_reads,
+            "sticky_sessions": sticky_sessions,
+            "shared_stickiness": self._redis is not None,
+        }
+
+
+# Global replica router instance
+replica_router = ReplicaRouter(
+    max_lag=settings.replica_max_lag,
+    check_interval=settings.replica_lag_check_interval,
+    sticky_seconds=settings.replica_sticky_seconds,
+    sticky_url=settings.replica_sticky_url
+)
+
+
+# Dependency to get a session for read-only endpoints
+def get_read_db(request: Request):
+    use_replica = replica_router.use_replica(session_key(request))
+    db = ReplicaSessionLocal() if use_replica else SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# Dependency to get an async session for read-only endpoints
+async def get_async_read_db(request: Request):
+    factory = AsyncSessionLocal
+    if AsyncReplicaSessionLocal is not None and await replica_router.use_replica_async(session_key(request)):
+        factory = AsyncReplicaSessionLocal
+    if factory is None:
+        raise RuntimeError("Async database driver not installed (pip install asyncpg aiosqlite)")
+    async with factory() as db:
+        yield db
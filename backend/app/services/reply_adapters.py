@@ -0,0 +1,61 @@
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+from app.services.facebook_service import facebook_service
+from app.services.instagram_service import instagram_service
+from app.services.social_events import MENTION, SocialEvent
+
+logger = logging.getLogger(__name__)
+
+
+class ReplyAdapter(ABC):
+    """
+    Platform specific side of the auto-reply pipeline.
+
+    The rule engine works on SocialEvents only; an adapter fills in anything
+    the webhook left out and delivers the generated reply. Supporting a new
+    platform means adding a parser in ``social_events`` and an adapter here.
+    """
+
+    platform: str = ""
+
+    async def load_text(self, event: SocialEvent, access_token: str) -> str:
+        """Return the event text, fetching it if the delivery didn't include it."""
+        return event.text
+
+    @abstractmethod
+    async def send_reply(self, event: SocialEvent, message: str, access_token: str) -> Dict[str, Any]:
+        """Publish a reply to the event. Returns a dict with success, reply_id and error."""
+
+
+class FacebookReplyAdapter(ReplyAdapter):
+    platform = "facebook"
+
+    async def send_reply(self, event: SocialEvent, message: str, access_token: str) -> Dict[str, Any]:
+        return await facebook_service.reply_to_comment(event.object_id, message, access_token)
+
+
+class InstagramReplyAdapter(ReplyAdapter):
+    platform = "instagram"
+
+    async def load_text(self, event: SocialEvent, access_token: str) -> str:
+        if event.text or event.kind != MENTION:
+            return event.text
+        return await instagram_service.get_mention_text(
+            event.account_id, event.post_id, access_token, comment_id=event.comment_id
+        ) or ""
+
+    async def send_reply(self, event: SocialEvent, message: str, access_token: str) -> Dict[str, Any]:
+        if event.kind == MENTION:
+            # Mentions live on other accounts' media and can only be answered through the mentions edge
+            return await instagram_service.reply_to_mention(
+                event.account_id, event.post_id, message, access_token, comment_id=event.comment_id
+            )
+        return await instagram_service.reply_to_comment(event.object_id, message, access_token)
+
+
+# platform -> adapter
+REPLY_ADAPTERS: Dict[str, ReplyAdapter] = {
+    adapter.platform: adapter
+    for adapter in (FacebookReplyAdapter(), InstagramReplyAdapter())
+}
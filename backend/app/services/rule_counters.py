@@ -0,0 +1,313 @@
+import asyncio
+import logging
+import threading
+from datetime import date, datetime, time, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from sqlalchemy import and_, bindparam, case, func, or_, select, update
+from app.config import get_settings
+from app.database import engine
+from app.services.db_writer import db_writer
+from app.models.automation_rule import AutomationRule
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+rules_table = AutomationRule.__table__
+
+
+def _zone(name: Optional[str]) -> ZoneInfo:
+    try:
+        return ZoneInfo(name or "UTC")
+    except (ZoneInfoNotFoundError, ValueError):
+        return ZoneInfo("UTC")
+
+
+def _local_date(tz_name: Optional[str], now: datetime) -> date:
+    return now.astimezone(_zone(tz_name)).date()
+
+
+class RuleCounterStore:
+    """
+    Write-behind execution counters for automation rules.
+
+    Workers reserve executions against an in-memory daily count (so
+    ``daily_limit`` holds in real time across concurrent workers) and the
+    accumulated deltas are flushed periodically as one batched
+    ``UPDATE ... SET x = x + :delta`` statement instead of a row write per event.
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self.running = False
+        self._lock = threading.Lock()
+        # rule_id -> (local date, executions that day)
+        self._daily: Dict[int, Tuple[date, int]] = {}
+        # rule_id -> pending deltas not yet written to the database
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        # timezone -> local date of the last daily reset check
+        self._reset_dates: Dict[str, date] = {}
+
+        # Metrics
+        self.flushes = 0
+        self.rows_flushed = 0
+
+    async def start(self):
+        """Start the periodic flush loop."""
+        if self.running:
+            return
+
+        self.running = True
+        logger.info(f"🧮 Rule counter flusher started (every {self.flush_interval}s)")
+
+        while self.running:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush_async()
+                await self.reset_daily_counts()
+            except Exception as e:
+                logger.error(f"Error flushing rule counters: {e}")
+
+    def stop(self):
+        """Stop the loop and write out whatever is still pending."""
+        self.running = False
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Error flushing rule counters on shutdown: {e}")
+        logger.info("🛑 Rule counter flusher stopped")
+
+    def _new_delta(self) -> Dict[str, Any]:
+        return {
+            "total": 0,
+            "daily": 0,
+            "reset_daily": False,
+            "success": 0,
+            "error": 0,
+            "last_execution_at": None,
+            "last_success_at": None,
+            "last_error_at": None,
+            "last_error_message": None,
+        }
+
+    def reserve(self, rule: AutomationRule, enforce_limit: bool = True) -> bool:
+        """
+        Count one execution of a rule, unless it has reached its daily limit.
+
+        Returns:
+            True if the execution may proceed
+        """
+        now = datetime.now(timezone.utc)
+        today = _local_date(rule.timezone, now)
+
+        with self._lock:
+            if rule.id in self._daily:
+                day, count = self._daily[rule.id]
+            else:
+                # Seed from the database row the first time this rule is seen
+                last = rule.last_execution_at
+                if last is not None and last.tzinfo is None:
+                    last = last.replace(tzinfo=timezone.utc)
+                day = _local_date(rule.timezone, last) if last else today
+                count = rule.daily_count or 0
+
+            delta = self._pending.setdefault(rule.id, self._new_delta())
+            if day != today:
+                # First execution of a new local day
+                count = 0
+                delta["daily"] = 0
+                delta["reset_daily"] = True
+
+            if enforce_limit and rule.daily_limit and count >= rule.daily_limit:
+                self._daily[rule.id] = (today, count)
+                return False
+
+            self._daily[rule.id] = (today, count + 1)
+            delta["total"] += 1
+            delta["daily"] += 1
+            delta["last_execution_at"] = now
+            return True
+
+    def record_outcome(self, rule_id: int, success: bool, error_message: Optional[str] = None):
+        """Record the result of a reserved execution."""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            delta = self._pending.setdefault(rule_id, self._new_delta())
+            if success:
+                delta["success"] += 1
+                delta["last_success_at"] = now
+            else:
+                delta["error"] += 1
+                delta["last_error_at"] = now
+                delta["last_error_message"] = error_message
+
+    def daily_count(self, rule: AutomationRule) -> int:
+        """Current in-memory daily count for a rule (includes unflushed executions)."""
+        with self._lock:
+            if rule.id in self._daily:
+                day, count = self._daily[rule.id]
+                if day == _local_date(rule.timezone, datetime.now(timezone.utc)):
+                    return count
+                return 0
+        return rule.daily_count or 0
+
+    async def flush_async(self) -> int:
+        """
+        Write pending deltas with a single batched UPDATE.
+
+        Returns:
+            Number of rule rows updated
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        write = self._write_job(pending)
+        try:
+            await db_writer.execute_async(write)
+        except Exception:
+            self._restore(pending)
+            raise
+
+        self.flushes += 1
+        self.rows_flushed += len(pending)
+        return len(pending)
+
+    def flush(self) -> int:
+        """``flush_async`` for shutdown, when the event loop is going away: blocks until written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return 0
+
+        write = self._write_job(pending)
+        try:
+            db_writer.execute(write)
+        except Exception:
+            self._restore(pending)
+            raise
+
+        self.flushes += 1
+        self.rows_flushed += len(pending)
+        return len(pending)
+
+    def _write_job(self, pending: Dict[int, Dict[str, Any]]):
+        """Batched UPDATE adding the pending deltas to their rules."""
+        rows: List[Dict[str, Any]] = [
+            {
+                "b_rule_id": rule_id,
+                "b_total": delta["total"],
+                "b_daily": delta["daily"],
+                "b_reset_daily": delta["reset_daily"],
+                "b_success": delta["success"],
+                "b_error": delta["error"],
+                "b_last_execution_at": delta["last_execution_at"],
+                "b_last_success_at": delta["last_success_at"],
+                "b_last_error_at": delta["last_error_at"],
+                "b_last_error_message": delta["last_error_message"],
+            }
+            for rule_id, delta in pending.items()
+        ]
+
+        c = rules_table.c
+        stmt = (
+            update(rules_table)
+            .where(c.id == bindparam("b_rule_id"))
+            .values(
+                total_executions=func.coalesce(c.total_executions, 0) + bindparam("b_total"),
+                daily_count=case(
+                    (bindparam("b_reset_daily"), bindparam("b_daily")),
+                    else_=func.coalesce(c.daily_count, 0) + bindparam("b_daily")
+                ),
+                success_count=func.coalesce(c.success_count, 0) + bindparam("b_success"),
+                error_count=func.coalesce(c.error_count, 0) + bindparam("b_error"),
+                last_execution_at=func.coalesce(bindparam("b_last_execution_at"), c.last_execution_at),
+                last_success_at=func.coalesce(bindparam("b_last_success_at"), c.last_success_at),
+                last_error_at=func.coalesce(bindparam("b_last_error_at"), c.last_error_at),
+                last_error_message=func.coalesce(bindparam("b_last_error_message"), c.last_error_message),
+            )
+        )
+
+        return lambda conn: conn.execute(stmt, rows)
+
+    def _restore(self, pending: Dict[int, Dict[str, Any]]):
+        """Put the deltas of a failed write back so they are retried on the next flush."""
+        with self._lock:
+            for rule_id, delta in pending.items():
+                current = self._pending.get(rule_id)
+                if current is None:
+                    self._pending[rule_id] = delta
+                    continue
+                for key in ("total", "success", "error"):
+                    current[key] += delta[key]
+                if not current["reset_daily"]:
+                    current["daily"] += delta["daily"]
+                    current["reset_daily"] = delta["reset_daily"]
+                for key in ("last_execution_at", "last_success_at", "last_error_at", "last_error_message"):
+                    current[key] = current[key] or delta[key]
+
+    async def reset_daily_counts(self) -> int:
+        """
+        Zero ``daily_count`` for rules whose local day has rolled over.
+
+        Runs one bulk UPDATE covering every timezone that crossed midnight
+        since the last check (all timezones on the first check, which also
+        catches up after downtime). Rows executed since their local midnight
+        are left alone.
+
+        Returns:
+            Number of rows reset
+        """
+        now = datetime.now(timezone.utc)
+        c = rules_table.c
+
+        timezones = await asyncio.to_thread(self._timezones)
+
+        crossed = []
+        for tz_name in set(timezones):
+            today = _local_date(tz_name, now)
+            if self._reset_dates.get(tz_name) == today:
+                continue
+            self._reset_dates[tz_name] = today
+            midnight = datetime.combine(today, time(0), tzinfo=_zone(tz_name)).astimezone(timezone.utc)
+            crossed.append((tz_name, midnight))
+
+        if not crossed:
+            return 0
+
+        conditions = [
+            and_(
+                func.coalesce(c.timezone, "UTC") == tz_name,
+                or_(c.last_execution_at.is_(None), c.last_execution_at < midnight)
+            )
+            for tz_name, midnight in crossed
+        ]
+        stmt = update(rules_table).where(c.daily_count != 0, or_(*conditions)).values(daily_count=0)
+
+        rowcount = await db_writer.execute_async(lambda conn: conn.execute(stmt).rowcount)
+
+        if rowcount:
+            logger.info(f"🌙 Reset daily counts for {rowcount} rules ({len(crossed)} timezones)")
+        return rowcount
+
+    def _timezones(self) -> List[str]:
+        c = rules_table.c
+        with engine.connect() as conn:
+            return [row[0] or "UTC" for row in conn.execute(select(c.timezone).distinct())]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return flush counters and the number of rules with pending deltas."""
+        with self._lock:
+            pending = len(self._pending)
+        return {
+            "pending_rules": pending,
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+        }
+
+
+# Global counter store instance
+rule_counters = RuleCounterStore(flush_interval=settings.rule_counter_flush_interval)
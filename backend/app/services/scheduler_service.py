@@ -9,6 +9,9 @@ from app.models.social_account import SocialAccount
 from app.models.post import Post, PostStatus, PostType
 from app.services.groq_service import groq_service
 from app.services.facebook_service import facebook_service
+from app.services.action_limiter import action_limiter
+from app.services.payload_store import payload_store
+from app.services.publish_retry_service import publish_retry_service
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +58,14 @@ class SchedulerService:
                 logger.info(f"📅 Found {len(due_posts)} scheduled posts due for execution")
             
             for scheduled_post in due_posts:
+                # Automated posts share the account's action budget with auto-replies
+                wait = action_limiter.acquire(scheduled_post.social_account_id)
+                if wait:
+                    scheduled_post.next_execution = now + timedelta(seconds=wait)
+                    db.commit()
+                    logger.info(f"⏳ Action budget exhausted, scheduled post {scheduled_post.id} postponed by {wait:.0f}s")
+                    continue
+                
                 try:
                     await self.execute_scheduled_post(scheduled_post, db)
                 except Exception as e:
@@ -104,18 +115,18 @@ class SchedulerService:
                 content=generated_content,
                 post_type=PostType.TEXT,
                 status=PostStatus.SCHEDULED,
-                is_auto_post=True,
-                metadata={
-                    "scheduled_post_id": scheduled_post.id,
-                    "ai_generated": groq_service.is_available(),
-                    "original_prompt": scheduled_post.prompt,
-                    "execution_time": datetime.utcnow().isoformat()
-                }
+                is_auto_post=True
             )
             
             db.add(post)
             db.commit()
             db.refresh(post)
+            payload_store.record(post.id, metadata={
+                "scheduled_post_id": scheduled_post.id,
+                "ai_generated": groq_service.is_available(),
+                "original_prompt": scheduled_post.prompt,
+                "execution_time": datetime.utcnow().isoformat()
+            })
             
             # Post to Facebook
             try:
@@ -130,17 +141,18 @@ class SchedulerService:
                 if facebook_result and facebook_result.get("success"):
                     post.status = PostStatus.PUBLISHED
                     post.platform_post_id = facebook_result.get("post_id")
-                    post.platform_response = facebook_result
+                    payload_store.record(post.id, platform_response=facebook_result)
                     logger.info(f"✅ Successfully posted scheduled content to Facebook: {post.id}")
                 else:
-                    post.status = PostStatus.FAILED
-                    post.error_message = facebook_result.get("error", "Unknown Facebook API error")
                     logger.error(f"❌ Failed to post to Facebook: {facebook_result.get('error')}")
+                    publish_retry_service.record_failure(db, post, {
+                        **facebook_result,
+                        "error": facebook_result.get("error", "Unknown Facebook API error")
+                    })
                     
             except Exception as fb_error:
                 logger.error(f"Facebook posting error: {fb_error}")
-                post.status = PostStatus.FAILED
-                post.error_message = str(fb_error)
+                publish_retry_service.record_failure(db, post, {"success": False, "error": str(fb_error)})
             
             # Update scheduled post execution info
             scheduled_post.last_executed = datetime.utcnow()
@@ -0,0 +1,132 @@
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+from app.services.comment_store import parse_event_time
+
+logger = logging.getLogger(__name__)
+
+# Event kinds
+COMMENT = "comment"
+MENTION = "mention"
+
+
+@dataclass
+class SocialEvent:
+    """
+    Platform-independent inbound engagement event.
+
+    Webhook deliveries and polled comments from every platform are normalized
+    into this shape before they reach the event queue, so the rule engine and
+    the comment store never look at platform payloads.
+    """
+
+    platform: str                       # "facebook" | "instagram"
+    kind: str                           # COMMENT | MENTION
+    account_id: str                     # Page ID / Instagram business user ID the event belongs to
+    object_id: str                      # Comment ID (or media ID for caption mentions)
+    post_id: Optional[str] = None       # Post / media the comment was made on
+    parent_id: Optional[str] = None     # Parent comment for threaded replies
+    text: str = ""
+    author_id: Optional[str] = None
+    author_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+    source: str = "webhook"
+    received_at: float = field(default_factory=time.time)
+    deferrals: int = 0                  # Times the reply was postponed by the action limiter
+
+    @property
+    def comment_id(self) -> Optional[str]:
+        """Comment ID, or None for a mention in a media caption."""
+        return self.object_id if self.object_id != self.post_id else None
+
+    @property
+    def is_own(self) -> bool:
+        """True when the account itself is the author (including our own replies)."""
+        return bool(self.author_id) and self.author_id == self.account_id
+
+
+def _parse_facebook_feed(account_id: str, value: Dict[str, Any], raw: Dict[str, Any]) -> Optional[SocialEvent]:
+    if value.get("item") != "comment" or value.get("verb") != "add" or not value.get("comment_id"):
+        return None
+
+    author = value.get("from") or {}
+    post_id = value.get("post_id")
+    parent_id = value.get("parent_id")
+    return SocialEvent(
+        platform="facebook",
+        kind=COMMENT,
+        account_id=account_id,
+        object_id=str(value["comment_id"]),
+        post_id=post_id,
+        # Top-level comments carry the post as their parent
+        parent_id=parent_id if parent_id != post_id else None,
+        text=value.get("message") or "",
+        author_id=author.get("id"),
+        author_name=author.get("name"),
+        created_at=parse_event_time(value.get("created_time"))
+    )
+
+
+def _parse_instagram_comment(account_id: str, value: Dict[str, Any], raw: Dict[str, Any]) -> Optional[SocialEvent]:
+    if not value.get("id"):
+        return None
+
+    author = value.get("from") or {}
+    return SocialEvent(
+        platform="instagram",
+        kind=COMMENT,
+        account_id=account_id,
+        object_id=str(value["id"]),
+        post_id=(value.get("media") or {}).get("id"),
+        parent_id=value.get("parent_id"),
+        text=value.get("text") or "",
+        author_id=author.get("id"),
+        author_name=author.get("username"),
+        # Instagram comment payloads have no timestamp of their own
+        created_at=parse_event_time(raw.get("entry_time"))
+    )
+
+
+def _parse_instagram_mention(account_id: str, value: Dict[str, Any], raw: Dict[str, Any]) -> Optional[SocialEvent]:
+    media_id = value.get("media_id")
+    if not media_id:
+        return None
+
+    # Mentions only carry IDs; the text is fetched by the reply adapter when needed
+    return SocialEvent(
+        platform="instagram",
+        kind=MENTION,
+        account_id=account_id,
+        object_id=str(value.get("comment_id") or media_id),
+        post_id=str(media_id),
+        created_at=parse_event_time(raw.get("entry_time"))
+    )
+
+
+# (platform, webhook field) -> parser
+EVENT_PARSERS: Dict[tuple, Callable[[str, Dict[str, Any], Dict[str, Any]], Optional[SocialEvent]]] = {
+    ("facebook", "feed"): _parse_facebook_feed,
+    ("instagram", "comments"): _parse_instagram_comment,
+    ("instagram", "live_comments"): _parse_instagram_comment,
+    ("instagram", "mentions"): _parse_instagram_mention,
+}
+
+
+def normalize_event(raw: Dict[str, Any]) -> Optional[SocialEvent]:
+    """
+    Convert a raw webhook change (see ``extract_events``) into a SocialEvent.
+
+    Returns:
+        The normalized event, or None for fields and verbs we don't act on
+    """
+    parser = EVENT_PARSERS.get((raw.get("platform"), raw.get("field")))
+    if parser is None:
+        logger.debug(f"Ignoring unsupported event: {raw.get('platform')}/{raw.get('field')}")
+        return None
+
+    event = parser(str(raw.get("account_id")), raw.get("value") or {}, raw)
+    if event is not None and raw.get("received_at"):
+        event.received_at = raw["received_at"]
+    return event
@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import event
+from app.config import get_settings
+from app.models.user import User
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Immutable copy of the user columns request handlers read."""
+
+    id: int
+    email: str
+    username: str
+    full_name: Optional[str]
+    is_active: bool
+    is_superuser: bool
+    timezone: Optional[str]
+    created_at: Optional[datetime]
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserSnapshot":
+        return cls(**{field.name: getattr(user, field.name) for field in fields(cls)})
+
+
+class UserCache:
+    """
+    Bounded TTL cache of authenticated users, keyed by the token's subject (email).
+
+    Authentication resolves the bearer token's user on every request; with
+    the snapshot cached, endpoints that don't otherwise need the database
+    make no query at all. Entries are dropped as soon as the ORM updates or
+    deletes the user in this process; ``ttl`` bounds how long a change made
+    elsewhere (another worker, a raw SQL update) can go unnoticed.
+    """
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._users: "OrderedDict[str, Tuple[float, UserSnapshot]]" = OrderedDict()
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, email: str) -> Optional[UserSnapshot]:
+        """Return the cached user, or None if absent or expired."""
+        if self.ttl <= 0:
+            return None
+
+        with self._lock:
+            entry = self._users.get(email)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._users[email]
+                self.misses += 1
+                return None
+            self._users.move_to_end(email)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, user: UserSnapshot) -> UserSnapshot:
+        """Cache a user snapshot and return it."""
+        if self.ttl > 0:
+            with self._lock:
+                self._users[user.email] = (time.monotonic() + self.ttl, user)
+                self._users.move_to_end(user.email)
+                if len(self._users) > self.max_size:
+                    self._users.popitem(last=False)
+        return user
+
+    def invalidate(self, *emails: str):
+        """Forget the given users, e.g. after they were updated or deleted."""
+        with self._lock:
+            for email in emails:
+                if self._users.pop(email, None) is not None:
+                    self.invalidations += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return cache occupancy and hit counters."""
+        with self._lock:
+            size = len(self._users)
+        return {
+            "size": size,
+            "capacity": self.max_size,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+# Global user cache instance
+user_cache = UserCache(
+    ttl=settings.user_cache_ttl,
+    max_size=settings.user_cache_size
+)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target):
+    user_cache.invalidate(target.email)
+
+
+@event.listens_for(User.email, "set", active_history=True)
+def _invalidate_previous_email(target, value, oldvalue, initiator):
+    # Tokens issued for the old address must not keep resolving to the user
+    if isinstance(oldvalue, str) and oldvalue != value:
+        user_cache.invalidate(oldvalue)
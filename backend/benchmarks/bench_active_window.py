@@ -0,0 +1,71 @@
+"""
+Benchmark: active-hours/active-days checks for automation rules.
+
+Compares evaluating the rule's time constraints naively on every event
+(parse "HH:MM" strings, convert the timestamp into the rule's timezone)
+with the precompiled weekly bitmap used by AutomationRule.can_execute.
+
+Usage (from the backend directory):
+    python benchmarks/bench_active_window.py
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.active_window import DAY_NAMES, compile_active_window
+
+CHECKS = 100_000
+
+RULES = [
+    ("09:00", "17:00", ("monday", "tuesday", "wednesday", "thursday", "friday"), "America/New_York"),
+    ("22:00", "06:00", ("saturday", "sunday"), "Europe/London"),
+    ("08:30", "20:00", None, "Asia/Kolkata"),
+    ("00:00", "12:00", ("monday",), "Australia/Sydney"),
+]
+
+
+def naive_check(start, end, days, tz_name, now):
+    local = now.astimezone(ZoneInfo(tz_name))
+    start_h, start_m = (int(part) for part in start.split(":"))
+    end_h, end_m = (int(part) for part in end.split(":"))
+    minute = local.hour * 60 + local.minute
+    begin, finish = start_h * 60 + start_m, end_h * 60 + end_m
+    day = DAY_NAMES[local.weekday()]
+
+    if finish > begin:
+        return (days is None or day in days) and begin <= minute < finish
+    if minute >= begin:
+        return days is None or day in days
+    previous_day = DAY_NAMES[(local.weekday() - 1) % 7]
+    return minute < finish and (days is None or previous_day in days)
+
+
+def main():
+    random.seed(42)
+    base = datetime.now(timezone.utc)
+    # Events arrive roughly in time order, spread over two weeks
+    events = sorted(base + timedelta(seconds=random.randrange(0, 14 * 86400)) for _ in range(CHECKS))
+    rules = [random.choice(RULES) for _ in range(CHECKS)]
+
+    started = time.perf_counter()
+    naive_hits = sum(naive_check(*rule, now) for rule, now in zip(rules, events))
+    naive_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compiled_hits = sum(compile_active_window(*rule).contains(now) for rule, now in zip(rules, events))
+    compiled_seconds = time.perf_counter() - started
+
+    print(f"{CHECKS:,} rule checks over {len(RULES)} rule configurations")
+    print(f"  naive (parse + tz convert): {naive_seconds * 1000:8.1f} ms  ({naive_seconds / CHECKS * 1e9:6.0f} ns/check)")
+    print(f"  compiled weekly bitmap:     {compiled_seconds * 1000:8.1f} ms  ({compiled_seconds / CHECKS * 1e9:6.0f} ns/check)")
+    print(f"  speedup: {naive_seconds / compiled_seconds:.1f}x, results agree: {naive_hits == compiled_hits}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: sync vs async database sessions under concurrent requests.
+
+Simulates an API handler that runs a slow query (DB latency, injected with
+a blocking SQL function) and then awaits a Graph API call (network latency,
+asyncio.sleep). With the sync session the query blocks the event loop, so
+concurrent requests serialize on the database part; with the async session
+(aiosqlite) the loop keeps serving other requests while queries run.
+
+Usage (from the backend directory):
+    python benchmarks/bench_async_db.py [--requests 200] [--concurrency 50] [--db-ms 5] [--net-ms 50]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Post, SocialAccount, User
+
+
+def _sleep_ms(ms):
+    time.sleep(ms / 1000)
+    return 0
+
+
+def register_sleep(sync_engine):
+    @event.listens_for(sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        dbapi_connection.create_function("sleep_ms", 1, _sleep_ms)
+
+
+def seed(engine, users=20, posts_per_user=50):
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    for u in range(users):
+        user = User(email=f"bench{u}@example.com", username=f"bench{u}", hashed_password="x")
+        db.add(user)
+        db.flush()
+        account = SocialAccount(user_id=user.id, platform="facebook", platform_user_id=f"page{u}", access_token="t")
+        db.add(account)
+        db.flush()
+        db.add_all([
+            Post(user_id=user.id, social_account_id=account.id, content=f"post {i}")
+            for i in range(posts_per_user)
+        ])
+    db.commit()
+    db.close()
+    return users
+
+
+async def run(handler, requests, concurrency, users):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i):
+        async with semaphore:
+            started = time.perf_counter()
+            await handler(i % users + 1)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[one(i) for i in range(requests)])
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return elapsed, statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--db-ms", type=float, default=5)
+    parser.add_argument("--net-ms", type=float, default=50)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    sync_engine = create_engine(f"sqlite:///{path}")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    register_sleep(sync_engine)
+    register_sleep(async_engine.sync_engine)
+    users = seed(sync_engine)
+
+    SyncSession = sessionmaker(bind=sync_engine)
+    AsyncSession = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def sync_handler(user_id):
+        db = SyncSession()
+        try:
+            db.execute(select(func.sleep_ms(args.db_ms)))
+            db.query(Post).filter(Post.user_id == user_id).order_by(Post.created_at.desc()).limit(50).all()
+        finally:
+            db.close()
+        await asyncio.sleep(args.net_ms / 1000)
+
+    async def async_handler(user_id):
+        async with AsyncSession() as db:
+            await db.execute(select(func.sleep_ms(args.db_ms)))
+            (await db.scalars(
+                select(Post).where(Post.user_id == user_id).order_by(Post.created_at.desc()).limit(50)
+            )).all()
+        await asyncio.sleep(args.net_ms / 1000)
+
+    print(
+        f"{args.requests} requests, concurrency {args.concurrency}, "
+        f"{args.db_ms:g} ms DB + {args.net_ms:g} ms network per request"
+    )
+    results = {}
+    for name, handler in (("sync session", sync_handler), ("async session", async_handler)):
+        elapsed, p50, p99 = await run(handler, args.requests, args.concurrency, users)
+        results[name] = elapsed
+        print(
+            f"  {name:14s} {elapsed:6.2f} s  {args.requests / elapsed:7.1f} req/s  "
+            f"p50 {p50 * 1000:7.1f} ms  p99 {p99 * 1000:7.1f} ms"
+        )
+    print(f"  throughput gain: {results['sync session'] / results['async session']:.1f}x")
+
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
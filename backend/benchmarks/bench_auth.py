@@ -0,0 +1,89 @@
+"""
+Benchmark: per-request cost of resolving the authenticated user.
+
+Calls the ``get_current_user`` dependency the way FastAPI does for an
+endpoint (fresh session, bearer credentials) for random users of a seeded
+SQLite file, with the user cache disabled and enabled. Reports the mean
+and p99 time per request and the queries issued per request.
+
+Usage (from the backend directory):
+    python benchmarks/bench_auth.py [--users 1000] [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.api.auth import create_access_token, get_current_user
+from app.database import Base
+from app.models import User
+from app.services.user_cache import user_cache
+
+
+async def run(Session, credentials, requests, queries):
+    rng = random.Random(42)
+    latencies = []
+    queries[0] = 0
+    for _ in range(requests):
+        started = time.perf_counter()
+        db = Session()
+        try:
+            await get_current_user(rng.choice(credentials), db)
+        finally:
+            db.close()
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return statistics.mean(latencies), latencies[int(len(latencies) * 0.99) - 1], queries[0] / requests
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"email": f"user{n}@example.com", "username": f"user{n}", "hashed_password": "x", "is_active": True}
+            for n in range(args.users)
+        ])
+    Session = sessionmaker(bind=engine)
+    credentials = [
+        HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token({"sub": f"user{n}@example.com"}))
+        for n in range(args.users)
+    ]
+
+    queries = [0]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_query(*_):
+        queries[0] += 1
+
+    print(f"{args.requests} authenticated requests over {args.users} users")
+    ttl = user_cache.ttl
+    for name, cache_ttl in (("no cache", 0), ("cached", ttl)):
+        user_cache.ttl = cache_ttl
+        mean, p99, per_request = asyncio.run(run(Session, credentials, args.requests, queries))
+        print(
+            f"  {name:8s} mean {mean * 1e6:7.1f} us  p99 {p99 * 1e6:7.1f} us  "
+            f"{per_request:5.3f} queries/request"
+        )
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: a dashboard refresh of ``/posts`` with compression and revalidation.
+
+Serves the real app (through ``TestClient``) from a seeded SQLite file and
+fetches one page of posts as a client would:
+
+  identity    no compression
+  gzip / br   compressed with ``Accept-Encoding`` (br needs ``brotli``)
+  304         revalidated with the ETag of the previous response; the
+              listing is unchanged, so nothing is loaded or serialized
+
+Reports the mean time per request and the bytes sent over the wire.
+
+Usage (from the backend directory):
+    python benchmarks/bench_conditional_get.py [--posts 500] [--repeat 50]
+"""
+
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The app connects on import, so point it at a scratch database first
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+os.environ.setdefault("DEBUG", "false")
+
+from fastapi.testclient import TestClient
+
+from app.api.auth import create_access_token
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models import Post, SocialAccount, User
+
+
+def random_text(rng, words):
+    return " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9))) for _ in range(words))
+
+
+def seed(count):
+    rng = random.Random(42)
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    user = User(email="bench@example.com", username="bench", full_name="Bench", hashed_password="x")
+    db.add(user)
+    db.flush()
+    account = SocialAccount(user_id=user.id, platform="facebook", platform_user_id="page", access_token="t")
+    db.add(account)
+    db.flush()
+    db.add_all([
+        Post(
+            user_id=user.id, social_account_id=account.id, hashtags=["summer", "sale"],
+            content=random_text(rng, 40)
+        )
+        for _ in range(count)
+    ])
+    db.commit()
+    db.close()
+
+
+def measure(client, url, headers, repeat):
+    response = client.get(url, headers=headers)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        response = client.get(url, headers=headers)
+    elapsed = (time.perf_counter() - started) / repeat
+    wire = int(response.headers.get("content-length", len(response.content)))
+    return elapsed, response.status_code, wire
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    seed(args.posts)
+    time.sleep(1.1)  # listings changed within the last second get no validators
+    client = TestClient(app)
+    auth = {"Authorization": f"Bearer {create_access_token({'sub': 'bench@example.com'})}"}
+    url = f"/api/social/posts?limit={args.posts}"
+    etag = client.get(url, headers=auth).headers["etag"]
+
+    print(f"GET /posts?limit={args.posts}, mean of {args.repeat} requests")
+    for name, headers in (
+        ("identity", {"Accept-Encoding": "identity"}),
+        ("gzip", {"Accept-Encoding": "gzip"}),
+        ("br", {"Accept-Encoding": "br"}),
+        ("304", {"Accept-Encoding": "br, gzip", "If-None-Match": etag}),
+    ):
+        elapsed, status_code, wire = measure(client, url, {**auth, **headers}, args.repeat)
+        print(f"  {name:9s} {status_code}  {elapsed * 1000:7.2f} ms  {wire / 1024:8.1f} KiB on the wire")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: serializing a 1000-post /posts response.
+
+Takes the same 1000 post rows (datetimes, enums, lists) from the query
+result to response bytes three ways:
+
+  default       FastAPI's response_model path (validate, convert to plain
+                dicts, ``json.dumps`` in ``JSONResponse``)
+  orjson        the same dicts rendered by ``FastJSONResponse``, the app's
+                default response class now
+  direct bytes  ``model_response``: validate, then pydantic-core writes
+                JSON bytes with no intermediate dicts (what ``/posts`` does)
+
+Usage (from the backend directory):
+    python benchmarks/bench_json_responses.py [--posts 1000] [--repeat 50]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import TypeAdapter
+
+from app.api.responses import FastJSONResponse, model_response
+from app.models.post import PostStatus, PostType
+from app.schemas.social_media import PostResponse
+
+FIELD = create_response_field(name="Response_get_posts", type_=List[PostResponse])
+ADAPTER = TypeAdapter(List[PostResponse])
+
+
+def make_rows(count):
+    now = datetime(2026, 10, 18, 12, 0, 0, 123456)
+    return [
+        SimpleNamespace(
+            id=i, user_id=1, social_account_id=1 + i % 3,
+            content=f"Post number {i}: " + "lorem ipsum dolor sit amet " * 8,
+            post_type=PostType.TEXT, link_url=None, hashtags=["summer", "sale"],
+            status=PostStatus.PUBLISHED, scheduled_at=None, published_at=now - timedelta(minutes=i),
+            platform_post_id=f"page_{i}", likes_count=i % 50, comments_count=i % 7, shares_count=i % 3,
+            views_count=i * 10, error_message=None, retry_count=0, next_retry_at=None,
+            created_at=now - timedelta(minutes=i), updated_at=now
+        )
+        for i in range(count)
+    ]
+
+
+async def default_path(rows, response_class):
+    content = await serialize_response(field=FIELD, response_content=rows, is_coroutine=True)
+    return response_class(content).body
+
+
+async def direct_bytes(rows):
+    return model_response(ADAPTER, rows).body
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_rows(args.posts)
+    paths = {
+        "default": lambda: default_path(rows, JSONResponse),
+        "orjson": lambda: default_path(rows, FastJSONResponse),
+        "direct bytes": lambda: direct_bytes(rows),
+    }
+    bodies = {name: await build() for name, build in paths.items()}
+    assert len({json.dumps(json.loads(body), sort_keys=True) for body in bodies.values()}) == 1
+
+    # Interleaved so that machine noise hits every path alike
+    timings = {name: [] for name in paths}
+    for _ in range(args.repeat):
+        for name, build in paths.items():
+            started = time.perf_counter()
+            await build()
+            timings[name].append(time.perf_counter() - started)
+
+    print(f"{args.posts} posts, median of {args.repeat} runs")
+    for name, samples in timings.items():
+        print(f"  {name:12s} {statistics.median(samples) * 1000:7.2f} ms  ({len(bodies[name]) / 1024:.0f} KiB)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,108 @@
+"""
+Benchmark: login storm throughput and its effect on other requests.
+
+Fires a burst of concurrent password verifications (the CPU part of
+``/auth/login``) two ways:
+
+  threadpool    in a 40-thread pool, like a sync endpoint in FastAPI's
+                default threadpool (the previous ``login``)
+  process pool  through ``PasswordHasher`` with ``--workers`` processes
+
+While the burst runs, a probe keeps calling a trivial sync handler through
+the same 40-thread pool, standing in for every other endpoint; its latency
+shows how much the storm slows the rest of the API.
+
+Usage (from the backend directory):
+    python benchmarks/bench_password_hashing.py [--logins 64] [--rounds 12] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.password_hasher import PasswordHasher, crypt_context
+
+PASSWORD = "correct horse battery staple"
+
+
+def light_handler():
+    return sum(range(1000))
+
+
+async def probe(threads, stop, latencies):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = time.perf_counter()
+        await loop.run_in_executor(threads, light_handler)
+        latencies.append(time.perf_counter() - started)
+        await asyncio.sleep(0.005)
+
+
+async def storm(name, verify, logins, threads):
+    stop = asyncio.Event()
+    probe_latencies = []
+    probe_task = asyncio.create_task(probe(threads, stop, probe_latencies))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*[verify() for _ in range(logins)])
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe_task
+
+    assert all(results)
+    probe_latencies.sort()
+    print(
+        f"  {name:12s} {logins / elapsed:6.1f} logins/s  "
+        f"other requests p50 {statistics.median(probe_latencies) * 1000:7.2f} ms  "
+        f"p99 {probe_latencies[int(len(probe_latencies) * 0.99) - 1] * 1000:7.2f} ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    context = crypt_context(args.rounds)
+    hashed = context.hash(PASSWORD)
+    threads = ThreadPoolExecutor(max_workers=40)
+    loop = asyncio.get_running_loop()
+
+    print(f"{args.logins} concurrent logins, bcrypt cost {args.rounds}, {os.cpu_count()} CPUs")
+
+    async def verify_in_threadpool():
+        return await loop.run_in_executor(threads, context.verify, PASSWORD, hashed)
+
+    await storm("threadpool", verify_in_threadpool, args.logins, threads)
+
+    hasher = PasswordHasher(rounds=args.rounds, workers=args.workers)
+    await hasher.verify(PASSWORD, hashed)  # start the worker processes
+
+    async def verify_in_pool():
+        valid, _ = await hasher.verify(PASSWORD, hashed)
+        return valid
+
+    await storm(f"{args.workers} processes", verify_in_pool, args.logins, threads)
+    print(f"  one core, sequential: {1 / single_verify_seconds(context, hashed):.1f} logins/s")
+
+    hasher.stop()
+    threads.shutdown()
+
+
+def single_verify_seconds(context, hashed, samples=5):
+    started = time.perf_counter()
+    for _ in range(samples):
+        context.verify(PASSWORD, hashed)
+    return (time.perf_counter() - started) / samples
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""
+Benchmark: memory and time to list a page of posts.
+
+Seeds posts with long content and realistically large auto-post configs,
+then builds one ``/posts`` page three ways, from the query through to JSON
+bytes:
+
+  full ORM   ``select(Post)``, whole objects validated into ``PostResponse``
+  columns    only the columns ``PostResponse`` reads (what ``/posts`` does now)
+  fields     a ``fields=id,status,scheduled_at`` projection, encoded as-is
+
+Reports the mean time per page and the peak memory traced while building it.
+
+Usage (from the backend directory):
+    python benchmarks/bench_post_listing.py [--page 500] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.api.projection import parse_fields, response_columns
+from app.database import Base
+from app.models import Post, SocialAccount, User
+from app.schemas.social_media import PostResponse
+
+PAGE_ADAPTER = TypeAdapter(List[PostResponse])
+
+
+def seed(engine, count):
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    user = User(email="bench@example.com", username="bench", hashed_password="x")
+    db.add(user)
+    db.flush()
+    account = SocialAccount(user_id=user.id, platform="facebook", platform_user_id="page", access_token="t")
+    db.add(account)
+    db.flush()
+    config = {"schedule": {"days": ["mon", "wed", "fri"], "times": ["09:00", "18:00"]}, "prompt": "y" * 1000}
+    db.add_all([
+        Post(
+            user_id=user.id, social_account_id=account.id, content=f"post {i} " + "z" * 500,
+            auto_post_config=config
+        )
+        for i in range(count)
+    ])
+    db.commit()
+    user_id = user.id
+    db.close()
+    return user_id
+
+
+def measure(build, repeat):
+    build()  # warm the statement cache
+    started = time.perf_counter()
+    for _ in range(repeat):
+        build()
+    elapsed = (time.perf_counter() - started) / repeat
+
+    tracemalloc.start()
+    size = len(build())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--page", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    user_id = seed(engine, args.page)
+    Session = sessionmaker(bind=engine)
+
+    def newest(query):
+        return query.where(Post.user_id == user_id).order_by(Post.created_at.desc(), Post.id.desc()).limit(args.page)
+
+    def full_orm():
+        with Session() as db:
+            posts = db.scalars(newest(select(Post))).all()
+            return PAGE_ADAPTER.dump_json(PAGE_ADAPTER.validate_python(posts, from_attributes=True))
+
+    def columns():
+        with Session() as db:
+            posts = db.execute(newest(select(*response_columns(Post, PostResponse)))).all()
+            return PAGE_ADAPTER.dump_json(PAGE_ADAPTER.validate_python(posts, from_attributes=True))
+
+    projection = parse_fields("status,scheduled_at", Post, PostResponse)
+
+    def fields():
+        with Session() as db:
+            posts = db.execute(newest(select(*projection))).all()
+            return json.dumps(jsonable_encoder([post._asdict() for post in posts])).encode()
+
+    print(f"{args.page} posts per page, mean of {args.repeat} pages")
+    for name, build in (("full ORM", full_orm), ("columns", columns), ("fields", fields)):
+        elapsed, peak, size = measure(build, args.repeat)
+        print(
+            f"  {name:9s} {elapsed * 1000:7.1f} ms/page  peak {peak / 1024 / 1024:6.2f} MiB  "
+            f"response {size / 1024:7.1f} KiB"
+        )
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
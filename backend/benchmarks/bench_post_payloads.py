@@ -0,0 +1,110 @@
+"""
+Benchmark: size of the hot posts table with payloads inline vs in post_payloads.
+
+Seeds the same published posts twice into SQLite files:
+
+  inline      the raw Graph API response in a JSON column of ``posts`` (the
+              layout before post_payloads)
+  side table  the response compressed in ``post_payloads``, as
+              ``payload_store`` writes it
+
+Reports table sizes (from SQLite's dbstat), the average posts row size, and
+the time of a query that has to visit every post row, like the dashboard
+stats do.
+
+Usage (from the backend directory):
+    python benchmarks/bench_post_payloads.py [--posts 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+
+from app.database import Base
+from app.models import Post, PostPayload, SocialAccount, User
+
+# Shaped like a Graph API publish response with the page's post echoed back
+RESPONSE = {
+    "success": True,
+    "post_id": "1234567890_987654321",
+    "raw": {
+        "id": "1234567890_987654321",
+        "message": "Our new collection is live! " * 10,
+        "from": {"name": "Example Page", "id": "1234567890"},
+        "privacy": {"value": "EVERYONE", "description": "Public"},
+        "permalink_url": "https://www.facebook.com/1234567890/posts/987654321",
+        "attachments": {"data": [{"type": "photo", "url": "https://example.com/image.jpg"}]},
+    },
+}
+
+SCAN_QUERY = text("SELECT status, COUNT(*), SUM(likes_count) FROM posts WHERE user_id = 1 GROUP BY status")
+
+
+def seed(engine, count, inline):
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        if inline:
+            conn.execute(text("ALTER TABLE posts ADD COLUMN platform_response JSON"))
+        conn.execute(User.__table__.insert(), {"id": 1, "email": "bench@example.com", "username": "bench", "hashed_password": "x"})
+        conn.execute(SocialAccount.__table__.insert(), {
+            "id": 1, "user_id": 1, "platform": "facebook", "platform_user_id": "page", "access_token": "t"
+        })
+        posts = [
+            {"id": i, "user_id": 1, "social_account_id": 1, "content": f"post {i} " + "z" * 200,
+             "status": "PUBLISHED", "platform_post_id": f"page_{i}", "likes_count": i % 50}
+            for i in range(1, count + 1)
+        ]
+        conn.execute(Post.__table__.insert(), posts)
+
+        started = time.perf_counter()
+        payloads = [{"post_id": i, "platform_response": {**RESPONSE, "post_id": f"page_{i}"}} for i in range(1, count + 1)]
+        if inline:
+            conn.execute(
+                text("UPDATE posts SET platform_response = :platform_response WHERE id = :post_id"),
+                [{**row, "platform_response": json.dumps(row["platform_response"])} for row in payloads]
+            )
+        else:
+            conn.execute(PostPayload.__table__.insert(), payloads)
+        return time.perf_counter() - started
+
+
+def table_bytes(conn, name):
+    return conn.execute(text("SELECT COALESCE(SUM(pgsize), 0) FROM dbstat WHERE name = :name"), {"name": name}).scalar()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{args.posts} published posts")
+    for name, inline in (("inline", True), ("side table", False)):
+        engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+        write_time = seed(engine, args.posts, inline)
+
+        with engine.connect() as conn:
+            posts_bytes = table_bytes(conn, "posts")
+            payload_bytes = table_bytes(conn, "post_payloads")
+            conn.execute(SCAN_QUERY).all()
+            started = time.perf_counter()
+            for _ in range(10):
+                conn.execute(SCAN_QUERY).all()
+            scan = (time.perf_counter() - started) / 10
+        engine.dispose()
+
+        print(
+            f"  {name:10s} posts {posts_bytes / 1024 / 1024:6.2f} MiB ({posts_bytes / args.posts:5.0f} B/row)  "
+            f"post_payloads {payload_bytes / 1024 / 1024:6.2f} MiB  "
+            f"payload write {write_time * 1000:6.0f} ms  full scan {scan * 1000:6.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
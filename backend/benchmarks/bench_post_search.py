@@ -0,0 +1,119 @@
+"""
+Benchmark: /posts/search latency as the posts table grows.
+
+The searching user always has the same number of posts while other users'
+posts are added around them, up to a million rows. For each table size the
+first result page of random one- and two-word searches is fetched with the
+endpoint's query (FTS5, ranked, keyset-paginated) and with a ``LIKE`` scan
+of the user's posts for comparison.
+
+Usage (from the backend directory):
+    python benchmarks/bench_post_search.py [--sizes 10000,100000,1000000] [--user-posts 2000] [--searches 200]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select
+
+from app.api.pagination import paginate_by_rank
+from app.api.projection import response_columns
+from app.database import Base
+from app.models import Post, SocialAccount, User
+from app.schemas.social_media import PostResponse
+from app.services.post_search import search_posts_query
+
+USERS = 100
+PAGE = 20
+WORDS = [f"word{n}" for n in range(5000)]
+COLUMNS = response_columns(Post, PostResponse)
+
+
+def random_content(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(10, 40)))
+
+
+def grow(engine, rng, start, count, user_posts):
+    """Add posts ``start+1 .. start+count``; the first ``user_posts`` belong to user 1."""
+    with engine.begin() as conn:
+        for offset in range(0, count, 10000):
+            rows = []
+            for post_id in range(start + offset + 1, start + min(offset + 10000, count) + 1):
+                user_id = 1 if post_id <= user_posts else rng.randint(2, USERS)
+                rows.append({
+                    "id": post_id, "user_id": user_id, "social_account_id": user_id,
+                    "content": random_content(rng), "status": "PUBLISHED"
+                })
+            conn.execute(Post.__table__.insert(), rows)
+
+
+def timed(conn, build, queries):
+    latencies = []
+    for text in queries:
+        started = time.perf_counter()
+        conn.execute(build(text)).all()
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--user-posts", type=int, default=2000)
+    parser.add_argument("--searches", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"id": n, "email": f"user{n}@example.com", "username": f"user{n}", "hashed_password": "x"} for n in range(1, USERS + 1)
+        ])
+        conn.execute(SocialAccount.__table__.insert(), [
+            {"id": n, "user_id": n, "platform": "facebook", "platform_user_id": f"page{n}", "access_token": "t"} for n in range(1, USERS + 1)
+        ])
+
+    # Common and rare words alike: pick from the vocabulary at random
+    queries = [" ".join(rng.sample(WORDS, rng.choice((1, 2)))) for _ in range(args.searches)]
+
+    def fts(text):
+        query, rank = search_posts_query(COLUMNS, "sqlite", 1, text)
+        return paginate_by_rank(query, rank, Post, None, PAGE)
+
+    def like(text):
+        query = select(*COLUMNS).where(Post.user_id == 1)
+        for word in text.split():
+            query = query.where(Post.content.like(f"%{word}%"))
+        return query.order_by(Post.created_at.desc(), Post.id.desc()).limit(PAGE + 1)
+
+    print(f"user 1 has {args.user_posts} posts, {args.searches} searches per size, first page of {PAGE}")
+    size = 0
+    for target in (int(value) for value in args.sizes.split(",")):
+        started = time.perf_counter()
+        grow(engine, rng, size, target - size, args.user_posts)
+        seeded = time.perf_counter() - started
+        size = target
+
+        with engine.connect() as conn:
+            fts_p50, fts_p99 = timed(conn, fts, queries)
+            like_p50, like_p99 = timed(conn, like, queries)
+        print(
+            f"  {size:8d} posts  FTS p50 {fts_p50 * 1000:6.2f} ms  p99 {fts_p99 * 1000:6.2f} ms  "
+            f"LIKE p50 {like_p50 * 1000:6.2f} ms  p99 {like_p99 * 1000:6.2f} ms  "
+            f"(seeded in {seeded:.0f} s)"
+        )
+
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+Benchmark: commits and latency per publish through /facebook/post.
+
+Runs the current ``publish_facebook_post`` flow (pending-post insert plus
+one result update) against the previous flow, reproduced here, which
+committed the token sync time, the post, and the publish result separately
+(and refreshed the post after inserting it). The Graph API is replaced by
+a fixed delay, so the difference is database work only. Raw platform
+responses go to the batched payload store, off the request path; they are
+kept buffered here and not counted.
+
+The database is a SQLite file with the app's pragmas; pass ``--synchronous
+FULL`` to see the effect of an fsync per commit.
+
+Usage (from the backend directory):
+    python benchmarks/bench_publish_commits.py [--publishes 300] [--concurrency 10] [--net-ms 20] [--synchronous NORMAL]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.api.social_media import publish_facebook_post
+from app.config import get_settings
+from app.database import Base, configure_sqlite
+from app.models import Post, SocialAccount, User
+from app.models.post import PostStatus, PostType
+from app.schemas.social_media import FacebookPostRequest
+from app.services.facebook_service import facebook_service
+
+
+def seed(url):
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    user = User(email="bench@example.com", username="bench", hashed_password="x")
+    db.add(user)
+    db.flush()
+    db.add(SocialAccount(
+        user_id=user.id, platform="facebook", platform_user_id="page", access_token="t", account_type="page"
+    ))
+    db.commit()
+    user_id = user.id
+    db.close()
+    engine.dispose()
+    return user_id
+
+
+async def legacy_publish(db, user_id, request):
+    """The previous /facebook/post database flow (success path)."""
+    account = await db.scalar(select(SocialAccount).where(
+        SocialAccount.user_id == user_id,
+        SocialAccount.platform == "facebook",
+        SocialAccount.platform_user_id == request.page_id
+    ))
+    await facebook_service.validate_and_refresh_token(account.access_token, account.token_expires_at)
+    account.last_sync_at = datetime.utcnow()
+    await db.commit()
+
+    post = Post(
+        user_id=user_id,
+        social_account_id=account.id,
+        content=request.message,
+        post_type=PostType.TEXT,
+        status=PostStatus.SCHEDULED
+    )
+    db.add(post)
+    await db.commit()
+    await db.refresh(post)
+
+    result = await facebook_service.create_post(page_id=request.page_id, access_token=account.access_token, message=request.message)
+    post.status = PostStatus.PUBLISHED
+    post.platform_post_id = result.get("post_id")
+    await db.commit()
+
+
+async def run(handler, Session, user_id, args, commits):
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+
+    async def one(i):
+        async with semaphore:
+            started = time.perf_counter()
+            async with Session() as db:
+                await handler(db, user_id, FacebookPostRequest(page_id="page", message=f"post {i}"))
+            latencies.append(time.perf_counter() - started)
+
+    commits[0] = 0
+    started = time.perf_counter()
+    await asyncio.gather(*[one(i) for i in range(args.publishes)])
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return elapsed, commits[0], statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--publishes", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--net-ms", type=float, default=20)
+    parser.add_argument("--synchronous", default="NORMAL")
+    args = parser.parse_args()
+
+    # Graph API stand-ins: a fixed network delay, always successful
+    async def validate_and_refresh_token(access_token, expires_at=None):
+        await asyncio.sleep(args.net_ms / 1000)
+        return {"valid": True}
+
+    async def create_post(**kwargs):
+        await asyncio.sleep(args.net_ms / 1000)
+        return {"success": True, "post_id": "page_1"}
+
+    facebook_service.validate_and_refresh_token = validate_and_refresh_token
+    facebook_service.create_post = create_post
+
+    get_settings().sqlite_synchronous = args.synchronous
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    user_id = seed(f"sqlite:///{path}")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    configure_sqlite(engine.sync_engine, f"sqlite:///{path}")
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+
+    commits = [0]
+
+    @event.listens_for(engine.sync_engine, "commit")
+    def _count_commit(connection):
+        commits[0] += 1
+
+    print(
+        f"{args.publishes} publishes, concurrency {args.concurrency}, "
+        f"{args.net_ms:g} ms per Graph call, synchronous={args.synchronous}"
+    )
+    for name, handler in (("previous flow", legacy_publish), ("unit of work", publish_facebook_post)):
+        elapsed, total_commits, p50, p99 = await run(handler, Session, user_id, args, commits)
+        print(
+            f"  {name:14s} {total_commits / args.publishes:4.1f} commits/publish  "
+            f"{args.publishes / elapsed:7.1f} publishes/s  p50 {p50 * 1000:7.1f} ms  p99 {p99 * 1000:7.1f} ms"
+        )
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+"""
+Benchmark: waiting on the platform vs accepting publishes as jobs.
+
+Serves the real app (in-process, over ASGI) from a seeded SQLite file and
+sends ``--publishes`` Facebook posts from ``--clients`` concurrent clients:
+
+  sync   the request holds its connection until the Graph API has answered
+  202    ``Prefer: respond-async``: the request is validated, stored as a
+         publish job and answered; ``--workers`` publish job workers carry
+         the jobs out (reports the time until the last job finished too)
+
+The Graph API is replaced by a fixed delay per call (token check plus
+publish), so request latency is what the client sees of it.
+
+Usage (from the backend directory):
+    python benchmarks/bench_publish_jobs.py [--publishes 200] [--clients 50] [--workers 4] [--net-ms 300]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The app connects on import, so point it at a scratch database first
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+os.environ.setdefault("DEBUG", "false")
+
+import httpx
+
+from app.api import social_media
+from app.api.auth import create_access_token
+from app.database import Base, SessionLocal, engine
+from app.main import app
+from app.models import SocialAccount, User
+from app.services.facebook_service import facebook_service
+from app.services.publish_job_queue import publish_job_queue
+from app.services.push_hub import push_hub
+
+
+def seed():
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    user = User(email="bench@example.com", username="bench", full_name="Bench", hashed_password="x")
+    db.add(user)
+    db.flush()
+    db.add(SocialAccount(user_id=user.id, platform="facebook", platform_user_id="page", access_token="t"))
+    db.commit()
+    db.close()
+
+
+async def run(client, headers, args):
+    semaphore = asyncio.Semaphore(args.clients)
+    latencies = []
+
+    async def one(i):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/social/facebook/post", json={"page_id": "page", "message": f"post {i}"}, headers=headers
+            )
+            latencies.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    started = time.perf_counter()
+    await asyncio.gather(*[one(i) for i in range(args.publishes)])
+    answered = time.perf_counter() - started
+    while publish_job_queue.completed + publish_job_queue.failed < publish_job_queue.created:
+        await asyncio.sleep(0.01)
+    finished = time.perf_counter() - started
+    latencies.sort()
+    return answered, finished, statistics.median(latencies), latencies[int(len(latencies) * 0.99) - 1]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--publishes", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--net-ms", type=float, default=300)
+    args = parser.parse_args()
+
+    # Graph API stand-ins: a fixed network delay, always successful
+    async def validate_and_refresh_token(access_token, expires_at=None):
+        await asyncio.sleep(args.net_ms / 1000)
+        return {"valid": True}
+
+    async def create_post(**kwargs):
+        await asyncio.sleep(args.net_ms / 1000)
+        return {"success": True, "post_id": "page_1"}
+
+    facebook_service.validate_and_refresh_token = validate_and_refresh_token
+    facebook_service.create_post = create_post
+
+    seed()
+    publish_job_queue.worker_count = args.workers
+    await push_hub.start()
+    await publish_job_queue.start({"facebook": social_media.run_facebook_job})
+    auth = {"Authorization": f"Bearer {create_access_token({'sub': 'bench@example.com'})}"}
+
+    print(
+        f"{args.publishes} publishes from {args.clients} clients, "
+        f"{args.net_ms:g} ms per Graph call, {args.workers} job workers"
+    )
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for name, headers in (("sync", auth), ("202", {**auth, "Prefer": "respond-async"})):
+            answered, finished, p50, p99 = await run(client, headers, args)
+            print(
+                f"  {name:5s} answered in {answered:6.2f} s  p50 {p50 * 1000:7.1f} ms  p99 {p99 * 1000:7.1f} ms  "
+                f"all published after {finished:6.2f} s"
+            )
+
+    await publish_job_queue.stop()
+    await push_hub.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,149 @@
+"""
+Benchmark: learning about post status changes by polling vs by push.
+
+Seeds a SQLite file with users and posts, then for ``--changes`` status
+updates committed from a worker thread (like a publish or the retry loop):
+
+  polling  the database work of the dashboards watching: every connected
+           dashboard re-reads a page of its posts every ``--interval``
+           seconds, changed or not (queries per minute)
+  push     the ``push_hub`` path (in-process broker): each commit publishes
+           one event, fanned out to the user's open connections; reports
+           commit-to-delivery latency
+
+Usage (from the backend directory):
+    python benchmarks/bench_push_updates.py [--users 200] [--connections 2] [--changes 2000] [--interval 10]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from app.api.projection import response_columns
+from app.database import Base
+from app.models import Post, SocialAccount, User
+from app.models.post import PostStatus
+from app.schemas.social_media import PostResponse
+from app.services.push_hub import push_hub
+
+POSTS_PER_USER = 50
+
+
+def seed(engine, users):
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        for n in range(users):
+            user = User(email=f"user{n}@example.com", username=f"user{n}", hashed_password="x")
+            db.add(user)
+            db.flush()
+            account = SocialAccount(user_id=user.id, platform="facebook", platform_user_id=f"page{n}", access_token="t")
+            db.add(account)
+            db.flush()
+            db.add_all([
+                Post(user_id=user.id, social_account_id=account.id, content=f"post {i}", status=PostStatus.SCHEDULED)
+                for i in range(POSTS_PER_USER)
+            ])
+        db.commit()
+        return [(post.user_id, post.id) for post in db.scalars(select(Post))]
+
+
+def poll_cost(Session, users, samples=200):
+    """Seconds of database work for one dashboard refresh of ``/posts``."""
+    columns = response_columns(Post, PostResponse)
+    rng = random.Random(1)
+    started = time.perf_counter()
+    for _ in range(samples):
+        with Session() as db:
+            db.execute(
+                select(*columns).where(Post.user_id == rng.randint(1, users))
+                .order_by(Post.created_at.desc(), Post.id.desc()).limit(POSTS_PER_USER)
+            ).all()
+    return (time.perf_counter() - started) / samples
+
+
+async def push(Session, posts, hub, users, connections, changes):
+    latencies = []
+    committed_at = {}
+
+    async def connection(user_id, received):
+        with hub.subscription(user_id) as events:
+            received.set()
+            while (event := await events.get()) is not None:
+                if event["post_id"] in committed_at:
+                    latencies.append(time.perf_counter() - committed_at[event["post_id"]])
+
+    ready = []
+    tasks = []
+    for user_id in range(1, users + 1):
+        for _ in range(connections):
+            received = asyncio.Event()
+            ready.append(received)
+            tasks.append(asyncio.create_task(connection(user_id, received)))
+    await asyncio.gather(*(received.wait() for received in ready))
+
+    def publish_changes():
+        rng = random.Random(2)
+        with Session() as db:
+            for user_id, post_id in rng.sample(posts, changes):
+                post = db.get(Post, post_id)
+                post.status = PostStatus.PUBLISHED
+                committed_at[post_id] = time.perf_counter()
+                db.commit()
+
+    started = time.perf_counter()
+    worker = threading.Thread(target=publish_changes)
+    worker.start()
+    while worker.is_alive() or len(latencies) < changes * connections:
+        await asyncio.sleep(0.01)
+    elapsed = time.perf_counter() - started
+    await hub.stop()
+    await asyncio.gather(*tasks)
+    return elapsed, latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--connections", type=int, default=2)
+    parser.add_argument("--changes", type=int, default=2000)
+    parser.add_argument("--interval", type=float, default=10)
+    args = parser.parse_args()
+
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    posts = seed(engine, args.users)
+    Session = sessionmaker(bind=engine)
+    dashboards = args.users * args.connections
+
+    per_poll = poll_cost(Session, args.users)
+    polls_per_minute = dashboards * 60 / args.interval
+    print(f"{args.users} users x {args.connections} open dashboards")
+    print(
+        f"  polling  every {args.interval:g} s: {polls_per_minute:7.0f} queries/min, "
+        f"{per_poll * 1000:.2f} ms each = {polls_per_minute * per_poll:.1f} s of database time per minute"
+    )
+
+    await push_hub.start()
+    elapsed, latencies = await push(Session, posts, push_hub, args.users, args.connections, args.changes)
+    latencies.sort()
+    print(
+        f"  push     {args.changes} changes in {elapsed:.2f} s, {len(latencies)} deliveries, "
+        f"commit to delivery p50 {statistics.median(latencies) * 1000:.2f} ms "
+        f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.2f} ms, no queries"
+    )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
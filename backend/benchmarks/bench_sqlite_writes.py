@@ -0,0 +1,151 @@
+"""
+Benchmark: concurrent SQLite writes, default engine vs the tuned SQLite mode.
+
+Simulates the API and the background services sharing one SQLite file:
+API threads read a post and update it in one session (like the post
+endpoints), while background threads record processed events one small
+commit at a time (like the webhook deduplicator). Three setups are compared:
+
+  default  plain ``create_engine`` (rollback journal, full fsync, no busy wait)
+  tuned    the pragmas of ``configure_sqlite`` (WAL, synchronous NORMAL, ...)
+  writer   tuned, with background writes going through ``SerializedWriter``
+           on its own BEGIN IMMEDIATE connection, coalesced into fewer commits
+
+Reports throughput, "database is locked" failures and API latency.
+
+Usage (from the backend directory):
+    python benchmarks/bench_sqlite_writes.py [--api-threads 8] [--background-threads 4] [--ops 200]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, configure_sqlite
+from app.models import Post, ProcessedEvent, SocialAccount, User
+from app.services.db_writer import SerializedWriter
+
+POSTS = 200
+
+
+def seed(engine):
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    user = User(email="bench@example.com", username="bench", hashed_password="x")
+    db.add(user)
+    db.flush()
+    account = SocialAccount(user_id=user.id, platform="facebook", platform_user_id="page", access_token="t")
+    db.add(account)
+    db.flush()
+    db.add_all([Post(user_id=user.id, social_account_id=account.id, content=f"post {i}") for i in range(POSTS)])
+    db.commit()
+    db.close()
+
+
+def run(setup, args):
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    engine = create_engine(url, connect_args={"check_same_thread": False}, pool_size=args.api_threads + args.background_threads)
+    if setup != "default":
+        configure_sqlite(engine, url)
+    seed(engine)
+
+    Session = sessionmaker(bind=engine)
+    writer = None
+    if setup == "writer":
+        write_engine = create_engine(url, connect_args={"check_same_thread": False}, pool_size=1, max_overflow=0)
+        configure_sqlite(write_engine, url, begin_immediate=True)
+        writer = SerializedWriter(write_engine, max_batch=200, max_delay=0)
+    table = ProcessedEvent.__table__
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def api_worker():
+        for _ in range(args.ops):
+            started = time.perf_counter()
+            db = Session()
+            try:
+                post = db.get(Post, random.randint(1, POSTS))
+                post.likes_count = (post.likes_count or 0) + 1
+                db.commit()
+            except OperationalError:
+                db.rollback()
+                with lock:
+                    errors[0] += 1
+            finally:
+                db.close()
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    def background_worker(n):
+        for i in range(args.ops):
+            stmt = table.insert().values(platform="facebook", event_type="comment", event_key=f"{n}-{i}")
+            try:
+                if writer:
+                    writer.execute(lambda conn: conn.execute(stmt))
+                else:
+                    with engine.begin() as conn:
+                        conn.execute(stmt)
+            except OperationalError:
+                with lock:
+                    errors[0] += 1
+
+    threads = [threading.Thread(target=api_worker) for _ in range(args.api_threads)]
+    threads += [threading.Thread(target=background_worker, args=(n,)) for n in range(args.background_threads)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    commits = writer.commits if writer else args.background_threads * args.ops
+    if writer:
+        writer.stop()
+        writer.engine.dispose()
+    engine.dispose()
+
+    latencies.sort()
+    total = (args.api_threads + args.background_threads) * args.ops
+    return {
+        "ops_per_second": total / elapsed,
+        "errors": errors[0],
+        "background_commits": commits,
+        "p50": statistics.median(latencies),
+        "p99": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--api-threads", type=int, default=8)
+    parser.add_argument("--background-threads", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{args.api_threads} API threads + {args.background_threads} background threads, "
+        f"{args.ops} writes each"
+    )
+    for setup in ("default", "tuned", "writer"):
+        result = run(setup, args)
+        print(
+            f"  {setup:8s} {result['ops_per_second']:8.1f} ops/s  "
+            f"locked {result['errors']:4d}  background commits {result['background_commits']:5d}  "
+            f"API p50 {result['p50'] * 1000:7.1f} ms  p99 {result['p99'] * 1000:7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()